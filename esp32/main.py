@@ -19,6 +19,9 @@ import framebuf
 import network
 import requests
 
+# the most scores the server accepts in one /scores request, see MAX_BULK_ITEMS
+MAX_SCORES = 100
+
 fonts = {
     '8x8': vga2_8x8,
     '8x16': vga2_8x16,
@@ -303,6 +306,7 @@ class GamesMenu(Menu):
         }
         
         self.events = []
+        self.etag = None
 
     def handle_selection(self, i, item):
         if item.name == 'Create Event':
@@ -335,16 +339,22 @@ class GamesMenu(Menu):
             if self.loading:
                 try:
                     t = time.time()
-                    r = requests.get(f'http://score-keeper.duckdns.org:8080/api/event?sort=datetime__period__created_at&pp=10&p=1&resolves=home_team%2Caway_team&status={self.status}', headers=self.headers)
-                    data = r.json()
+                    # the server answers 304 without a body while the list is unchanged
+                    headers = dict(self.headers)
+                    if self.etag:
+                        headers['If-None-Match'] = self.etag
+                    r = requests.get(f'http://score-keeper.duckdns.org:8080/api/event?sort=datetime__period__created_at&pp=10&p=1&resolves=home_team%2Caway_team&fields=id%2Cperiod%2Cstatus%2Cverbose_status%2Caway_score%2Chome_score%2Caway_team_name%2Chome_team_name&status={self.status}', headers=headers)
+                    if r.status_code != 304:
+                        data = r.json()
+                        self.etag = r.headers.get('ETag') or r.headers.get('etag')
+                        
+                        self.events = data['events']
+                        
+                        for event in self.events:
+                            event['name'] = f"{event['away_team_name']} vs {event['home_team_name']}"
                     r.close()
                     
                     print('!! TT', time.time() - t)
-                    
-                    self.events = data['events']
-                    
-                    for event in self.events:
-                        event['name'] = f"{event['away_team_name']} vs {event['home_team_name']}"
 
                     self.loading = False
                     self.pending_changes = True
@@ -418,21 +428,35 @@ class ScoreBoard(Screen):
                 self.pending_changes = True
 
     def loop(self):
-        if self.pending_data:
-            data = self.pending_data
-            self.pending_data = []
-            
-            for t, d in data:
-                print('!!', t,d)
-                r = None
+        # send the queued changes in order, score presses in batches of at most
+        # MAX_SCORES, and drop them only once the server accepted them, so
+        # presses made while offline are retried until they get through
+        while self.pending_data:
+            t, d = self.pending_data[0]
+            count = 1
+            if t == 'score':
+                while (count < MAX_SCORES and count < len(self.pending_data)
+                       and self.pending_data[count][0] == 'score'):
+                    count += 1
+
+            print('!!', t, count)
+            try:
                 if t == 'score':
-                    r = requests.post(f"http://score-keeper.duckdns.org:8080/api/event/{self.event['id']}/score", json=d, headers=self.headers)
-                elif t == 'update':
+                    scores = [x[1] for x in self.pending_data[:count]]
+                    r = requests.post(f"http://score-keeper.duckdns.org:8080/api/event/{self.event['id']}/scores", json={'scores': scores}, headers=self.headers)
+                else:
                     r = requests.patch(f"http://score-keeper.duckdns.org:8080/api/event/{self.event['id']}", json=d, headers=self.headers)
+            except OSError as e:
+                print('ERROR:', e)
+                return
 
-                if r:
-                    d = r.json()
-                    r.close()
+            ok = 200 <= r.status_code < 300
+            r.close()
+            if not ok:
+                print('ERROR:', r.status_code)
+                return
+
+            self.pending_data = self.pending_data[count:]
     
     def handle_click(self, x, y):
         if y > 170:
@@ -0,0 +1,23 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX "idx_event_datetime_period" ON "event" ("datetime", "period", "created_at");
+        CREATE INDEX "idx_event_status_datetime" ON "event" ("status", "datetime", "period", "created_at");
+        CREATE INDEX "idx_event_created_at_id" ON "event" ("created_at", "id");
+        CREATE INDEX "idx_eventscore_event_created" ON "eventscore" ("event_id", "created_at");
+        CREATE INDEX "idx_post_published" ON "post" ("published_at", "created_at", "id") WHERE status = 'published';
+        CREATE INDEX "idx_post_author_published" ON "post" ("author_id", "published_at", "created_at", "id");
+        CREATE INDEX "idx_post_created_at_id" ON "post" ("created_at", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX "idx_post_created_at_id";
+        DROP INDEX "idx_post_author_published";
+        DROP INDEX "idx_post_published";
+        DROP INDEX "idx_eventscore_event_created";
+        DROP INDEX "idx_event_created_at_id";
+        DROP INDEX "idx_event_status_datetime";
+        DROP INDEX "idx_event_datetime_period";"""
@@ -0,0 +1,23 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "standing" (
+    "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "modified_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "season" INT NOT NULL,
+    "wins" INT NOT NULL  DEFAULT 0,
+    "losses" INT NOT NULL  DEFAULT 0,
+    "ties" INT NOT NULL  DEFAULT 0,
+    "points_for" INT NOT NULL  DEFAULT 0,
+    "points_against" INT NOT NULL  DEFAULT 0,
+    "team_id" INT NOT NULL REFERENCES "team" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_standing_season_66ff4a" UNIQUE ("season", "team_id")
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "standing";"""
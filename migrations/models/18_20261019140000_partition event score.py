@@ -0,0 +1,82 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "eventscore" RENAME TO "eventscore_unpartitioned";
+        ALTER TABLE "eventscore_unpartitioned" RENAME CONSTRAINT "eventscore_pkey" TO "eventscore_unpartitioned_pkey";
+        ALTER INDEX "idx_eventscore_event_created" RENAME TO "idx_eventscore_unpartitioned_event_created";
+        CREATE TABLE "eventscore" (
+    "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "modified_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "id" INT NOT NULL  DEFAULT nextval('eventscore_id_seq'),
+    "away_delta" INT NOT NULL  DEFAULT 0,
+    "home_delta" INT NOT NULL  DEFAULT 0,
+    "away_score" INT NOT NULL,
+    "home_score" INT NOT NULL,
+    "comment" TEXT,
+    "event_id" INT NOT NULL REFERENCES "event" ("id") ON DELETE CASCADE,
+    PRIMARY KEY ("id", "created_at")
+) PARTITION BY RANGE ("created_at");
+        CREATE INDEX "idx_eventscore_event_created" ON "eventscore" ("event_id", "created_at");
+        DO $$
+        DECLARE
+            month TIMESTAMP;
+        BEGIN
+            FOR month IN
+                SELECT generate_series(
+                    date_trunc('month', COALESCE(
+                        (SELECT min(created_at) FROM "eventscore_unpartitioned"), now()
+                    ) AT TIME ZONE 'UTC'),
+                    date_trunc('month', now() AT TIME ZONE 'UTC') + INTERVAL '3 months',
+                    INTERVAL '1 month'
+                )
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF "eventscore" FOR VALUES FROM (%L) TO (%L)',
+                    'eventscore_p' || to_char(month, 'YYYYMM'),
+                    month AT TIME ZONE 'UTC',
+                    (month + INTERVAL '1 month') AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END
+        $$;
+        INSERT INTO "eventscore" (
+            "created_at", "modified_at", "id", "away_delta", "home_delta",
+            "away_score", "home_score", "comment", "event_id"
+        )
+        SELECT
+            "created_at", "modified_at", "id", "away_delta", "home_delta",
+            "away_score", "home_score", "comment", "event_id"
+        FROM "eventscore_unpartitioned";
+        ALTER SEQUENCE "eventscore_id_seq" OWNED BY "eventscore"."id";
+        DROP TABLE "eventscore_unpartitioned";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "eventscore" RENAME TO "eventscore_partitioned";
+        ALTER TABLE "eventscore_partitioned" RENAME CONSTRAINT "eventscore_pkey" TO "eventscore_partitioned_pkey";
+        ALTER INDEX "idx_eventscore_event_created" RENAME TO "idx_eventscore_partitioned_event_created";
+        CREATE TABLE "eventscore" (
+    "created_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "modified_at" TIMESTAMPTZ NOT NULL  DEFAULT CURRENT_TIMESTAMP,
+    "id" INT NOT NULL  DEFAULT nextval('eventscore_id_seq') PRIMARY KEY,
+    "away_delta" INT NOT NULL  DEFAULT 0,
+    "home_delta" INT NOT NULL  DEFAULT 0,
+    "away_score" INT NOT NULL,
+    "home_score" INT NOT NULL,
+    "comment" TEXT,
+    "event_id" INT NOT NULL REFERENCES "event" ("id") ON DELETE CASCADE
+);
+        CREATE INDEX "idx_eventscore_event_created" ON "eventscore" ("event_id", "created_at");
+        INSERT INTO "eventscore" (
+            "created_at", "modified_at", "id", "away_delta", "home_delta",
+            "away_score", "home_score", "comment", "event_id"
+        )
+        SELECT
+            "created_at", "modified_at", "id", "away_delta", "home_delta",
+            "away_score", "home_score", "comment", "event_id"
+        FROM "eventscore_partitioned";
+        ALTER SEQUENCE "eventscore_id_seq" OWNED BY "eventscore"."id";
+        DROP TABLE "eventscore_partitioned";"""
@@ -1,3 +1,3 @@
 __all__ = ["post", "user"]
 
-from . import event, post, team, token, user
+from . import event, post, standing, team, token, user
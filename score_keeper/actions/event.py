@@ -1,16 +1,222 @@
-import json
-from typing import Union
+import datetime as dt
+from typing import List, Optional, Tuple, Union
+
+from quart import current_app
+from tortoise.expressions import Q
+from tortoise.functions import Count, Max
+from tortoise.transactions import in_transaction
 
 from score_keeper import enums, models, schemas
-from score_keeper.lib.error import ActionError, ForbiddenActionError
+from score_keeper.lib.conditional import Version
+from score_keeper.lib.db_router import read_replica, use_read_connection
+from score_keeper.lib.error import ActionError, BulkActionError, ForbiddenActionError
 from score_keeper.lib.message_manager import MessageManager
+from score_keeper.lib.page_cache import page_namespace
+from score_keeper.lib.serialization import loads
+from score_keeper.lib.single_flight import SingleFlight
+
+from . import standing
+from .helpers import (
+    bulk_update,
+    conditional_set,
+    handle_orm_errors,
+    only_fields,
+    reserve_ids,
+)
+
+# Apply a score in one round trip: lock the row, add the deltas (or set absolute
+# scores when no delta is given, see `score_args`) and record the change in
+# eventscore.  Scores are
+# computed from the row as it is after any concurrent update commits, so parallel
+# scorers never overwrite each other.
+SCORE_SQL = """
+WITH old AS (
+    SELECT id, away_score, home_score FROM "event" WHERE id = $1 FOR UPDATE
+), updated AS (
+    UPDATE "event" e
+    SET
+        away_score = COALESCE($2, e.away_score + $3),
+        home_score = COALESCE($4, e.home_score + $5),
+        modified_at = $6,
+        version = e.version + 1
+    FROM old
+    WHERE e.id = old.id AND ($7::int IS NULL OR e.created_by_id = $7)
+    RETURNING
+        e.*,
+        e.away_score - old.away_score AS away_delta,
+        e.home_score - old.home_score AS home_delta
+), score AS (
+    INSERT INTO "eventscore" (
+        event_id, away_delta, home_delta, away_score, home_score, comment,
+        created_at, modified_at
+    )
+    SELECT id, away_delta, home_delta, away_score, home_score, $8, $6, $6
+    FROM updated
+)
+SELECT * FROM updated
+"""
+
+# The last score of every $2 seconds of an event after the cursor ($3, $4), with
+# the deltas of the scores it stands for summed so they still add up to it.  $6
+# is when the event was created, so partitions from before it are skipped.
+SCORES_SAMPLE_SQL = """
+SELECT
+    id, created_at, modified_at, away_score, home_score, comment, event_id,
+    bucket_away_delta AS away_delta, bucket_home_delta AS home_delta
+FROM (
+    SELECT
+        *,
+        SUM(away_delta) OVER w AS bucket_away_delta,
+        SUM(home_delta) OVER w AS bucket_home_delta,
+        ROW_NUMBER() OVER (w ORDER BY created_at DESC, id DESC) AS n
+    FROM (
+        SELECT *, FLOOR(EXTRACT(EPOCH FROM created_at) / $2) AS bucket
+        FROM "eventscore"
+        WHERE event_id = $1
+            AND created_at >= $6
+            AND ($3::timestamptz IS NULL OR (created_at, id) > ($3, $4))
+    ) scores
+    WINDOW w AS (PARTITION BY bucket)
+) buckets
+WHERE n = 1
+ORDER BY created_at, id
+LIMIT $5
+"""
+
+
+def score_args(
+    delta: int, absolute: int, other_delta: int = schemas.NOTSET
+) -> Tuple[int, Optional[int]]:
+    """
+    The delta and absolute score to apply to one side of a score.  Clients send
+    both absolute scores along with a delta, from their possibly stale copy of the
+    event, so a delta on either side wins over both of them, and a side without
+    one is left as it is.  Absolute scores only apply to scores without deltas.
+    """
+    if delta != schemas.NOTSET:
+        return delta, None
+    if other_delta != schemas.NOTSET:
+        return 0, None
+    if absolute != schemas.NOTSET:
+        return 0, absolute
+    return 0, None
+
+
+# the model fields written when a field of EventPatch is set
+PATCH_FIELDS = {
+    "period": ("period",),
+    "season": ("season",),
+    "datetime": ("datetime",),
+    "status": ("_status", "status_as_of"),
+    "away_team_id": ("away_team_id",),
+    "away_score": ("away_score",),
+    "home_team_id": ("home_team_id",),
+    "home_score": ("home_score",),
+}
+
+
+def apply_patch(event: models.Event, data: schemas.EventPatch) -> None:
+    conditional_set(event, "season", data.season)
+    conditional_set(event, "period", data.period)
+    conditional_set(event, "datetime", data.datetime)
+    conditional_set(event, "away_team_id", data.away_team_id)
+    conditional_set(event, "away_score", data.away_score)
+    conditional_set(event, "home_team_id", data.home_team_id)
+    conditional_set(event, "home_score", data.home_score)
 
-from .helpers import conditional_set, handle_orm_errors
+    if data.status != schemas.NOTSET:
+        event.update_status(data.status)
+
+
+async def team_errors(
+    items: List[Union[schemas.EventCreate, schemas.EventPatch]]
+) -> List[ActionError]:
+    """
+    Check the teams referenced by a list of bulk items with one query, since a
+    foreign key violation would otherwise fail the whole batch.
+    """
+    names = ("away_team_id", "home_team_id")
+    team_ids = {getattr(x, name) for x in items for name in names} - {
+        None,
+        schemas.NOTSET,
+    }
+    found = set(
+        await models.Team.filter(id__in=team_ids).values_list("id", flat=True)
+        if team_ids
+        else []
+    )
+
+    return [
+        ActionError("Team Not Found", loc=f"events.{i}.{name}", type="does_not_exist")
+        for i, x in enumerate(items)
+        for name in names
+        if getattr(x, name) in team_ids and getattr(x, name) not in found
+    ]
+
+
+# the resolves of the events kept in lib.event_cache
+CACHED_RESOLVES = {schemas.EventResolve.AWAY_TEAM, schemas.EventResolve.HOME_TEAM}
+
+# concurrent identical reads share one fetch of the rows, the responses are still
+# built and checked for permission per caller
+get_flight = SingleFlight("event.get")
+query_flight = SingleFlight("event.query")
+
+
+async def send_update(user: schemas.User, event: models.Event) -> schemas.Event:
+    """
+    Broadcast a committed change to an event, with its teams fetched, and write it
+    through to the event cache in the same Redis round trip.  Only live events are
+    cached.  The cached pages showing the event are invalidated.
+    """
+    schema_event = schemas.Event.from_db(event)
+    data = schemas.Event.model_dump_json(schema_event)
+
+    mm = MessageManager(user, f"event-{event.id}")
+    async with current_app.redis.pipeline(transaction=True) as pipe:
+        current_app.event_cache.set(
+            pipe,
+            event.id,
+            event.version,
+            data if event.status == enums.EventStatus.IN_PROGRESS else None,
+        )
+        pipe.publish(
+            mm.channel_id,
+            mm.format_message(
+                "update", f"Event {event.id} updated", data=loads(data)
+            ),
+        )
+        await pipe.execute()
+
+    await current_app.cache.invalidate(page_namespace("event", event.id))
+    await current_app.cache.invalidate(page_namespace("event"))
+
+    return schema_event
+
+
+async def get_cached(
+    id: int, options: Optional[schemas.EventGetOptions]
+) -> Optional[schemas.Event]:
+    resolves = set((options.resolves if options else None) or [])
+    if not resolves <= CACHED_RESOLVES:
+        return None
+
+    cached = await current_app.event_cache.get(id)
+    if cached is None:
+        return None
+
+    event = schemas.Event.model_validate_json(cached[1])
+    for name in CACHED_RESOLVES - resolves:
+        setattr(event, name, None)
+    if options and options.fields:
+        event._fields = set(options.fields)
+
+    return event
 
 
 def has_permission(
     user: schemas.User,
-    obj: Union[schemas.Event, None],
+    obj: Union[models.Event, schemas.Event, None],
     permission: enums.Permission,
 ) -> bool:
     if permission == enums.Permission.CREATE:
@@ -40,33 +246,226 @@ def has_permission(
 async def get(
     user: schemas.User, id: int = None, options: schemas.EventGetOptions = None
 ) -> schemas.Event:
-    event = None
-    if id:
-        event = await models.Event.get(id=id)
-    else:
+    if not id:
         raise ActionError("missing lookup key", type="not_found")
 
-    if not has_permission(
-        user, schemas.Event.model_validate(event), enums.Permission.READ
+    # live events are read from the cache without touching the database
+    schema_event = await get_cached(id, options)
+    if schema_event is not None:
+        if not has_permission(user, schema_event, enums.Permission.READ):
+            raise ForbiddenActionError()
+        return schema_event
+
+    key = f"{id} {options.model_dump_json()}" if options else str(id)
+    event = await get_flight.do(key, get_from_db, id, options)
+
+    if not has_permission(user, event, enums.Permission.READ):
+        raise ForbiddenActionError()
+
+    return schemas.Event.from_db(event, options.fields if options else None)
+
+
+@read_replica
+async def get_from_db(
+    id: int, options: Optional[schemas.EventGetOptions]
+) -> models.Event:
+    fields = options.fields if options else None
+
+    qs = only_fields(
+        models.Event.all(), schemas.Event, fields, options and options.resolves
+    )
+    event = await qs.get(id=id)
+
+    if options and options.resolves:
+        resolves = [x for x in options.resolves if x != schemas.EventResolve.SCORES]
+        if resolves:
+            await event.fetch_related(*resolves)
+
+        if schemas.EventResolve.SCORES in options.resolves:
+            # bounded by created_at so partitions from before the event are skipped,
+            # and set the way fetch_related does, as tortoise has no public way to
+            # pylint: disable-next=protected-access
+            event.scores._set_result_for_query(
+                await models.EventScore.filter(
+                    event_id=event.id, created_at__gte=event.created_at
+                ).order_by("created_at", "id")
+            )
+
+    # a read of a live event in the shape the cache keeps fills it, unless a newer
+    # version was written through meanwhile.  Not from the replica: a team rename
+    # deletes the cached event without changing its version, so a lagging read
+    # would cache the old names again
+    if (
+        not use_read_connection.get()
+        and event.status == enums.EventStatus.IN_PROGRESS
+        and not fields
+        and set((options.resolves if options else None) or []) == CACHED_RESOLVES
     ):
+        await current_app.event_cache.set(
+            current_app.redis,
+            event.id,
+            event.version,
+            schemas.Event.model_dump_json(schemas.Event.from_db(event)),
+        )
+
+    return event
+
+
+async def teams_modified_at(
+    resolves: Optional[List[str]], team_ids: Optional[List[int]] = None
+) -> Optional[dt.datetime]:
+    """
+    When teams are resolved, the last change to them (or to `team_ids`), since
+    renaming a team changes the events it plays in without touching them.
+    """
+    if not {schemas.EventResolve.AWAY_TEAM, schemas.EventResolve.HOME_TEAM} & set(
+        resolves or []
+    ):
+        return None
+
+    qs = models.Team.all() if team_ids is None else models.Team.filter(id__in=team_ids)
+    rows = await qs.annotate(last=Max("modified_at")).values("last")
+    return rows[0]["last"] if rows else None
+
+
+@handle_orm_errors
+async def version(
+    user: schemas.User, id: int, options: schemas.EventGetOptions = None
+) -> Version:
+    """
+    The version of `get` for conditional requests, read without loading the event.
+    """
+    resolves = (options.resolves if options else None) or []
+    # users have no modified_at to tell when they change
+    if schemas.EventResolve.CREATED_BY in resolves:
+        return None
+
+    event = await get_cached(id, options)
+    if event is not None:
+        if not has_permission(user, event, enums.Permission.READ):
+            raise ForbiddenActionError()
+
+        teams_at = max(
+            (x.modified_at for x in (event.away_team, event.home_team) if x),
+            default=None,
+        )
+        return (
+            [event.modified_at, teams_at],
+            max(x for x in (event.modified_at, teams_at) if x),
+        )
+
+    return await version_from_db(user, id, resolves)
+
+
+@read_replica
+async def version_from_db(user: schemas.User, id: int, resolves: List[str]) -> Version:
+    event = await models.Event.get(id=id).only(
+        "id", "created_by_id", "modified_at", "away_team_id", "home_team_id"
+    )
+
+    if not has_permission(user, event, enums.Permission.READ):
         raise ForbiddenActionError()
 
-    if options:
-        if options.resolves:
-            await event.fetch_related(*options.resolves)
+    team_ids = [x for x in (event.away_team_id, event.home_team_id) if x]
+    teams_at = await teams_modified_at(resolves, team_ids) if team_ids else None
+
+    return (
+        [event.modified_at, teams_at],
+        max(x for x in (event.modified_at, teams_at) if x),
+    )
+
 
-    return schemas.Event.model_validate(event)
+@handle_orm_errors
+@read_replica
+async def query_version(_: schemas.User, q: schemas.EventQuery) -> Version:
+    """
+    The version of a `query` page for conditional requests.  Any change to an event
+    matching the filters either bumps the latest modified_at or the count.
+    """
+    if schemas.EventResolve.CREATED_BY in (q.resolves or []):
+        return None
+
+    rows = (
+        await q.filter(models.Event.all())
+        .annotate(count=Count("id"), last=Max("modified_at"))
+        .values("count", "last")
+    )
+    count, last = (rows[0]["count"], rows[0]["last"]) if rows else (0, None)
+    teams_at = await teams_modified_at(q.resolves)
+
+    return (
+        [count, last, teams_at],
+        max((x for x in (last, teams_at) if x), default=None),
+    )
 
 
 @handle_orm_errors
 async def query(_: schemas.User, q: schemas.EventQuery) -> schemas.EventResultSet:
+    pagination, events = await query_flight.do(q.model_dump_json(), query_from_db, q)
+
+    return schemas.EventResultSet(
+        pagination=pagination,
+        events=[schemas.Event.from_db(event, q.fields) for event in events],
+    )
+
+
+@read_replica
+async def query_from_db(
+    q: schemas.EventQuery,
+) -> Tuple[schemas.Pagination, List[models.Event]]:
     qs = models.Event.all()
 
+    qs = only_fields(qs, schemas.Event, q.fields, q.resolves)
+
     queryset, pagination = await q.apply(qs)
 
-    return schemas.EventResultSet(
-        pagination=pagination,
-        events=[schemas.Event.model_validate(event) for event in await queryset],
+    return pagination, await queryset
+
+
+@handle_orm_errors
+@read_replica
+async def scores(
+    user: schemas.User, id: int, q: schemas.EventScoreQueryString
+) -> schemas.EventScoreResultSet:
+    event = await models.Event.get(id=id).only("id", "created_by_id", "created_at")
+
+    if not has_permission(user, event, enums.Permission.READ):
+        raise ForbiddenActionError()
+
+    cursor = q.cursor
+
+    # one row more than a page tells whether there is a next page
+    if q.interval:
+        created_at, score_id = cursor or (None, None)
+        # Model.raw takes no parameters, so the query runs on the connection the
+        # router picks, and the rows are turned into models the way tortoise does
+        # pylint: disable-next=protected-access
+        db = models.EventScore._choose_db()
+        event_scores = [
+            models.EventScore._init_from_db(**row)  # pylint: disable=protected-access
+            for row in await db.execute_query_dict(
+                SCORES_SAMPLE_SQL,
+                [id, q.interval, created_at, score_id, q.pp + 1, event.created_at],
+            )
+        ]
+    else:
+        qs = models.EventScore.filter(event_id=id, created_at__gte=event.created_at)
+        if cursor:
+            created_at, score_id = cursor
+            qs = qs.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=score_id)
+            )
+        event_scores = await qs.order_by("created_at", "id").limit(q.pp + 1)
+
+    next_cursor = None
+    if len(event_scores) > q.pp:
+        event_scores = event_scores[: q.pp]
+        last = event_scores[-1]
+        next_cursor = schemas.encode_cursor(last.created_at, last.id)
+
+    return schemas.EventScoreResultSet(
+        pagination=schemas.CursorPagination(num_per_page=q.pp, next=next_cursor),
+        scores=[schemas.EventScore.from_db(x) for x in event_scores],
     )
 
 
@@ -76,94 +475,266 @@ async def create(user: schemas.User, data: schemas.EventCreate) -> schemas.Event
         raise ForbiddenActionError()
 
     event = await models.Event.create(
-        season=data.season, datetime=data.datetime, created_by_id=user.id
+        season=data.season,
+        datetime=data.datetime,
+        away_team_id=data.away_team_id,
+        home_team_id=data.home_team_id,
+        created_by_id=user.id,
     )
 
     await event.save()
 
-    return schemas.Event.model_validate(event)
+    await current_app.cache.invalidate(page_namespace("event"))
+
+    return schemas.Event.from_db(event)
+
+
+@handle_orm_errors
+async def create_many(
+    user: schemas.User, data: schemas.EventBulkCreate
+) -> schemas.EventBulkResult:
+    if not has_permission(user, None, enums.Permission.CREATE):
+        raise ForbiddenActionError()
+
+    errors = await team_errors(data.events)
+    if errors:
+        raise BulkActionError(errors)
+
+    ids = await reserve_ids(models.Event, len(data.events))
+    events = [
+        models.Event(
+            id=id,
+            season=x.season,
+            datetime=x.datetime,
+            away_team_id=x.away_team_id,
+            home_team_id=x.home_team_id,
+            created_by_id=user.id,
+        )
+        for id, x in zip(ids, data.events)
+    ]
+
+    await models.Event.bulk_create(events)
+
+    await current_app.cache.invalidate(page_namespace("event"))
+
+    return schemas.EventBulkResult(
+        events=[schemas.Event.from_db(event) for event in events]
+    )
+
+
+# The actions changing events commit before broadcasting the change and writing it
+# to the event cache, so they must not be wrapped in another transaction.
 
 
 @handle_orm_errors
 async def delete(user: schemas.User, id: int) -> None:
-    event = await models.Event.get(id=id)
+    async with in_transaction():
+        event = await models.Event.select_for_update().get(id=id)
 
-    if not has_permission(
-        user, schemas.Event.model_validate(event), enums.Permission.DELETE
-    ):
-        raise ForbiddenActionError()
+        if not has_permission(user, event, enums.Permission.DELETE):
+            raise ForbiddenActionError()
+
+        await standing.record(standing.event_totals(event), {})
 
-    await event.delete()
+        await event.delete()
+
+    # a version past the last one keeps late writes from caching it again
+    await current_app.event_cache.set(current_app.redis, id, event.version + 1, None)
+    await current_app.cache.invalidate(page_namespace("event", id))
+    await current_app.cache.invalidate(page_namespace("event"))
 
 
 @handle_orm_errors
 async def update(
     user: schemas.User, id: int, data: schemas.EventPatch
 ) -> schemas.Event:
-    event = await models.Event.get(id=id)
+    async with in_transaction():
+        event = await models.Event.select_for_update().get(id=id)
 
-    if not has_permission(
-        user, schemas.Event.model_validate(event), enums.Permission.UPDATE
-    ):
-        raise ForbiddenActionError()
+        if not has_permission(user, event, enums.Permission.UPDATE):
+            raise ForbiddenActionError()
 
-    conditional_set(event, "season", data.season)
-    conditional_set(event, "period", data.period)
-    conditional_set(event, "datetime", data.datetime)
-    conditional_set(event, "away_team_id", data.away_team_id)
-    conditional_set(event, "away_score", data.away_score)
-    conditional_set(event, "home_team_id", data.home_team_id)
-    conditional_set(event, "home_score", data.home_score)
+        before = standing.event_totals(event)
 
-    if data.status != schemas.NOTSET:
-        event.update_status(data.status)
+        apply_patch(event, data)
+        event.version += 1
 
-    await event.save()
+        await event.save()
+        await standing.record(before, standing.event_totals(event))
 
-    schema_event = schemas.Event.model_validate(event)
+    await event.fetch_related("away_team", "home_team")
 
-    mm = MessageManager(user, f"event-{id}")
-    await mm.send_message(
-        "update",
-        f"Event {id} updated",
-        data=json.loads(schemas.Event.model_dump_json(schema_event)),
-    )
+    return await send_update(user, event)
 
-    return schema_event
+
+@handle_orm_errors
+async def update_many(
+    user: schemas.User, data: schemas.EventBulkPatch
+) -> schemas.EventBulkResult:
+    async with in_transaction():
+        events = {
+            x.id: x
+            for x in await models.Event.filter(
+                id__in=[x.id for x in data.events]
+            ).select_for_update()
+        }
+
+        errors = []
+        seen = set()
+        for i, x in enumerate(data.events):
+            event = events.get(x.id)
+            if x.id in seen:
+                errors.append(
+                    ActionError("Listed more than once", loc=f"events.{i}.id")
+                )
+            elif event is None:
+                errors.append(
+                    ActionError(
+                        "Entity Not Found", loc=f"events.{i}.id", type="does_not_exist"
+                    )
+                )
+            elif not has_permission(user, event, enums.Permission.UPDATE):
+                errors.append(ForbiddenActionError(loc=f"events.{i}"))
+            seen.add(x.id)
+
+        errors.extend(await team_errors(data.events))
+        if errors:
+            raise BulkActionError(errors)
+
+        before = standing.merge_totals(
+            *(standing.event_totals(x) for x in events.values())
+        )
+
+        update_fields = {"modified_at", "version"}
+        for x in data.events:
+            apply_patch(events[x.id], x)
+            events[x.id].version += 1
+            for name in x.model_fields_set - {"id"}:
+                update_fields.update(PATCH_FIELDS[name])
+
+        await bulk_update(
+            models.Event,
+            [events[x.id] for x in data.events],
+            fields=sorted(update_fields),
+        )
+        await standing.record(
+            before,
+            standing.merge_totals(*(standing.event_totals(x) for x in events.values())),
+        )
+
+    await models.Event.fetch_for_list(list(events.values()), "away_team", "home_team")
+
+    return schemas.EventBulkResult(
+        events=[await send_update(user, events[x.id]) for x in data.events]
+    )
 
 
 @handle_orm_errors
 async def score(
     user: schemas.User, id: int, data: schemas.EventScoreCreate
 ) -> schemas.Event:
-    event = await models.Event.get(id=id)
-
-    if not has_permission(
-        user, schemas.Event.model_validate(event), enums.Permission.UPDATE
-    ):
-        raise ForbiddenActionError()
-
-    event.away_score = data.away_score
-    event.home_score = data.home_score
-    await event.save()
-
-    event_score = await models.EventScore.create(
-        away_score=data.away_score, home_score=data.home_score, event_id=event.id
+    away_delta, away_score = score_args(
+        data.away_delta, data.away_score, data.home_delta
     )
-
-    conditional_set(event_score, "away_delta", data.away_delta)
-    conditional_set(event_score, "home_delta", data.home_delta)
-    conditional_set(event_score, "comment", data.comment)
-
-    await event_score.save()
-
-    schema_event = schemas.Event.model_validate(event)
-
-    mm = MessageManager(user, f"event-{id}")
-    await mm.send_message(
-        "update",
-        f"Event {id} updated",
-        data=json.loads(schemas.Event.model_dump_json(schema_event)),
+    home_delta, home_score = score_args(
+        data.home_delta, data.home_score, data.away_delta
     )
+    now = dt.datetime.now(dt.timezone.utc)
+
+    async with in_transaction() as db:
+        rows = await db.execute_query_dict(
+            SCORE_SQL,
+            [
+                id,
+                away_score,
+                away_delta,
+                home_score,
+                home_delta,
+                now,
+                None if user.role == enums.UserRole.ADMIN else user.id,
+                None if data.comment == schemas.NOTSET else data.comment,
+            ],
+        )
+
+        if not rows:
+            # nothing matched, so the event is either missing or not ours to update
+            event = await models.Event.get(id=id)
+            if not has_permission(user, event, enums.Permission.UPDATE):
+                raise ForbiddenActionError()
+            raise ActionError("event was not updated")
+
+        # the updated row, built into a model the way tortoise does for its queries
+        # pylint: disable-next=protected-access
+        event = models.Event._init_from_db(**rows[0])
+
+        if event.status == enums.EventStatus.ENDED:
+            # pylint: disable-next=protected-access
+            old_event = models.Event._init_from_db(
+                **{
+                    **rows[0],
+                    "away_score": event.away_score - rows[0]["away_delta"],
+                    "home_score": event.home_score - rows[0]["home_delta"],
+                }
+            )
+            await standing.record(
+                standing.event_totals(old_event), standing.event_totals(event)
+            )
+
+    await event.fetch_related("away_team", "home_team")
+
+    return await send_update(user, event)
 
-    return schema_event
+
+@handle_orm_errors
+async def score_many(
+    user: schemas.User, id: int, data: schemas.EventScoresCreate
+) -> schemas.Event:
+    async with in_transaction():
+        event = await models.Event.select_for_update().get(id=id)
+
+        if not has_permission(user, event, enums.Permission.UPDATE):
+            raise ForbiddenActionError()
+
+        before = standing.event_totals(event)
+
+        event_scores = []
+        for x in data.scores:
+            away_delta, away_score = score_args(
+                x.away_delta, x.away_score, x.home_delta
+            )
+            home_delta, home_score = score_args(
+                x.home_delta, x.home_score, x.away_delta
+            )
+
+            away_score = (
+                event.away_score + away_delta if away_score is None else away_score
+            )
+            home_score = (
+                event.home_score + home_delta if home_score is None else home_score
+            )
+
+            event_scores.append(
+                models.EventScore(
+                    event_id=id,
+                    away_delta=away_score - event.away_score,
+                    home_delta=home_score - event.home_score,
+                    away_score=away_score,
+                    home_score=home_score,
+                    comment=None if x.comment == schemas.NOTSET else x.comment,
+                )
+            )
+
+            event.away_score = away_score
+            event.home_score = home_score
+
+        event.version += 1
+
+        await models.EventScore.bulk_create(event_scores)
+        await event.save(
+            update_fields=["away_score", "home_score", "modified_at", "version"]
+        )
+        await standing.record(before, standing.event_totals(event))
+
+    await event.fetch_related("away_team", "home_team")
+
+    return await send_update(user, event)
@@ -1,7 +1,7 @@
 import re
 from functools import wraps
 from inspect import iscoroutinefunction
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, List, Optional
 
 from asyncpg.exceptions import UniqueViolationError
 from tortoise.exceptions import DoesNotExist, IntegrityError
@@ -58,3 +58,67 @@ def handle_orm_errors(func: Callable) -> Callable:
 def conditional_set(obj: Any, attr: str, value: Any) -> bool:
     if value != schemas.NOTSET:
         setattr(obj, attr, value)
+
+
+def only_fields(
+    queryset: Any,
+    schema: Any,
+    fields: Optional[Iterable[str]],
+    resolves: Optional[Iterable[str]] = None,
+) -> Any:
+    """
+    Limit the columns selected by `queryset` to the ones needed to build `fields`
+    of `schema` (and to prefetch `resolves`).
+    """
+    if fields:
+        return queryset.only(*schema.select_fields([*fields, *(resolves or [])]))
+    return queryset
+
+
+async def reserve_ids(model: Any, count: int) -> List[int]:
+    """
+    Take `count` ids from the id sequence of `model`'s table, so rows built with
+    them can be written with `bulk_create` (which does not return generated ids).
+    """
+    # tortoise has no public accessors for the table, or the connection a write
+    # would go through (the transaction's, inside one)
+    # pylint: disable-next=protected-access
+    table = model._meta.db_table
+    # pylint: disable-next=protected-access
+    db = model._choose_db(for_write=True)
+    rows = await db.execute_query_dict(
+        "SELECT nextval(pg_get_serial_sequence($1, 'id')) AS id"
+        " FROM generate_series(1, $2)",
+        [f'"{table}"', count],
+    )
+    return sorted(x["id"] for x in rows)
+
+
+async def bulk_update(
+    model: Any, objects: Iterable[Any], fields: Iterable[str]
+) -> None:
+    """
+    Write `fields` of each of `objects` with one prepared UPDATE run through
+    `execute_many`, the same way `bulk_create` inserts.  `Model.bulk_update` is not
+    used since it inlines the values into its SQL and ignores `source_field`.
+    """
+    # pylint: disable-next=protected-access
+    meta = model._meta
+    fields = [meta.fields_map[x] for x in fields]
+    assignments = ", ".join(
+        f'"{x.source_field or x.model_field_name}" = ${i}'
+        for i, x in enumerate(fields, 2)
+    )
+
+    # pylint: disable-next=protected-access
+    db = model._choose_db(for_write=True)
+    await db.execute_many(
+        f'UPDATE "{meta.db_table}" SET {assignments} WHERE "{meta.db_pk_column}" = $1',
+        [
+            [
+                obj.pk,
+                *[x.to_db_value(getattr(obj, x.model_field_name), obj) for x in fields],
+            ]
+            for obj in objects
+        ],
+    )
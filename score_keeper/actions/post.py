@@ -1,17 +1,26 @@
-from typing import Union
+from typing import Optional, Union
 
+from quart import current_app
 from tortoise.exceptions import DoesNotExist
-from tortoise.expressions import F, Q
+from tortoise.expressions import Q
 
 from score_keeper import enums, models, schemas
+from score_keeper.lib.db_router import read_replica
 from score_keeper.lib.error import ActionError, ForbiddenActionError
+from score_keeper.lib.page_cache import page_namespace
+from score_keeper.lib.rendering import render_markdown
+from score_keeper.lib.single_flight import SingleFlight
 
-from .helpers import conditional_set, handle_orm_errors
+from .helpers import conditional_set, handle_orm_errors, only_fields
+
+# concurrent identical reads share one fetch of the row, the responses are still
+# built and checked for permission per caller
+get_flight = SingleFlight("post.get")
 
 
 def has_permission(
     user: schemas.User,
-    obj: Union[schemas.Post, None],
+    obj: Union[models.Post, schemas.Post, None],
     permission: enums.Permission,
 ) -> bool:
     if permission == enums.Permission.CREATE:
@@ -45,35 +54,50 @@ def has_permission(
 async def get(
     user: schemas.User, id: int = None, options: schemas.PostGetOptions = None
 ) -> schemas.Post:
-    post = None
-    if id:
-        post = await models.Post.get(id=id)
-    else:
+    if not id:
         raise ActionError("missing lookup key", type="not_found")
 
-    if not has_permission(
-        user, schemas.Post.model_validate(post), enums.Permission.READ
-    ):
+    key = f"{id} {options.model_dump_json()}" if options else str(id)
+    post = await get_flight.do(key, get_from_db, id, options)
+
+    if not has_permission(user, post, enums.Permission.READ):
         raise ForbiddenActionError()
 
+    return schemas.Post.from_db(post, options.fields if options else None)
+
+
+@read_replica
+async def get_from_db(
+    id: int, options: Optional[schemas.PostGetOptions]
+) -> models.Post:
+    fields = options.fields if options else None
+
+    qs = only_fields(
+        models.Post.all(), schemas.Post, fields, options and options.resolves
+    )
+    post = await qs.get(id=id)
+
     if options:
         if options.resolves:
             await post.fetch_related(*options.resolves)
 
-    return schemas.Post.model_validate(post)
+    return post
 
 
 @handle_orm_errors
+@read_replica
 async def query(user: schemas.User, q: schemas.PostQuery) -> schemas.PostResultSet:
     qs = models.Post.all()
     if user.role != enums.UserRole.ADMIN:
         qs = qs.filter(Q(_status=enums.PostStatus.PUBLISHED) | Q(author_id=user.id))
 
+    qs = only_fields(qs, schemas.Post, q.fields, q.resolves)
+
     queryset, pagination = await q.apply(qs)
 
     return schemas.PostResultSet(
         pagination=pagination,
-        posts=[schemas.Post.model_validate(post) for post in await queryset],
+        posts=[schemas.Post.from_db(post, q.fields) for post in await queryset],
     )
 
 
@@ -83,65 +107,98 @@ async def create(user: schemas.User, data: schemas.PostCreate) -> schemas.Post:
         raise ForbiddenActionError()
 
     post = await models.Post.create(
-        title=data.title, content=data.content, author_id=user.id
+        title=data.title,
+        content=data.content,
+        content_html=await render_markdown(data.content),
+        author_id=user.id,
     )
 
     post.update_status(data.status)
     await post.save()
 
-    return schemas.Post.model_validate(post)
+    return schemas.Post.from_db(post)
 
 
 @handle_orm_errors
 async def delete(user: schemas.User, id: int) -> None:
     post = await models.Post.get(id=id)
 
-    if not has_permission(
-        user, schemas.Post.model_validate(post), enums.Permission.DELETE
-    ):
+    if not has_permission(user, post, enums.Permission.DELETE):
         raise ForbiddenActionError()
 
     await post.delete()
 
+    await current_app.cache.invalidate(page_namespace("post", id))
+
 
 @handle_orm_errors
 async def update(user: schemas.User, id: int, data: schemas.PostPatch) -> schemas.Post:
     post = await models.Post.get(id=id)
 
-    if not has_permission(
-        user, schemas.Post.model_validate(post), enums.Permission.UPDATE
-    ):
+    if not has_permission(user, post, enums.Permission.UPDATE):
         raise ForbiddenActionError()
 
     conditional_set(post, "title", data.title)
     conditional_set(post, "content", data.content)
 
+    if data.content != schemas.NOTSET:
+        post.content_html = await render_markdown(data.content)
+
     if data.status != schemas.NOTSET:
         post.update_status(data.status)
 
     await post.save()
 
-    return schemas.Post.model_validate(post)
+    await current_app.cache.invalidate(page_namespace("post", id))
+
+    return schemas.Post.from_db(post)
+
+
+async def render_missing(batch_size: int = 100) -> int:
+    """
+    Render the content of the posts written before it was rendered on write.
+    Returns the number of posts rendered.
+    """
+    count = 0
+    while True:
+        posts = (
+            await models.Post.filter(content_html__isnull=True)
+            .order_by("id")
+            .limit(batch_size)
+            .only("id", "content")
+        )
+        if not posts:
+            return count
+
+        for post in posts:
+            # an update rather than save() so modified_at is left alone, skipped
+            # if the post was edited meanwhile
+            await models.Post.filter(id=post.id, content_html__isnull=True).update(
+                content_html=await render_markdown(post.content)
+            )
+        count += len(posts)
 
 
 @handle_orm_errors
-async def view(_: schemas.User, id: int) -> None:
-    await models.Post.filter(id=id).update(viewed=F("viewed") + 1)
+async def view(_: schemas.User, id: int) -> int:
+    """
+    Count a view of a post.  Views are buffered and written to `Post.viewed` in
+    batches, so this returns the views not yet written, including this one.
+    """
+    return await current_app.view_counter.add(id)
 
 
 @handle_orm_errors
 async def get_like(user: schemas.User, id: int) -> schemas.PostLike:
     post_like = await models.PostLike.get(post_id=id, user_id=user.id)
-    return schemas.PostLike.model_validate(post_like)
+    return schemas.PostLike.from_db(post_like)
 
 
 @handle_orm_errors
 async def like(user: schemas.User, id: int) -> schemas.PostLike:
     post = await models.Post.get(id=id)
 
-    if not has_permission(
-        user, schemas.Post.model_validate(post), enums.Permission.READ
-    ):
+    if not has_permission(user, post, enums.Permission.READ):
         raise ForbiddenActionError()
 
     try:
@@ -149,16 +206,14 @@ async def like(user: schemas.User, id: int) -> schemas.PostLike:
     except DoesNotExist:
         post_like = await models.PostLike.create(post_id=id, user_id=user.id)
 
-    return schemas.PostLike.model_validate(post_like)
+    return schemas.PostLike.from_db(post_like)
 
 
 @handle_orm_errors
 async def unlike(user: schemas.User, id: int) -> None:
     post = await models.Post.get(id=id)
 
-    if not has_permission(
-        user, schemas.Post.model_validate(post), enums.Permission.READ
-    ):
+    if not has_permission(user, post, enums.Permission.READ):
         raise ForbiddenActionError()
 
     try:
@@ -0,0 +1,173 @@
+import datetime as dt
+from typing import Dict, Optional, Tuple
+
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+
+from score_keeper import enums, models, schemas
+from score_keeper.lib.db_router import read_replica
+
+from .helpers import handle_orm_errors
+
+# (season, team id) -> (wins, losses, ties, points for, points against)
+Totals = Dict[Tuple[int, int], Tuple[int, int, int, int, int]]
+
+# add to a team's record, creating it on the first result of the season
+APPLY_SQL = """
+INSERT INTO "standing" (
+    season, team_id, wins, losses, ties, points_for, points_against,
+    created_at, modified_at
+)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $8)
+ON CONFLICT (season, team_id) DO UPDATE SET
+    wins = "standing".wins + EXCLUDED.wins,
+    losses = "standing".losses + EXCLUDED.losses,
+    ties = "standing".ties + EXCLUDED.ties,
+    points_for = "standing".points_for + EXCLUDED.points_for,
+    points_against = "standing".points_against + EXCLUDED.points_against,
+    modified_at = EXCLUDED.modified_at
+"""
+
+# writers of standings block until the rebuild commits, then add their change on
+# top of the rebuilt totals; readers are not blocked
+REBUILD_LOCK_SQL = 'LOCK TABLE "standing" IN EXCLUSIVE MODE'
+
+REBUILD_DELETE_SQL = """
+DELETE FROM "standing" WHERE $1::int IS NULL OR season = $1
+"""
+
+REBUILD_INSERT_SQL = """
+INSERT INTO "standing" (
+    season, team_id, wins, losses, ties, points_for, points_against,
+    created_at, modified_at
+)
+SELECT
+    season,
+    team_id,
+    SUM(CASE WHEN points_for > points_against THEN 1 ELSE 0 END),
+    SUM(CASE WHEN points_for < points_against THEN 1 ELSE 0 END),
+    SUM(CASE WHEN points_for = points_against THEN 1 ELSE 0 END),
+    SUM(points_for),
+    SUM(points_against),
+    $2,
+    $2
+FROM (
+    SELECT season, away_team_id AS team_id, away_score AS points_for,
+        home_score AS points_against
+    FROM "event"
+    WHERE status = 'ended' AND away_team_id IS NOT NULL
+        AND home_team_id IS NOT NULL AND ($1::int IS NULL OR season = $1)
+    UNION ALL
+    SELECT season, home_team_id, home_score, away_score
+    FROM "event"
+    WHERE status = 'ended' AND away_team_id IS NOT NULL
+        AND home_team_id IS NOT NULL AND ($1::int IS NULL OR season = $1)
+) results
+GROUP BY season, team_id
+"""
+
+
+def event_totals(event: models.Event) -> Totals:
+    """
+    What an event adds to the standings: nothing until it has ended between two
+    teams, then a result and the points scored for each team.
+    """
+    if (
+        event.status != enums.EventStatus.ENDED
+        or event.away_team_id is None
+        or event.home_team_id is None
+    ):
+        return {}
+
+    totals = {}
+    for team_id, points_for, points_against in (
+        (event.away_team_id, event.away_score, event.home_score),
+        (event.home_team_id, event.home_score, event.away_score),
+    ):
+        result = (
+            int(points_for > points_against),
+            int(points_for < points_against),
+            int(points_for == points_against),
+            points_for,
+            points_against,
+        )
+        key = (event.season, team_id)
+        totals[key] = add_totals(totals.get(key), result)
+
+    return totals
+
+
+def add_totals(a: Optional[tuple], b: tuple, sign: int = 1) -> tuple:
+    return tuple(x + sign * y for x, y in zip(a or (0,) * len(b), b))
+
+
+def merge_totals(*totals: Totals) -> Totals:
+    merged = {}
+    for x in totals:
+        for key, value in x.items():
+            merged[key] = add_totals(merged.get(key), value)
+    return merged
+
+
+async def record(before: Totals, after: Totals) -> None:
+    """
+    Update the standings for events that changed from `before` to `after` (see
+    `event_totals`).  Must run in the transaction that writes the events, with
+    the events locked, so concurrent changes can't be counted twice.
+    """
+    changes = {
+        key: add_totals(after.get(key), before[key], sign=-1)
+        if key in before
+        else after[key]
+        for key in before.keys() | after.keys()
+    }
+    now = dt.datetime.now(dt.timezone.utc)
+
+    rows = [
+        [season, team_id, *change, now]
+        # update rows in a fixed order so concurrent writers can't deadlock
+        for (season, team_id), change in sorted(changes.items())
+        if any(change)
+    ]
+    if rows:
+        # the caller's transaction, which tortoise only exposes through _choose_db
+        # pylint: disable-next=protected-access
+        db = models.Standing._choose_db(for_write=True)
+        await db.execute_many(APPLY_SQL, rows)
+
+
+async def rebuild(season: Optional[int] = None) -> int:
+    """
+    Recompute the standings of a season, or of every season, from the events.
+
+    Returns:
+        int: Number of standings written.
+    """
+    async with in_transaction() as db:
+        await db.execute_script(REBUILD_LOCK_SQL)
+        await db.execute_query(REBUILD_DELETE_SQL, [season])
+        count, _ = await db.execute_query(
+            REBUILD_INSERT_SQL, [season, dt.datetime.now(dt.timezone.utc)]
+        )
+
+    return count
+
+
+@handle_orm_errors
+@read_replica
+async def query(
+    _: schemas.User, q: schemas.StandingQueryString
+) -> schemas.StandingResultSet:
+    qs = (
+        models.Standing.filter(season=q.season)
+        .annotate(point_difference=F("points_for") - F("points_against"))
+        .order_by("-wins", "-ties", "-point_difference", "team_id")
+    )
+
+    if q.resolves:
+        qs = qs.prefetch_related(*q.resolves)
+
+    return schemas.StandingResultSet(
+        season=q.season,
+        standings=[schemas.Standing.from_db(standing) for standing in await qs],
+    )
@@ -1,14 +1,30 @@
-from typing import Union
+from typing import List, Union
 
-from score_keeper import enums, models, schemas
-from score_keeper.lib.error import ActionError, ForbiddenActionError
+from quart import current_app
+from tortoise.expressions import Q
+from tortoise.functions import Count, Max
+from tortoise.transactions import in_transaction
 
-from .helpers import conditional_set, handle_orm_errors
+from score_keeper import enums, models, schemas
+from score_keeper.lib.cache import cached, invalidates
+from score_keeper.lib.conditional import Version
+from score_keeper.lib.db_router import read_primary, read_replica
+from score_keeper.lib.error import ActionError, BulkActionError, ForbiddenActionError
+from score_keeper.lib.page_cache import page_namespace
+
+from . import standing
+from .helpers import (
+    bulk_update,
+    conditional_set,
+    handle_orm_errors,
+    only_fields,
+    reserve_ids,
+)
 
 
 def has_permission(
     user: schemas.User,
-    obj: Union[schemas.Event, None],
+    obj: Union[models.Team, schemas.Team, None],
     permission: enums.Permission,
 ) -> bool:
     if permission == enums.Permission.CREATE:
@@ -35,39 +51,143 @@ def has_permission(
 
 
 @handle_orm_errors
+@cached("team")
+@read_primary
+async def load(id: int) -> schemas.Team:
+    """
+    A team by id with every field, for every caller: check permissions on the
+    result.
+    """
+    return schemas.Team.from_db(await models.Team.get(id=id))
+
+
+@handle_orm_errors
+@read_replica
 async def get(
     user: schemas.User, id: int = None, options: schemas.TeamGetOptions = None
 ) -> schemas.Team:
+    fields = options.fields if options else None
+
     team = None
-    if id:
-        team = await models.Team.get(id=id)
+    if id and not fields and not (options and options.resolves):
+        team = await load(id)
+    elif id:
+        qs = only_fields(
+            models.Team.all(), schemas.Team, fields, options and options.resolves
+        )
+        team = await qs.get(id=id)
     else:
         raise ActionError("missing lookup key", type="not_found")
 
-    if not has_permission(
-        user, schemas.Team.model_validate(team), enums.Permission.READ
-    ):
+    if not has_permission(user, team, enums.Permission.READ):
         raise ForbiddenActionError()
 
+    if isinstance(team, schemas.Team):
+        return team
+
     if options:
         if options.resolves:
             await team.fetch_related(*options.resolves)
 
-    return schemas.Team.model_validate(team)
+    return schemas.Team.from_db(team, fields)
+
+
+@handle_orm_errors
+@read_replica
+async def version(
+    user: schemas.User, id: int, options: schemas.TeamGetOptions = None
+) -> Version:
+    """
+    The version of `get` for conditional requests, read without loading the team.
+    """
+    # users have no modified_at to tell when they change
+    if options and schemas.TeamResolve.CREATED_BY in (options.resolves or []):
+        return None
+
+    team = await models.Team.get(id=id).only("id", "created_by_id", "modified_at")
+
+    if not has_permission(user, team, enums.Permission.READ):
+        raise ForbiddenActionError()
+
+    return [team.modified_at], team.modified_at
 
 
 @handle_orm_errors
+@read_replica
+async def query_version(_: schemas.User, q: schemas.TeamQuery) -> Version:
+    """
+    The version of a `query` page for conditional requests.
+    """
+    if schemas.TeamResolve.CREATED_BY in (q.resolves or []):
+        return None
+
+    rows = (
+        await q.filter(models.Team.all())
+        .annotate(count=Count("id"), last=Max("modified_at"))
+        .values("count", "last")
+    )
+    count, last = (rows[0]["count"], rows[0]["last"]) if rows else (0, None)
+
+    return [count, last], last
+
+
+@handle_orm_errors
+@read_replica
 async def query(_: schemas.User, q: schemas.TeamQuery) -> schemas.TeamResultSet:
     qs = models.Team.all()
 
+    qs = only_fields(qs, schemas.Team, q.fields, q.resolves)
+
     queryset, pagination = await q.apply(qs)
 
     return schemas.TeamResultSet(
         pagination=pagination,
-        teams=[schemas.Team.model_validate(team) for team in await queryset],
+        teams=[schemas.Team.from_db(team, q.fields) for team in await queryset],
     )
 
 
+async def team_options(_: schemas.User) -> List[schemas.TeamOption]:
+    return [
+        schemas.TeamOption(id=id, name=name)
+        for id, name in await current_app.team_directory.all()
+    ]
+
+
+async def autocomplete(
+    _: schemas.User, q: schemas.TeamAutocompleteQueryString
+) -> schemas.TeamOptionResultSet:
+    return schemas.TeamOptionResultSet(
+        teams=[
+            schemas.TeamOption(id=id, name=name)
+            for id, name in await current_app.team_directory.search(q.q, q.limit)
+        ]
+    )
+
+
+async def cached_event_ids(team_ids: List[int]) -> List[int]:
+    """
+    The live events of teams, whose copies in the event cache embed the teams.
+    """
+    return await models.Event.filter(
+        Q(away_team_id__in=team_ids) | Q(home_team_id__in=team_ids),
+        _status=enums.EventStatus.IN_PROGRESS,
+    ).values_list("id", flat=True)
+
+
+async def invalidate_event_pages(event_ids: List[int]) -> None:
+    """
+    The cached event pages showing teams: the lists, and the pages of live events.
+    Other events show a renamed team once their pages expire.
+    """
+    for event_id in event_ids:
+        await current_app.cache.invalidate(page_namespace("event", event_id))
+    await current_app.cache.invalidate(page_namespace("event"))
+
+
+# The actions changing teams commit before invalidating the team directory, the
+# caches and cached events, so they must not be wrapped in another transaction.
+
+
 @handle_orm_errors
 async def create(user: schemas.User, data: schemas.TeamCreate) -> schemas.Team:
     if not has_permission(user, None, enums.Permission.CREATE):
@@ -77,32 +197,129 @@ async def create(user: schemas.User, data: schemas.TeamCreate) -> schemas.Team:
 
     await team.save()
 
-    return schemas.Team.model_validate(team)
+    await current_app.team_directory.invalidate()
+
+    return schemas.Team.from_db(team)
+
+
+@handle_orm_errors
+async def create_many(
+    user: schemas.User, data: schemas.TeamBulkCreate
+) -> schemas.TeamBulkResult:
+    if not has_permission(user, None, enums.Permission.CREATE):
+        raise ForbiddenActionError()
+
+    async with in_transaction():
+        ids = await reserve_ids(models.Team, len(data.teams))
+        teams = [
+            models.Team(id=id, name=x.name, created_by_id=user.id)
+            for id, x in zip(ids, data.teams)
+        ]
+
+        await models.Team.bulk_create(teams)
+
+    await current_app.team_directory.invalidate()
+
+    return schemas.TeamBulkResult(teams=[schemas.Team.from_db(team) for team in teams])
 
 
 @handle_orm_errors
+@invalidates("team")
 async def delete(user: schemas.User, id: int) -> None:
     team = await models.Team.get(id=id)
 
-    if not has_permission(
-        user, schemas.Team.model_validate(team), enums.Permission.DELETE
-    ):
+    if not has_permission(user, team, enums.Permission.DELETE):
         raise ForbiddenActionError()
 
-    await team.delete()
+    # the team's events are deleted along with it
+    event_ids = await cached_event_ids([id])
+
+    async with in_transaction():
+        # back the results of its ended events out of the opponents' standings,
+        # its own standings are deleted with it
+        ended = await models.Event.filter(
+            Q(away_team_id=id) | Q(home_team_id=id),
+            _status=enums.EventStatus.ENDED,
+        ).select_for_update()
+        await standing.record(
+            standing.merge_totals(*(standing.event_totals(x) for x in ended)), {}
+        )
+
+        await team.delete()
+
+    await current_app.team_directory.invalidate()
+    await current_app.event_cache.delete(*event_ids)
+    await invalidate_event_pages(event_ids)
 
 
 @handle_orm_errors
+@invalidates("team")
 async def update(user: schemas.User, id: int, data: schemas.TeamPatch) -> schemas.Team:
     team = await models.Team.get(id=id)
 
-    if not has_permission(
-        user, schemas.Team.model_validate(team), enums.Permission.UPDATE
-    ):
+    if not has_permission(user, team, enums.Permission.UPDATE):
         raise ForbiddenActionError()
 
     conditional_set(team, "name", data.name)
 
     await team.save()
 
-    return schemas.Team.model_validate(team)
+    event_ids = await cached_event_ids([id])
+
+    await current_app.team_directory.invalidate()
+    await current_app.event_cache.delete(*event_ids)
+    await invalidate_event_pages(event_ids)
+
+    return schemas.Team.from_db(team)
+
+
+@handle_orm_errors
+@invalidates("team")
+async def update_many(
+    user: schemas.User, data: schemas.TeamBulkPatch
+) -> schemas.TeamBulkResult:
+    async with in_transaction():
+        teams = {
+            x.id: x
+            for x in await models.Team.filter(
+                id__in=[x.id for x in data.teams]
+            ).select_for_update()
+        }
+
+        errors = []
+        seen = set()
+        for i, x in enumerate(data.teams):
+            team = teams.get(x.id)
+            if x.id in seen:
+                errors.append(ActionError("Listed more than once", loc=f"teams.{i}.id"))
+            elif team is None:
+                errors.append(
+                    ActionError(
+                        "Entity Not Found", loc=f"teams.{i}.id", type="does_not_exist"
+                    )
+                )
+            elif not has_permission(user, team, enums.Permission.UPDATE):
+                errors.append(ForbiddenActionError(loc=f"teams.{i}"))
+            seen.add(x.id)
+
+        if errors:
+            raise BulkActionError(errors)
+
+        for x in data.teams:
+            conditional_set(teams[x.id], "name", x.name)
+
+        await bulk_update(
+            models.Team,
+            [teams[x.id] for x in data.teams],
+            fields=["name", "modified_at"],
+        )
+
+    event_ids = await cached_event_ids(list(teams))
+
+    await current_app.team_directory.invalidate()
+    await current_app.event_cache.delete(*event_ids)
+    await invalidate_event_pages(event_ids)
+
+    return schemas.TeamBulkResult(
+        teams=[schemas.Team.from_db(teams[x.id]) for x in data.teams]
+    )
@@ -2,6 +2,7 @@ import uuid
 from typing import Union
 
 from score_keeper import enums, models, schemas
+from score_keeper.lib.db_router import read_replica
 from score_keeper.lib.error import ActionError, ForbiddenActionError
 
 from .helpers import conditional_set, handle_orm_errors
@@ -9,7 +10,7 @@ from .helpers import conditional_set, handle_orm_errors
 
 def has_permission(
     user: schemas.User,
-    obj: Union[schemas.Token, None],
+    obj: Union[models.Token, schemas.Token, None],
     permission: enums.Permission,
 ) -> bool:
     if permission == enums.Permission.CREATE:
@@ -54,19 +55,18 @@ async def get(
     else:
         raise ActionError("missing lookup key", type="not_found")
 
-    if not has_permission(
-        user, schemas.Token.model_validate(token), enums.Permission.READ
-    ):
+    if not has_permission(user, token, enums.Permission.READ):
         raise ForbiddenActionError()
 
     if options:
         if options.resolves:
             await token.fetch_related(*options.resolves)
 
-    return schemas.Token.model_validate(token)
+    return schemas.Token.from_db(token)
 
 
 @handle_orm_errors
+@read_replica
 async def query(user: schemas.User, q: schemas.TokenQuery) -> schemas.TokenResultSet:
     qs = models.Token.all()
     if user.role != enums.UserRole.ADMIN:
@@ -76,7 +76,7 @@ async def query(user: schemas.User, q: schemas.TokenQuery) -> schemas.TokenResul
 
     return schemas.TokenResultSet(
         pagination=pagination,
-        tokens=[schemas.Token.model_validate(token) for token in await queryset],
+        tokens=[schemas.Token.from_db(token) for token in await queryset],
     )
 
 
@@ -93,16 +93,14 @@ async def create(
 
     await token.save()
 
-    return schemas.TokenCreateSuccess.model_validate(token)
+    return schemas.TokenCreateSuccess.from_db(token)
 
 
 @handle_orm_errors
 async def delete(user: schemas.User, id: int) -> None:
     token = await models.Token.get(id=id)
 
-    if not has_permission(
-        user, schemas.Token.model_validate(token), enums.Permission.DELETE
-    ):
+    if not has_permission(user, token, enums.Permission.DELETE):
         raise ForbiddenActionError()
 
     await token.delete()
@@ -112,13 +110,11 @@ async def delete(user: schemas.User, id: int) -> None:
 async def update(user: schemas.User, id: int, data: schemas.TokenPatch) -> schemas.Post:
     token = await models.Token.get(id=id)
 
-    if not has_permission(
-        user, schemas.Token.model_validate(token), enums.Permission.UPDATE
-    ):
+    if not has_permission(user, token, enums.Permission.UPDATE):
         raise ForbiddenActionError()
 
     conditional_set(token, "name", data.name)
 
     await token.save()
 
-    return schemas.Token.model_validate(token)
+    return schemas.Token.from_db(token)
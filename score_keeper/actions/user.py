@@ -1,6 +1,8 @@
 from typing import Union
 
 from score_keeper import enums, models, schemas
+from score_keeper.lib.cache import cached, invalidates
+from score_keeper.lib.db_router import read_primary, read_replica
 from score_keeper.lib.error import ActionError, ForbiddenActionError
 
 from .helpers import conditional_set, handle_orm_errors
@@ -8,7 +10,7 @@ from .helpers import conditional_set, handle_orm_errors
 
 def has_permission(
     user: schemas.User,
-    obj: Union[schemas.User, None],
+    obj: Union[models.User, schemas.User, None],
     permission: enums.Permission,
 ) -> bool:
     if permission == enums.Permission.CREATE:
@@ -31,6 +33,16 @@ def has_permission(
     return False
 
 
+@handle_orm_errors
+@cached("user")
+@read_primary
+async def load(id: int) -> schemas.User:
+    """
+    A user by id, for every caller: check permissions on the result.
+    """
+    return schemas.User.from_db(await models.User.get(id=id))
+
+
 @handle_orm_errors
 async def get(
     user: schemas.User,
@@ -39,26 +51,31 @@ async def get(
     options: schemas.UserGetOptions = None,
 ) -> schemas.User:
     obj = None
-    if id:
+    if id and not (options and options.resolves):
+        # read for every request by lib.auth, so served from the cache
+        obj = await load(id)
+    elif id:
         obj = await models.User.get(id=id)
     elif email:
         obj = await models.User.get(email=email)
     else:
         raise ActionError("missing lookup key", type="not_found")
 
-    if not has_permission(
-        user, schemas.User.model_validate(obj), enums.Permission.READ
-    ):
+    if not has_permission(user, obj, enums.Permission.READ):
         raise ForbiddenActionError()
 
+    if isinstance(obj, schemas.User):
+        return obj
+
     if options:
         if options.resolves:
             await obj.fetch_related(*options.resolves)
 
-    return schemas.User.model_validate(obj)
+    return schemas.User.from_db(obj)
 
 
 @handle_orm_errors
+@read_replica
 async def query(user: schemas.User, q: schemas.UserQuery) -> schemas.UserResultSet:
     qs = models.User.all()
     if user.role != enums.UserRole.ADMIN:
@@ -68,7 +85,7 @@ async def query(user: schemas.User, q: schemas.UserQuery) -> schemas.UserResultS
 
     return schemas.UserResultSet(
         pagination=pagination,
-        users=[schemas.User.model_validate(user) for user in await queryset],
+        users=[schemas.User.from_db(user) for user in await queryset],
     )
 
 
@@ -87,28 +104,26 @@ async def create(user: schemas.User, data: schemas.UserCreate) -> schemas.User:
         obj.set_password(data.password)
         await obj.save()
 
-    return schemas.User.model_validate(obj)
+    return schemas.User.from_db(obj)
 
 
 @handle_orm_errors
+@invalidates("user")
 async def delete(user: schemas.User, id: int) -> None:
     obj = await models.User.get(id=id)
 
-    if not has_permission(
-        user, schemas.User.model_validate(obj), enums.Permission.DELETE
-    ):
+    if not has_permission(user, obj, enums.Permission.DELETE):
         raise ForbiddenActionError()
 
     await obj.delete()
 
 
 @handle_orm_errors
+@invalidates("user")
 async def update(user: schemas.User, id: int, data: schemas.UserPatch) -> schemas.User:
     obj = await models.User.get(id=id)
 
-    if not has_permission(
-        user, schemas.User.model_validate(obj), enums.Permission.UPDATE
-    ):
+    if not has_permission(user, obj, enums.Permission.UPDATE):
         raise ForbiddenActionError()
 
     conditional_set(obj, "name", data.name)
@@ -117,7 +132,7 @@ async def update(user: schemas.User, id: int, data: schemas.UserPatch) -> schema
 
     await obj.save()
 
-    return schemas.User.model_validate(obj)
+    return schemas.User.from_db(obj)
 
 
 @handle_orm_errors
@@ -1,12 +1,22 @@
 import datetime as dt
+import os
 import urllib.parse
 from uuid import uuid4
 
 import humanize
 import markdown
+import redis.asyncio as aioredis
 from markupsafe import Markup
 from pydantic_core import ValidationError
-from quart import Quart, has_request_context, redirect, request, url_for
+from quart import (
+    Quart,
+    g,
+    has_request_context,
+    redirect,
+    request,
+    url_for,
+    websocket,
+)
 from quart.templating import render_template
 from quart_auth import QuartAuth, Unauthorized
 from quart_schema import QuartSchema
@@ -21,12 +31,22 @@ from quart_schema.validation import (
 from tortoise.contrib.quart import register_tortoise
 from werkzeug.exceptions import NotFound
 
-from score_keeper import schemas, settings
+from score_keeper import models, schemas, settings
 from score_keeper.command import register_commands
+from score_keeper.lib import serialization
+from score_keeper.lib.assets import Assets
 from score_keeper.lib.auth import AuthUser, Forbidden
-from score_keeper.lib.error import ActionError, ForbiddenActionError
-from score_keeper.lib.middleware import ProxyMiddleware
+from score_keeper.lib.cache import Cache
+from score_keeper.lib.db_router import replica_status
+from score_keeper.lib.error import ActionError, BulkActionError, ForbiddenActionError
+from score_keeper.lib.event_cache import EventCache
+from score_keeper.lib.middleware import MetricsMiddleware, ProxyMiddleware
+from score_keeper.lib.partitions import MonthlyPartitions
 from score_keeper.lib.pubsub import RedisPubSubManager
+from score_keeper.lib.query_log import QueryLog, active_logs
+from score_keeper.lib.request_metrics import ENDPOINT_KEY, RequestMetrics
+from score_keeper.lib.team_directory import TeamDirectory
+from score_keeper.lib.view_counter import ViewCounter
 from score_keeper.lib.websocket import WebsocketManager
 from score_keeper.log import register_logging
 
@@ -60,6 +80,7 @@ def register_blueprints(app):
     from score_keeper.blueprints.chat import blueprint as chat_blueprint
     from score_keeper.blueprints.event import blueprint as event_blueprint
     from score_keeper.blueprints.marketing import blueprint as marketing_blueprint
+    from score_keeper.blueprints.metrics import blueprint as metrics_blueprint
     from score_keeper.blueprints.post import blueprint as post_blueprint
     from score_keeper.blueprints.team import blueprint as team_blueprint
     from score_keeper.blueprints.user import blueprint as user_blueprint
@@ -72,11 +93,154 @@ def register_blueprints(app):
     app.register_blueprint(chat_blueprint, url_prefix="/chat")
     app.register_blueprint(event_blueprint, url_prefix="/event")
     app.register_blueprint(marketing_blueprint)
+    app.register_blueprint(metrics_blueprint, url_prefix="/metrics")
     app.register_blueprint(post_blueprint, url_prefix="/post")
     app.register_blueprint(team_blueprint, url_prefix="/team")
     app.register_blueprint(user_blueprint, url_prefix="/user")
 
 
+def register_assets(app):
+    app.assets = Assets(
+        app.static_folder,
+        app.config["STATIC_BUILD_FOLDER"]
+        or os.path.join(app.root_path, "static-build"),
+    )
+    app.assets.load()
+    app.url_defaults(app.assets.url_defaults)
+
+    # hashed files built by build-assets, falling back to the files as they are
+    async def send_static_file(filename):
+        return await app.assets.send(filename) or await app.send_static_file(filename)
+
+    app.view_functions["static"] = send_static_file
+
+
+def register_request_metrics(app):
+    app.request_metrics = RequestMetrics(
+        app.redis, publish_interval=app.config["METRICS_PUBLISH_INTERVAL"]
+    )
+    app.asgi_app = MetricsMiddleware(app.asgi_app, app.request_metrics)
+
+    # the endpoint requests are labelled with in the request metrics
+    @app.before_request
+    async def record_endpoint():
+        if request.url_rule is not None:
+            request.scope[ENDPOINT_KEY] = request.url_rule.endpoint
+
+    @app.before_websocket
+    async def record_websocket_endpoint():
+        if websocket.url_rule is not None:
+            websocket.scope[ENDPOINT_KEY] = websocket.url_rule.endpoint
+
+    @app.before_serving
+    async def start_request_metrics():
+        app.request_metrics.start()
+
+    @app.after_serving
+    async def stop_request_metrics():
+        await app.request_metrics.stop()
+
+
+def register_query_log(app):
+    # the statements each request runs, see lib.query_log
+    @app.before_request
+    async def start_query_log():
+        g.query_log = QueryLog()
+        active_logs.set((*active_logs.get(), g.query_log))
+
+    @app.after_request
+    async def report_query_log(response):
+        log = g.get("query_log")
+        if log is None:
+            return response
+
+        if app.debug:
+            response.headers.add("Server-Timing", log.server_timing())
+
+        threshold = app.config["QUERY_REPEAT_THRESHOLD"]
+        repeated = log.repeated(threshold) if threshold else []
+        if repeated:
+            endpoint = request.url_rule.endpoint if request.url_rule else request.path
+            app.logger.warning(
+                "%s ran %d queries, repeating: %s",
+                endpoint,
+                log.count,
+                "; ".join(f"{count}x {statement}" for statement, count in repeated),
+            )
+
+        return response
+
+
+def register_view_counter(app):
+    app.view_counter = ViewCounter(
+        app.redis,
+        flush_interval=app.config["VIEW_FLUSH_INTERVAL"],
+        broadcast_interval=app.config["VIEW_BROADCAST_INTERVAL"],
+    )
+
+    @app.before_serving
+    async def start_view_counter():
+        app.view_counter.start()
+
+    @app.after_serving
+    async def stop_view_counter():
+        await app.view_counter.stop()
+
+
+def register_team_directory(app):
+    app.team_directory = TeamDirectory(
+        app.redis, max_age=app.config["TEAM_DIRECTORY_MAX_AGE"]
+    )
+
+    @app.before_serving
+    async def start_team_directory():
+        app.team_directory.start()
+
+    @app.after_serving
+    async def stop_team_directory():
+        app.team_directory.stop()
+
+
+def register_database(app):
+    app.score_partitions = MonthlyPartitions(
+        models.EventScore,
+        months_ahead=app.config["SCORE_PARTITION_MONTHS_AHEAD"],
+        check_interval=app.config["SCORE_PARTITION_CHECK_INTERVAL"],
+    )
+
+    @app.after_serving
+    async def stop_score_partitions():
+        app.score_partitions.stop()
+
+    if app.config["DB_READ_HOST"]:
+        replica_status.configure(
+            max_lag=app.config["DB_READ_MAX_LAG"],
+            check_interval=app.config["DB_READ_CHECK_INTERVAL"],
+        )
+    register_tortoise(app, config=app.config["TORTOISE_ORM"])
+
+    # registered after tortoise so the database is connected when partitions are
+    # first checked
+    @app.before_serving
+    async def start_score_partitions():
+        app.score_partitions.start()
+
+
+def register_cache(app):
+    app.cache = Cache(
+        app.redis,
+        app.socket_manager,
+        max_entries=app.config["CACHE_MAX_ENTRIES"],
+        ttl=app.config["CACHE_TTL"],
+        local_ttl=app.config["CACHE_LOCAL_TTL"],
+        generation_ttl=app.config["CACHE_GENERATION_TTL"],
+    )
+
+    @app.before_serving
+    async def start_cache():
+        await app.cache.start()
+
+
 class MyQuartAuth(QuartAuth):
     def resolve_user(self) -> AuthUser:
         auth_id = self.load_cookie()
@@ -93,18 +257,38 @@ def create_app(**config_overrides):
     app.config.from_object(settings)
     app.config.update(config_overrides)
 
+    register_assets(app)
+
     QuartSchema(app)
+    serialization.install(app, app.config["JSON_PROVIDER"])
     auth_manager = MyQuartAuth(app)
     auth_manager.user_class = AuthUser
 
     register_logging(app)
     register_blueprints(app)
-    register_tortoise(app, config=app.config["TORTOISE_ORM"])
+
+    app.redis = aioredis.Redis(
+        host=app.config["REDIS_HOST"], port=app.config["REDIS_PORT"]
+    )
+    register_request_metrics(app)
+    register_query_log(app)
+    # before the database so the last views are flushed before its connections
+    # are closed
+    register_view_counter(app)
+
+    app.event_cache = EventCache(app.redis, ttl=app.config["EVENT_CACHE_TTL"])
+
+    register_team_directory(app)
+    register_database(app)
     register_commands(app)
 
-    pubsub_client = RedisPubSubManager("redis")
+    pubsub_client = RedisPubSubManager(
+        app.config["REDIS_HOST"], app.config["REDIS_PORT"]
+    )
     app.socket_manager = WebsocketManager(pubsub_client)
 
+    register_cache(app)
+
     # hide routes that don't have tags
     for rule in app.url_map.iter_rules():
         func = app.view_functions[rule.endpoint]
@@ -177,6 +361,17 @@ def create_app(**config_overrides):
 
     @app.errorhandler(ActionError)
     async def handle_field_value_error(error):
+        if isinstance(error, BulkActionError):
+            return (
+                schemas.Errors(
+                    errors=[
+                        schemas.Error(loc=x.loc, type=x.type, msg=str(x))
+                        for x in error.errors
+                    ]
+                ),
+                422,
+            )
+
         if error.type in ("action_error.not_found", "action_error.does_not_exist"):
             return (
                 schemas.Error(loc=error.loc, type=error.type, msg=str(error)),
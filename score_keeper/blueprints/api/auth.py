@@ -1,13 +1,13 @@
 from quart import Blueprint, current_app
 from quart_auth import login_user
-from quart_schema import validate_request, validate_response
-from tortoise.transactions import atomic
+from tortoise.transactions import atomic, in_transaction
 from unique_names_generator import get_random_name
 from unique_names_generator.data import ADJECTIVES, ANIMALS
 
 from score_keeper import actions, enums, schemas
 from score_keeper.lib.auth import AuthUser
 from score_keeper.lib.error import ActionError
+from score_keeper.lib.serialization import validate_request, validate_response
 
 blueprint = Blueprint("auth", __name__)
 
@@ -15,7 +15,6 @@ blueprint = Blueprint("auth", __name__)
 @blueprint.post("/token")
 @validate_request(schemas.AuthTokenCreate)
 @validate_response(schemas.TokenCreateSuccess, 200)
-@atomic()
 async def token_create(data: schemas.AuthTokenCreate) -> schemas.TokenCreateSuccess:
     user = None
     try:
@@ -25,9 +24,11 @@ async def token_create(data: schemas.AuthTokenCreate) -> schemas.TokenCreateSucc
             raise
 
     if user and await actions.user.check_password(user.id, data.password):
-        token = await actions.token.create(
-            user, enums.TokenType.WEB, schemas.TokenCreate(name="Web Login")
-        )
+        # only the write needs a transaction, not the password check
+        async with in_transaction():
+            token = await actions.token.create(
+                user, enums.TokenType.WEB, schemas.TokenCreate(name="Web Login")
+            )
 
         login_user(AuthUser(token.auth_id))
 
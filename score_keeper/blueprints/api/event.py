@@ -1,27 +1,48 @@
 from quart import Blueprint
 from quart_auth import current_user, login_required
-from quart_schema import validate_querystring, validate_request, validate_response
-from tortoise.transactions import atomic
+from quart_schema import validate_querystring
 
 from score_keeper import actions, schemas
+from score_keeper.lib.conditional import conditional
+from score_keeper.lib.serialization import validate_request, validate_response
 
 blueprint = Blueprint("event", __name__)
 
+# no @atomic() on the routes changing events: the actions commit their own
+# transaction before broadcasting and caching the changed events, and
+# invalidating the cached pages showing them
+
 
 @blueprint.post("")
 @validate_request(schemas.EventCreate)
 @validate_response(schemas.Event, 201)
-@atomic()
 @login_required
 async def create(data: schemas.EventCreate) -> schemas.Event:
     return await actions.event.create(await current_user.get_user(), data), 201
 
 
+@blueprint.post("/bulk")
+@validate_request(schemas.EventBulkCreate)
+@validate_response(schemas.EventBulkResult, 201)
+@login_required
+async def create_many(data: schemas.EventBulkCreate) -> schemas.EventBulkResult:
+    return (
+        await actions.event.create_many(await current_user.get_user(), data),
+        201,
+    )
+
+
+async def read_version(id: int, query_args: schemas.EventGetOptions):
+    return await actions.event.version(
+        await current_user.get_user(), id=id, options=query_args
+    )
+
+
 @blueprint.get("/<int:id>")
 @validate_querystring(schemas.EventGetOptions)
 @validate_response(schemas.Event, 200)
-@atomic()
 @login_required
+@conditional(read_version)
 async def read(id: int, query_args: schemas.EventGetOptions) -> schemas.Event:
     return (
         await actions.event.get(
@@ -31,11 +52,17 @@ async def read(id: int, query_args: schemas.EventGetOptions) -> schemas.Event:
     )
 
 
+async def read_many_version(query_args: schemas.EventQueryString):
+    return await actions.event.query_version(
+        await current_user.get_user(), query_args.to_query()
+    )
+
+
 @blueprint.get("")
 @validate_querystring(schemas.EventQueryString)
 @validate_response(schemas.EventResultSet, 200)
-@atomic()
 @login_required
+@conditional(read_many_version)
 async def read_many(query_args: schemas.EventQueryString) -> schemas.EventResultSet:
     return await actions.event.query(
         await current_user.get_user(), query_args.to_query()
@@ -45,15 +72,21 @@ async def read_many(query_args: schemas.EventQueryString) -> schemas.EventResult
 @blueprint.patch("/<int:id>")
 @validate_request(schemas.EventPatch)
 @validate_response(schemas.Event, 200)
-@atomic()
 @login_required
 async def update(id: int, data: schemas.EventPatch) -> schemas.Event:
     return await actions.event.update(await current_user.get_user(), id, data)
 
 
+@blueprint.patch("/bulk")
+@validate_request(schemas.EventBulkPatch)
+@validate_response(schemas.EventBulkResult, 200)
+@login_required
+async def update_many(data: schemas.EventBulkPatch) -> schemas.EventBulkResult:
+    return await actions.event.update_many(await current_user.get_user(), data)
+
+
 @blueprint.delete("/<int:id>")
 @validate_response(schemas.DeleteConfirmed, 200)
-@atomic()
 @login_required
 async def delete(id: int) -> schemas.DeleteConfirmed:
     await actions.event.delete(await current_user.get_user(), id)
@@ -61,10 +94,30 @@ async def delete(id: int) -> schemas.DeleteConfirmed:
     return schemas.DeleteConfirmed(id=id)
 
 
+@blueprint.get("/<int:id>/scores")
+@validate_querystring(schemas.EventScoreQueryString)
+@validate_response(schemas.EventScoreResultSet, 200)
+@login_required
+async def read_scores(
+    id: int, query_args: schemas.EventScoreQueryString
+) -> schemas.EventScoreResultSet:
+    return await actions.event.scores(await current_user.get_user(), id, query_args)
+
+
 @blueprint.post("/<int:id>/score")
 @validate_request(schemas.EventScoreCreate)
 @validate_response(schemas.Event, 201)
-@atomic()
 @login_required
 async def score(id: int, data: schemas.EventScoreCreate) -> schemas.Event:
     return await actions.event.score(await current_user.get_user(), id, data), 201
+
+
+@blueprint.post("/<int:id>/scores")
+@validate_request(schemas.EventScoresCreate)
+@validate_response(schemas.Event, 201)
+@login_required
+async def score_many(id: int, data: schemas.EventScoresCreate) -> schemas.Event:
+    return (
+        await actions.event.score_many(await current_user.get_user(), id, data),
+        201,
+    )
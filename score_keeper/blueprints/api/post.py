@@ -1,18 +1,22 @@
 from quart import Blueprint
 from quart_auth import current_user, login_required
-from quart_schema import validate_querystring, validate_request, validate_response
+from quart_schema import validate_querystring
 from tortoise.transactions import atomic
 
 from score_keeper import actions, schemas
+from score_keeper.lib.serialization import validate_request, validate_response
 
 blueprint = Blueprint("post", __name__)
 
+# no @atomic() on the routes updating or deleting posts: the actions commit before
+# invalidating the cached pages of the posts
+
 
 @blueprint.post("")
 @validate_request(schemas.PostCreate)
 @validate_response(schemas.Post, 201)
-@atomic()
 @login_required
+@atomic()
 async def create(data: schemas.PostCreate) -> schemas.Post:
     return await actions.post.create(await current_user.get_user(), data), 201
 
@@ -20,7 +24,6 @@ async def create(data: schemas.PostCreate) -> schemas.Post:
 @blueprint.get("/<int:id>")
 @validate_querystring(schemas.PostGetOptions)
 @validate_response(schemas.Post, 200)
-@atomic()
 @login_required
 async def read(id: int, query_args: schemas.PostGetOptions) -> schemas.Post:
     return (
@@ -34,7 +37,6 @@ async def read(id: int, query_args: schemas.PostGetOptions) -> schemas.Post:
 @blueprint.get("")
 @validate_querystring(schemas.PostQueryString)
 @validate_response(schemas.PostResultSet, 200)
-@atomic()
 @login_required
 async def read_many(query_args: schemas.PostQueryString) -> schemas.PostResultSet:
     return await actions.post.query(
@@ -45,7 +47,6 @@ async def read_many(query_args: schemas.PostQueryString) -> schemas.PostResultSe
 @blueprint.patch("/<int:id>")
 @validate_request(schemas.PostPatch)
 @validate_response(schemas.Post, 200)
-@atomic()
 @login_required
 async def update(id: int, data: schemas.PostPatch) -> schemas.Post:
     return await actions.post.update(await current_user.get_user(), id, data)
@@ -53,7 +54,6 @@ async def update(id: int, data: schemas.PostPatch) -> schemas.Post:
 
 @blueprint.delete("/<int:id>")
 @validate_response(schemas.DeleteConfirmed, 200)
-@atomic()
 @login_required
 async def delete(id: int) -> schemas.DeleteConfirmed:
     await actions.post.delete(await current_user.get_user(), id)
@@ -63,16 +63,16 @@ async def delete(id: int) -> schemas.DeleteConfirmed:
 
 @blueprint.put("/<int:id>/like")
 @validate_response(schemas.PostLike, 200)
-@atomic()
 @login_required
+@atomic()
 async def like(id: int) -> schemas.PostLike:
     return await actions.post.like(await current_user.get_user(), id)
 
 
 @blueprint.delete("/<int:id>/like")
 @validate_response(schemas.DeleteConfirmed, 200)
-@atomic()
 @login_required
+@atomic()
 async def unlike(id: int) -> schemas.PostLike:
     await actions.post.unlike(await current_user.get_user(), id)
 
@@ -0,0 +1,18 @@
+from quart import Blueprint
+from quart_auth import current_user, login_required
+from quart_schema import validate_querystring
+
+from score_keeper import actions, schemas
+from score_keeper.lib.serialization import validate_response
+
+blueprint = Blueprint("standing", __name__)
+
+
+@blueprint.get("")
+@validate_querystring(schemas.StandingQueryString)
+@validate_response(schemas.StandingResultSet, 200)
+@login_required
+async def read_many(
+    query_args: schemas.StandingQueryString,
+) -> schemas.StandingResultSet:
+    return await actions.standing.query(await current_user.get_user(), query_args)
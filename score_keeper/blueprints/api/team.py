@@ -1,27 +1,47 @@
 from quart import Blueprint
 from quart_auth import current_user, login_required
-from quart_schema import validate_querystring, validate_request, validate_response
-from tortoise.transactions import atomic
+from quart_schema import validate_querystring
 
 from score_keeper import actions, schemas
+from score_keeper.lib.conditional import conditional
+from score_keeper.lib.serialization import validate_request, validate_response
 
 blueprint = Blueprint("team", __name__)
 
+# no @atomic() on the routes changing teams: the actions commit their own
+# transaction before invalidating the team directory
+
 
 @blueprint.post("")
 @validate_request(schemas.TeamCreate)
 @validate_response(schemas.Team, 201)
-@atomic()
 @login_required
 async def create(data: schemas.TeamCreate) -> schemas.Team:
     return await actions.team.create(await current_user.get_user(), data), 201
 
 
+@blueprint.post("/bulk")
+@validate_request(schemas.TeamBulkCreate)
+@validate_response(schemas.TeamBulkResult, 201)
+@login_required
+async def create_many(data: schemas.TeamBulkCreate) -> schemas.TeamBulkResult:
+    return (
+        await actions.team.create_many(await current_user.get_user(), data),
+        201,
+    )
+
+
+async def read_version(id: int, query_args: schemas.TeamGetOptions):
+    return await actions.team.version(
+        await current_user.get_user(), id=id, options=query_args
+    )
+
+
 @blueprint.get("/<int:id>")
 @validate_querystring(schemas.TeamGetOptions)
 @validate_response(schemas.Team, 200)
-@atomic()
 @login_required
+@conditional(read_version)
 async def read(id: int, query_args: schemas.TeamGetOptions) -> schemas.Team:
     return (
         await actions.team.get(
@@ -31,11 +51,27 @@ async def read(id: int, query_args: schemas.TeamGetOptions) -> schemas.Team:
     )
 
 
+@blueprint.get("/autocomplete")
+@validate_querystring(schemas.TeamAutocompleteQueryString)
+@validate_response(schemas.TeamOptionResultSet, 200)
+@login_required
+async def autocomplete(
+    query_args: schemas.TeamAutocompleteQueryString,
+) -> schemas.TeamOptionResultSet:
+    return await actions.team.autocomplete(await current_user.get_user(), query_args)
+
+
+async def read_many_version(query_args: schemas.TeamQueryString):
+    return await actions.team.query_version(
+        await current_user.get_user(), query_args.to_query()
+    )
+
+
 @blueprint.get("")
 @validate_querystring(schemas.TeamQueryString)
 @validate_response(schemas.TeamResultSet, 200)
-@atomic()
 @login_required
+@conditional(read_many_version)
 async def read_many(query_args: schemas.TeamQueryString) -> schemas.TeamResultSet:
     return await actions.team.query(
         await current_user.get_user(), query_args.to_query()
@@ -45,15 +81,21 @@ async def read_many(query_args: schemas.TeamQueryString) -> schemas.TeamResultSe
 @blueprint.patch("/<int:id>")
 @validate_request(schemas.TeamPatch)
 @validate_response(schemas.Team, 200)
-@atomic()
 @login_required
 async def update(id: int, data: schemas.TeamPatch) -> schemas.Team:
     return await actions.team.update(await current_user.get_user(), id, data)
 
 
+@blueprint.patch("/bulk")
+@validate_request(schemas.TeamBulkPatch)
+@validate_response(schemas.TeamBulkResult, 200)
+@login_required
+async def update_many(data: schemas.TeamBulkPatch) -> schemas.TeamBulkResult:
+    return await actions.team.update_many(await current_user.get_user(), data)
+
+
 @blueprint.delete("/<int:id>")
 @validate_response(schemas.DeleteConfirmed, 200)
-@atomic()
 @login_required
 async def delete(id: int) -> schemas.DeleteConfirmed:
     await actions.team.delete(await current_user.get_user(), id)
@@ -1,9 +1,10 @@
 from quart import Blueprint, current_app
 from quart_auth import current_user, login_required
-from quart_schema import validate_querystring, validate_request, validate_response
+from quart_schema import validate_querystring
 from tortoise.transactions import atomic
 
 from score_keeper import actions, enums, schemas
+from score_keeper.lib.serialization import validate_request, validate_response
 
 blueprint = Blueprint("token", __name__)
 
@@ -11,8 +12,8 @@ blueprint = Blueprint("token", __name__)
 @blueprint.post("")
 @validate_request(schemas.TokenCreate)
 @validate_response(schemas.TokenCreateSuccess, 200)
-@atomic()
 @login_required
+@atomic()
 async def create(data: schemas.TokenCreate) -> schemas.TokenCreateSuccess:
     user = await current_user.get_user()
     token = await actions.token.create(user, enums.TokenType.API, data)
@@ -25,7 +26,6 @@ async def create(data: schemas.TokenCreate) -> schemas.TokenCreateSuccess:
 @blueprint.get("/<int:id>")
 @validate_querystring(schemas.TokenGetOptions)
 @validate_response(schemas.Token, 200)
-@atomic()
 @login_required
 async def read(id: int, query_args: schemas.TokenGetOptions) -> schemas.Token:
     return (
@@ -39,7 +39,6 @@ async def read(id: int, query_args: schemas.TokenGetOptions) -> schemas.Token:
 @blueprint.get("")
 @validate_querystring(schemas.TokenQueryString)
 @validate_response(schemas.TokenResultSet, 200)
-@atomic()
 @login_required
 async def read_many(query_args: schemas.TokenQueryString) -> schemas.TokenResultSet:
     return await actions.token.query(
@@ -50,7 +49,7 @@ async def read_many(query_args: schemas.TokenQueryString) -> schemas.TokenResult
 @blueprint.patch("/<int:id>")
 @validate_request(schemas.TokenPatch)
 @validate_response(schemas.Token, 200)
-@atomic()
 @login_required
+@atomic()
 async def update(id: int, data: schemas.TokenPatch) -> schemas.Token:
     return await actions.token.update(await current_user.get_user(), id, data)
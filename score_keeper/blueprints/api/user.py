@@ -1,9 +1,10 @@
 from quart import Blueprint
 from quart_auth import current_user, login_required
-from quart_schema import validate_querystring, validate_request, validate_response
+from quart_schema import validate_querystring
 from tortoise.transactions import atomic
 
 from score_keeper import actions, schemas
+from score_keeper.lib.serialization import validate_request, validate_response
 
 blueprint = Blueprint("user", __name__)
 
@@ -11,8 +12,8 @@ blueprint = Blueprint("user", __name__)
 @blueprint.post("")
 @validate_request(schemas.UserCreate)
 @validate_response(schemas.User, 200)
-@atomic()
 @login_required
+@atomic()
 async def create(data: schemas.UserCreate) -> schemas.User:
     return await actions.user.create(await current_user.get_user(), data)
 
@@ -20,7 +21,6 @@ async def create(data: schemas.UserCreate) -> schemas.User:
 @blueprint.get("/<int:id>")
 @validate_querystring(schemas.UserGetOptions)
 @validate_response(schemas.User, 200)
-@atomic()
 @login_required
 async def read(id: int, query_args: schemas.UserGetOptions) -> schemas.User:
     return (
@@ -34,7 +34,6 @@ async def read(id: int, query_args: schemas.UserGetOptions) -> schemas.User:
 @blueprint.get("")
 @validate_querystring(schemas.UserQueryString)
 @validate_response(schemas.UserResultSet, 200)
-@atomic()
 @login_required
 async def read_many(query_args: schemas.UserQueryString) -> schemas.UserResultSet:
     return await actions.user.query(
@@ -42,10 +41,11 @@ async def read_many(query_args: schemas.UserQueryString) -> schemas.UserResultSe
     )
 
 
+# no @atomic() here: the action's single save commits before the cached user is
+# invalidated, so no request can cache the old row again
 @blueprint.patch("/<int:id>")
 @validate_request(schemas.UserPatch)
 @validate_response(schemas.User, 200)
-@atomic()
 @login_required
 async def update(id: int, data: schemas.UserPatch) -> schemas.User:
     return await actions.user.update(await current_user.get_user(), id, data)
@@ -1,5 +1,4 @@
 import asyncio
-import json
 
 from quart import (
     Blueprint,
@@ -41,5 +40,5 @@ async def ws() -> None:
             await mm.send_message(
                 "message",
                 message,
-                data=json.loads(schemas.UserPublic.model_dump_json(user)),
+                data=schemas.UserPublic.model_dump(user, mode="json"),
             )
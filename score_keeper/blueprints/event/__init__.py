@@ -13,16 +13,21 @@ from score_keeper import actions, enums, schemas
 from score_keeper.lib.auth import Forbidden
 from score_keeper.lib.error import ActionError
 from score_keeper.lib.message_manager import MessageManager
+from score_keeper.lib.page_cache import cache_page
 
 blueprint = Blueprint("event", __name__, template_folder="templates")
 
 
 @blueprint.route("/")
 @validate_querystring(schemas.EventQueryString)
+@cache_page("event")
 async def index(query_args: schemas.EventQueryString):
     user = await current_user.get_user()
     resultset = await actions.event.query(
-        user, query_args.to_query(resolves=["created_by", "away_team", "home_team"])
+        user,
+        query_args.to_query(
+            resolves=["created_by", "away_team", "home_team"], fields=[]
+        ),
     )
 
     subtab = query_args.status
@@ -35,6 +40,7 @@ async def index(query_args: schemas.EventQueryString):
 
 
 @blueprint.route("/<int:id>")
+@cache_page("event", "id")
 async def view(id: int):
     user = await current_user.get_user()
     event = await actions.event.get(
@@ -84,14 +90,11 @@ async def update(id: int):
 
     modal = 1 if "modal" in request.args else None
 
-    query_args = schemas.TeamQueryString(pp=100)
-    team_rs = await actions.team.query(user, query_args.to_query())
-
     return await render_template(
         "event/update.html",
         event=event,
         status_options=[(x.value.title(), x.value) for x in enums.EventStatus],
-        team_options=[(t.name, t.id) for t in team_rs.teams],
+        team_options=[(t.name, t.id) for t in await actions.team.team_options(user)],
         r=url_for(".view", id=event.id),
         tab="event",
         base_template="modal_base.html" if modal else None,
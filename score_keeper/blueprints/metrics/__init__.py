@@ -0,0 +1,19 @@
+from quart import Blueprint, current_app, request
+
+from score_keeper.lib import metrics
+from score_keeper.lib.auth import Forbidden
+
+blueprint = Blueprint("metrics", __name__)
+
+
+@blueprint.route("")
+async def index():
+    token = current_app.config["METRICS_TOKEN"]
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        raise Forbidden()
+
+    return (
+        metrics.render(await current_app.request_metrics.collect()),
+        200,
+        {"Content-Type": "text/plain; version=0.0.4"},
+    )
@@ -12,6 +12,8 @@ from score_keeper import actions, enums, schemas
 from score_keeper.lib.auth import Forbidden
 from score_keeper.lib.error import ActionError
 from score_keeper.lib.message_manager import MessageManager
+from score_keeper.lib.page_cache import cache_page
+from score_keeper.lib.rendering import render_markdown
 
 blueprint = Blueprint("post", __name__, template_folder="templates")
 
@@ -22,7 +24,9 @@ async def index(query_args: schemas.PostQueryString):
     if not query_args.status:
         return redirect(url_for(".index", status=enums.PostStatus.PUBLISHED))
     user = await current_user.get_user()
-    resultset = await actions.post.query(user, query_args.to_query(resolves=["author"]))
+    resultset = await actions.post.query(
+        user, query_args.to_query(resolves=["author"], fields=[])
+    )
 
     subtab = query_args.status
     if query_args.author_id == user.id:
@@ -34,6 +38,7 @@ async def index(query_args: schemas.PostQueryString):
 
 
 @blueprint.route("/<int:id>")
+@cache_page("post", "id")
 async def view(id: int):
     user = await current_user.get_user()
     post = await actions.post.get(
@@ -47,11 +52,9 @@ async def view(id: int):
             raise
         post_like = None
 
-    await actions.post.view(user, id)
-    post.viewed += 1  # make sure the user sees their view
-
-    mm = MessageManager(user, f"post-{id}")
-    await mm.send_message("view", f"User {user.id} viewed page", post.viewed)
+    # posts written before content was rendered on write, see render-posts
+    if post.content_html is None:
+        post.content_html = await render_markdown(post.content)
 
     can_edit = actions.post.has_permission(user, post, enums.Permission.UPDATE)
 
@@ -60,6 +63,28 @@ async def view(id: int):
     )
 
 
+@blueprint.post("/<int:id>/view")
+async def count_view(id: int):
+    """
+    Count a view of a post, posted by the post page so cached pages count too.
+    Returns the views of the post.
+    """
+    user = await current_user.get_user()
+    post = await actions.post.get(
+        user, id=id, options=schemas.PostGetOptions(fields=["viewed"])
+    )
+
+    # add the views that haven't been written yet, including this one and those
+    # of a flush in progress
+    post.viewed += await actions.post.view(user, id)
+
+    if await current_app.view_counter.should_broadcast(id):
+        mm = MessageManager(user, f"post-{id}")
+        await mm.send_message("view", f"User {user.id} viewed page", post.viewed)
+
+    return {"viewed": post.viewed}
+
+
 @blueprint.route("/create/")
 @login_required
 async def create():
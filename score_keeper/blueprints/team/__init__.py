@@ -22,7 +22,7 @@ blueprint = Blueprint("team", __name__, template_folder="templates")
 async def index(query_args: schemas.TeamQueryString):
     user = await current_user.get_user()
     resultset = await actions.team.query(
-        user, query_args.to_query(resolves=["created_by"])
+        user, query_args.to_query(resolves=["created_by"], fields=[])
     )
 
     can_edit = {}
@@ -1,2 +1,719 @@
+import asyncio
+import json
+import time
+import uuid
+
+import click
+from quart import current_app
+from tortoise import Tortoise, connections
+from tortoise.expressions import F, Q
+from tortoise.transactions import in_transaction
+
+from score_keeper import actions, enums, models, schemas
+from score_keeper.lib import serialization
+from score_keeper.lib.db_client import InstrumentedAsyncpgDBClient
+from score_keeper.lib.query_log import count_queries
+from score_keeper.lib.view_counter import ViewCounter
+
+
+class Rollback(Exception):
+    pass
+
+
+async def run_with_tortoise(coro_func, *args, **kwargs):
+    await Tortoise.init(config=current_app.config["TORTOISE_ORM"])
+    try:
+        return await coro_func(*args, **kwargs)
+    finally:
+        await Tortoise.close_connections()
+
+
+async def seed_explain_data(conn, num_users, num_teams, num_events, num_posts, scores):
+    tag = uuid.uuid4().hex[:8]
+
+    await conn.execute_query(
+        """
+        INSERT INTO "user" (email, name, status, role)
+        SELECT 'explain-' || $1 || '-' || g || '@example.com', 'explain', 'active', 'user'
+        FROM generate_series(1, $2) g""",
+        [tag, num_users],
+    )
+    user_ids = [
+        x["id"]
+        for x in await conn.execute_query_dict(
+            """SELECT id FROM "user" WHERE email LIKE 'explain-' || $1 || '-%'""",
+            [tag],
+        )
+    ]
+
+    await conn.execute_query(
+        """
+        INSERT INTO "team" (name, created_by_id)
+        SELECT 'Team ' || g, $1 FROM generate_series(1, $2) g""",
+        [user_ids[0], num_teams],
+    )
+    first_team_id = (
+        await conn.execute_query_dict(
+            'SELECT min(id) AS id FROM "team" WHERE created_by_id = $1', [user_ids[0]]
+        )
+    )[0]["id"]
+
+    await conn.execute_query(
+        """
+        INSERT INTO "event" (
+            status, season, period, away_team_id, away_score, home_team_id,
+            home_score, created_by_id, datetime, created_at, modified_at
+        )
+        SELECT
+            CASE
+                WHEN g % 50 = 0 THEN 'in-progress'
+                WHEN g % 10 = 0 THEN 'not-started'
+                ELSE 'ended'
+            END,
+            2020 + g % 5,
+            1 + g % 4,
+            $1 + g % $2,
+            g % 7,
+            $1 + (g + 1) % $2,
+            g % 5,
+            $3,
+            now() - g * interval '10 minutes',
+            now() - g * interval '11 minutes',
+            now() - g * interval '9 minutes'
+        FROM generate_series(1, $4) g""",
+        [first_team_id, num_teams, user_ids[0], num_events],
+    )
+
+    await conn.execute_query(
+        """
+        INSERT INTO "eventscore" (
+            event_id, away_delta, home_delta, away_score, home_score, created_at
+        )
+        SELECT e.id, s % 2, 1 - s % 2, s / 2, s - s / 2, e.datetime + s * interval '1 minute'
+        FROM "event" e CROSS JOIN generate_series(1, $2) s
+        WHERE e.created_by_id = $1""",
+        [user_ids[0], scores],
+    )
+
+    await conn.execute_query(
+        """
+        INSERT INTO "post" (
+            title, content, status, published_at, viewed, author_id,
+            created_at, modified_at
+        )
+        SELECT
+            'Post ' || g,
+            repeat('lorem ipsum ', 20),
+            CASE WHEN g % 4 = 0 THEN 'draft' ELSE 'published' END,
+            CASE WHEN g % 4 = 0 THEN NULL ELSE now() - g * interval '1 hour' END,
+            0,
+            ($1::int[])[1 + g % array_length($1::int[], 1)],
+            now() - g * interval '2 hours',
+            now() - g * interval '2 hours'
+        FROM generate_series(1, $2) g""",
+        [user_ids, num_posts],
+    )
+
+    await conn.execute_script('ANALYZE "user", "team", "event", "eventscore", "post";')
+
+    return user_ids
+
+
+async def explain(conn, label, queryset):
+    rows = await conn.execute_query_dict(
+        f"EXPLAIN (ANALYZE, FORMAT JSON) {queryset.sql()}"
+    )
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    nodes = []
+    stack = [plan[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        nodes.append(
+            f"{node['Node Type']} ({node['Index Name']})"
+            if "Index Name" in node
+            else node["Node Type"]
+        )
+        stack.extend(reversed(node.get("Plans", [])))
+
+    click.echo(
+        f"{label:<60} {plan[0]['Execution Time']:>9.3f} ms  {' > '.join(nodes)}"
+    )
+
+
+async def explain_queries(num_users, num_teams, num_events, num_posts, scores, pp):
+    try:
+        async with in_transaction() as conn:
+            user_ids = await seed_explain_data(
+                conn, num_users, num_teams, num_events, num_posts, scores
+            )
+
+            for status in [None, *enums.EventStatus]:
+                for sort in schemas.EventQueryStringSort:
+                    q = schemas.EventQueryString(sort=sort, status=status, pp=pp)
+                    queryset, _ = await q.to_query().apply(models.Event.all())
+                    await explain(
+                        conn, f"event status={status or '*'} sort={sort}", queryset
+                    )
+
+            event = await models.Event.filter(created_by_id=user_ids[0]).first()
+            await explain(
+                conn,
+                "eventscore event_id=? sort=created_at",
+                models.EventScore.filter(event_id=event.id).order_by("created_at"),
+            )
+
+            for status in [None, *enums.PostStatus]:
+                for sort in schemas.PostQueryStringSort:
+                    q = schemas.PostQueryString(sort=sort, status=status, pp=pp)
+                    # same visibility filter actions.post.query applies to non-admins
+                    qs = models.Post.filter(
+                        Q(_status=enums.PostStatus.PUBLISHED) | Q(author_id=user_ids[1])
+                    )
+                    queryset, _ = await q.to_query().apply(qs)
+                    await explain(
+                        conn, f"post status={status or '*'} sort={sort}", queryset
+                    )
+
+            raise Rollback()
+    except Rollback:
+        pass
+
+
+async def timed(label, iterations, func):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await func()
+    elapsed = (time.perf_counter() - start) / iterations
+
+    click.echo(f"{label:<50} {elapsed * 1000:>9.3f} ms  {1 / elapsed:>9.1f} /s")
+
+
+async def bench_list(num_users, num_teams, num_events, num_posts, pp, iterations):
+    try:
+        async with in_transaction() as conn:
+            await seed_explain_data(
+                conn, num_users, num_teams, num_events, num_posts, scores=0
+            )
+            admin = schemas.User.system_user()
+
+            lists = [
+                (
+                    "event",
+                    models.Event,
+                    schemas.Event,
+                    actions.event.query,
+                    schemas.EventQueryString(
+                        pp=pp, resolves=["away_team", "home_team"]
+                    ),
+                ),
+                (
+                    "post",
+                    models.Post,
+                    schemas.Post,
+                    actions.post.query,
+                    schemas.PostQueryString(pp=pp, resolves=["author"]),
+                ),
+                (
+                    "team",
+                    models.Team,
+                    schemas.Team,
+                    actions.team.query,
+                    schemas.TeamQueryString(pp=pp),
+                ),
+            ]
+
+            for name, model, schema, query, qs in lists:
+                q = qs.to_query()
+                queryset, _ = await q.apply(model.all())
+                rows = await queryset
+
+                async def validate(schema=schema, rows=rows):
+                    return len([schema.model_validate(x) for x in rows])
+
+                async def from_db(schema=schema, rows=rows):
+                    return len([schema.from_db(x) for x in rows])
+
+                async def action(query=query, q=q):
+                    return len((await query(admin, q)).model_dump_json())
+
+                click.echo(f"{name} ({len(rows)} rows)")
+                await timed("  model_validate", iterations, validate)
+                await timed("  from_db", iterations, from_db)
+                await timed("  query + model_dump_json", iterations, action)
+
+            raise Rollback()
+    except Rollback:
+        pass
+
+
+async def check_scoring(scorers, points):
+    user = await models.User.create(
+        email=f"check-scoring-{uuid.uuid4().hex[:8]}@example.com", name="check"
+    )
+    event = await models.Event.create(season=0, created_by=user)
+    scorer = schemas.User.from_db(user)
+
+    async def score(n):
+        # like the event page and the ESP32 scoreboard, send both absolute scores
+        # from this scorer's copy of the event along with the delta
+        away_score = home_score = 0
+        for i in range(points):
+            if (n + i) % 2:
+                data = schemas.EventScoreCreate(
+                    away_delta=1, away_score=away_score + 1, home_score=home_score
+                )
+            else:
+                data = schemas.EventScoreCreate(
+                    home_delta=1, away_score=away_score, home_score=home_score + 1
+                )
+            result = await actions.event.score(scorer, event.id, data)
+            away_score, home_score = result.away_score, result.home_score
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*[score(n) for n in range(scorers)])
+        elapsed = time.perf_counter() - start
+
+        await event.refresh_from_db()
+        history = await models.EventScore.filter(event_id=event.id).order_by("id")
+
+        errors = []
+        if event.away_score + event.home_score != scorers * points:
+            errors.append(
+                f"final score {event.away_score}-{event.home_score} does not add up "
+                f"to {scorers * points} points"
+            )
+        if len(history) != scorers * points:
+            errors.append(f"{len(history)} score rows for {scorers * points} scores")
+
+        away_score = home_score = 0
+        for x in history:
+            away_score += x.away_delta
+            home_score += x.home_delta
+            if (x.away_score, x.home_score) != (away_score, home_score):
+                errors.append(f"score row {x.id} does not follow from the one before")
+                break
+        if (away_score, home_score) != (event.away_score, event.home_score):
+            errors.append("score deltas do not add up to the final score")
+    finally:
+        await event.delete()
+        await user.delete()
+
+    click.echo(
+        f"{scorers * points} scores from {scorers} scorers in {elapsed:.3f} s, "
+        f"final score {event.away_score}-{event.home_score}"
+    )
+    if errors:
+        raise click.ClickException("; ".join(errors))
+
+
+async def sample_lock_waits(samples, interval=0.005):
+    db = connections.get("default")
+    while True:
+        rows = await db.execute_query_dict(
+            "SELECT count(*) AS n FROM pg_stat_activity"
+            " WHERE wait_event_type = 'Lock' AND datname = current_database()"
+        )
+        samples.append(rows[0]["n"])
+        await asyncio.sleep(interval)
+
+
+async def run_views(label, views, concurrency, view):
+    latencies = []
+    samples = []
+
+    async def worker(n):
+        for _ in range(n):
+            start = time.perf_counter()
+            await view()
+            latencies.append(time.perf_counter() - start)
+
+    sampler = asyncio.create_task(sample_lock_waits(samples))
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[
+            worker(views // concurrency + (1 if i < views % concurrency else 0))
+            for i in range(concurrency)
+        ]
+    )
+    elapsed = time.perf_counter() - start
+    sampler.cancel()
+
+    latencies.sort()
+    click.echo(
+        f"{label:<10} {views / elapsed:>9.1f} views/s"
+        f"  p50 {latencies[len(latencies) // 2] * 1000:>7.2f} ms"
+        f"  p99 {latencies[int(len(latencies) * 0.99)] * 1000:>7.2f} ms"
+        f"  backends waiting on locks {sum(samples) / max(len(samples), 1):.2f}"
+        f" avg, {max(samples, default=0)} max"
+    )
+
+
+async def bench_views(views, concurrency, flush_interval):
+    user = await models.User.create(
+        email=f"bench-views-{uuid.uuid4().hex[:8]}@example.com", name="bench"
+    )
+    post = await models.Post.create(title="bench", content="bench", author=user)
+
+    async def direct_view():
+        # what actions.post.view used to do on every page view
+        async with in_transaction():
+            await models.Post.filter(id=post.id).update(viewed=F("viewed") + 1)
+
+    view_counter = ViewCounter(current_app.redis, flush_interval=flush_interval)
+
+    async def buffered_view():
+        await view_counter.add(post.id)
+
+    try:
+        await run_views("direct", views, concurrency, direct_view)
+
+        view_counter.start()
+        await run_views("buffered", views, concurrency, buffered_view)
+        await view_counter.stop()
+
+        await post.refresh_from_db()
+        if post.viewed != views * 2:
+            raise click.ClickException(
+                f"post has {post.viewed} views, expected {views * 2}"
+            )
+    finally:
+        await post.delete()
+        await user.delete()
+
+
+async def bench_requests(app, iterations):
+    async with app.test_app() as test_app:
+        client = connections.get("default")
+        if not isinstance(client, InstrumentedAsyncpgDBClient):
+            raise click.ClickException(
+                "connection hold times need DB_ENGINE=score_keeper.lib.db_client"
+            )
+        pool = client.pool
+
+        user = await models.User.create(
+            email=f"bench-requests-{uuid.uuid4().hex[:8]}@example.com", name="bench"
+        )
+        token = await actions.token.create(
+            schemas.User.from_db(user),
+            enums.TokenType.API,
+            schemas.TokenCreate(name="bench"),
+        )
+        team = await models.Team.create(name="bench", created_by=user)
+        event = await models.Event.create(season=0, created_by=user)
+
+        auth = {
+            "Authorization": "Bearer "
+            + app.extensions["QUART_AUTH"][0].dump_token(token.auth_id)
+        }
+        cases = [
+            ("GET /api/event", "GET", "/api/event", None, auth),
+            ("GET /api/event/<id>", "GET", f"/api/event/{event.id}", None, auth),
+            ("GET /api/post", "GET", "/api/post", None, auth),
+            ("GET /api/team", "GET", "/api/team", None, auth),
+            ("GET /api/event (anonymous)", "GET", "/api/event", None, {}),
+            ("PATCH /api/team/<id>", "PATCH", f"/api/team/{team.id}", {}, auth),
+            (
+                "PATCH /api/team/<id> (invalid)",
+                "PATCH",
+                f"/api/team/{team.id}",
+                [],
+                auth,
+            ),
+            (
+                "PATCH /api/team/<id> (anonymous)",
+                "PATCH",
+                f"/api/team/{team.id}",
+                {},
+                {},
+            ),
+        ]
+
+        try:
+            client = test_app.test_client()
+            for label, method, path, body, headers in cases:
+                count, total = pool.hold.count, pool.hold.sum
+                start = time.perf_counter()
+                with count_queries() as log:
+                    for _ in range(iterations):
+                        response = await client.open(
+                            path, method=method, json=body, headers=headers
+                        )
+                elapsed = time.perf_counter() - start
+
+                click.echo(
+                    f"{label:<36} {response.status_code}"
+                    f"  {iterations / elapsed:>8.1f} req/s"
+                    f"  {(pool.hold.count - count) / iterations:>5.1f} acquires/req"
+                    f"  {log.count / iterations:>5.1f} queries/req"
+                    f"  {(pool.hold.sum - total) / iterations * 1000:>8.3f} ms held/req"
+                )
+        finally:
+            await event.delete()
+            await team.delete()
+            await user.delete()
+
+
+async def bench_json(app, num_items, iterations):
+    provider = app.json
+    trust = app.config["TRUST_RESPONSE_MODELS"]
+
+    async with app.test_app() as test_app:
+        user = await models.User.create(
+            email=f"bench-json-{uuid.uuid4().hex[:8]}@example.com", name="bench"
+        )
+        token = await actions.token.create(
+            schemas.User.from_db(user),
+            enums.TokenType.API,
+            schemas.TokenCreate(name="bench"),
+        )
+        team = await models.Team.create(name="bench", created_by=user)
+        await models.Event.bulk_create(
+            [
+                models.Event(
+                    season=0, away_team=team, home_team=team, created_by=user
+                )
+                for _ in range(num_items)
+            ]
+        )
+        await models.Post.bulk_create(
+            [
+                models.Post(title="bench", content="bench " * 50, author=user)
+                for _ in range(num_items)
+            ]
+        )
+
+        headers = {
+            "Authorization": "Bearer "
+            + app.extensions["QUART_AUTH"][0].dump_token(token.auth_id)
+        }
+        paths = [
+            f"/api/event?pp={num_items}&created_by_id={user.id}",
+            f"/api/post?pp={num_items}&author_id={user.id}",
+        ]
+
+        try:
+            client = test_app.test_client()
+            for path in paths:
+                click.echo(f"GET {path.split('?')[0]} ({num_items} items)")
+                for name, provider_class in serialization.JSON_PROVIDERS.items():
+                    for trusted in (False, True):
+                        app.json = provider_class(app)
+                        app.config["TRUST_RESPONSE_MODELS"] = trusted
+
+                        # warm up
+                        response = await client.get(path, headers=headers)
+                        body = await response.get_data()
+
+                        start = time.perf_counter()
+                        for _ in range(iterations):
+                            await client.get(path, headers=headers)
+                        elapsed = time.perf_counter() - start
+
+                        label = f"{name}{' trusted' if trusted else ''}"
+                        click.echo(
+                            f"  {label:<16} {response.status_code}"
+                            f"  {iterations / elapsed:>8.1f} req/s"
+                            f"  {elapsed / iterations * 1000:>8.3f} ms/req"
+                            f"  {len(body):>8} bytes"
+                        )
+        finally:
+            app.json = provider
+            app.config["TRUST_RESPONSE_MODELS"] = trust
+            await models.Post.filter(author_id=user.id).delete()
+            await models.Event.filter(created_by_id=user.id).delete()
+            await team.delete()
+            await user.delete()
+
+
+async def rebuild_standings(season):
+    def snapshot(standings):
+        return {
+            (x.season, x.team_id): (
+                x.wins,
+                x.losses,
+                x.ties,
+                x.points_for,
+                x.points_against,
+            )
+            for x in standings
+        }
+
+    qs = (
+        models.Standing.all()
+        if season is None
+        else models.Standing.filter(season=season)
+    )
+
+    before = snapshot(await qs)
+    count = await actions.standing.rebuild(season)
+    after = snapshot(await qs)
+
+    for key in sorted(before.keys() | after.keys()):
+        if before.get(key) != after.get(key):
+            click.echo(
+                f"season {key[0]} team {key[1]}: {before.get(key)} -> {after.get(key)}"
+            )
+
+    click.echo(f"{count} standings rebuilt")
+
+
+async def render_posts(batch_size):
+    count = await actions.post.render_missing(batch_size)
+    click.echo(f"{count} posts rendered")
+
+
+def build_assets():
+    hashed = current_app.assets.build()
+    for filename in hashed:
+        click.echo(filename)
+    click.echo(f"{len(hashed)} assets built in {current_app.assets.build_folder}")
+
+
+async def create_score_partitions():
+    created = await current_app.score_partitions.create()
+    click.echo(f"created {', '.join(created)}" if created else "nothing to create")
+
+
+async def detach_score_partitions(before, tablespace):
+    detached = await current_app.score_partitions.detach(before.date(), tablespace)
+    click.echo(f"detached {', '.join(detached)}" if detached else "nothing to detach")
+
+
 def register_commands(app):
+    @app.cli.command("explain-queries")
+    @click.option("--users", default=100, help="Number of users to seed.")
+    @click.option("--teams", default=200, help="Number of teams to seed.")
+    @click.option("--events", default=100000, help="Number of events to seed.")
+    @click.option("--posts", default=100000, help="Number of posts to seed.")
+    @click.option("--scores", default=10, help="Number of scores per seeded event.")
+    @click.option("--pp", default=10, help="Page size for each query.")
+    def explain_queries_command(users, teams, events, posts, scores, pp):
+        """Seed a large dataset and report EXPLAIN ANALYZE for each list query.
+
+        All seeded rows are rolled back when the command finishes.
+        """
+        asyncio.run(
+            run_with_tortoise(explain_queries, users, teams, events, posts, scores, pp)
+        )
+
+    @app.cli.command("bench-list")
+    @click.option("--users", default=100, help="Number of users to seed.")
+    @click.option("--teams", default=200, help="Number of teams to seed.")
+    @click.option("--events", default=10000, help="Number of events to seed.")
+    @click.option("--posts", default=10000, help="Number of posts to seed.")
+    @click.option("--pp", default=100, help="Page size for each query.")
+    @click.option("--iterations", default=100, help="Runs per measurement.")
+    def bench_list_command(users, teams, events, posts, pp, iterations):
+        """Seed a dataset and time building list responses from database rows.
+
+        All seeded rows are rolled back when the command finishes.
+        """
+        asyncio.run(
+            run_with_tortoise(bench_list, users, teams, events, posts, pp, iterations)
+        )
+
+    @app.cli.command("check-scoring")
+    @click.option("--scorers", default=20, help="Number of parallel scorers.")
+    @click.option("--points", default=10, help="Number of scores per scorer.")
+    def check_scoring_command(scorers, points):
+        """Score one event from many parallel scorers and check the final score.
+
+        The event and its scores are deleted when the command finishes.
+        """
+        asyncio.run(run_with_tortoise(check_scoring, scorers, points))
+
+    @app.cli.command("bench-views")
+    @click.option("--views", default=5000, help="Number of views per run.")
+    @click.option("--concurrency", default=50, help="Number of parallel viewers.")
+    @click.option("--flush-interval", default=1.0, help="Seconds between flushes.")
+    def bench_views_command(views, concurrency, flush_interval):
+        """View one post from many parallel viewers, first updating the row on
+        every view and then through the buffered view counter, and compare
+        throughput and lock waits.
+
+        The post is deleted when the command finishes.
+        """
+        asyncio.run(run_with_tortoise(bench_views, views, concurrency, flush_interval))
+
+    @app.cli.command("bench-requests")
+    @click.option("--iterations", default=200, help="Requests per request type.")
+    def bench_requests_command(iterations):
+        """Send API requests through the test client and report how long each
+        request type holds database connections.
+
+        The rows the requests need are deleted when the command finishes.
+        """
+        asyncio.run(bench_requests(app, iterations))
+
+    @app.cli.command("bench-json")
+    @click.option("--items", default=100, help="Number of items per page.")
+    @click.option("--iterations", default=200, help="Requests per measurement.")
+    def bench_json_command(items, iterations):
+        """Compare the throughput of GET /api/event and /api/post with pages of
+        --items items (pp=100 by default) with each JSON provider of
+        lib.serialization, with and without TRUST_RESPONSE_MODELS.
+
+        The rows the requests need are deleted when the command finishes.
+        """
+        asyncio.run(bench_json(app, items, iterations))
+
+    @app.cli.command("rebuild-standings")
+    @click.option("--season", type=int, help="Season to rebuild, default all.")
+    def rebuild_standings_command(season):
+        """Recompute season standings from the events, reporting every team
+        whose standing was wrong.
+        """
+        asyncio.run(run_with_tortoise(rebuild_standings, season))
+
+    @app.cli.command("render-posts")
+    @click.option("--batch-size", default=100, help="Posts read per query.")
+    def render_posts_command(batch_size):
+        """Render the content of the posts saved before rendered HTML was
+        stored with them.
+
+        Posts not rendered yet are rendered on every view until then.
+        """
+        asyncio.run(run_with_tortoise(render_posts, batch_size))
+
+    @app.cli.command("build-assets")
+    def build_assets_command():
+        """Copy the static files under names holding a hash of their content,
+        with gzip and brotli variants, for browsers to cache them forever.
+
+        Run before starting the app; url_for("static", ...) links to the hashed
+        files built when it starts.  `python score_keeper/lib/assets.py` does
+        the same without the app's environment, e.g. in the Docker image.
+        """
+        build_assets()
+
+    @app.cli.command("create-score-partitions")
+    def create_score_partitions_command():
+        """Create the missing monthly eventscore partitions up to
+        SCORE_PARTITION_MONTHS_AHEAD months ahead.
+
+        The app also does this every SCORE_PARTITION_CHECK_INTERVAL seconds.
+        """
+        asyncio.run(run_with_tortoise(create_score_partitions))
+
+    @app.cli.command("detach-score-partitions")
+    @click.option(
+        "--before",
+        required=True,
+        type=click.DateTime(formats=["%Y-%m"]),
+        help="First month to keep attached, e.g. 2024-01.",
+    )
+    @click.option("--tablespace", help="Tablespace to move detached partitions to.")
+    def detach_score_partitions_command(before, tablespace):
+        """Detach the eventscore partitions of months before --before, e.g. to
+        archive past seasons.
+
+        The detached tables keep their rows.  Live games write to the current
+        partition and are not blocked.
+        """
+        asyncio.run(run_with_tortoise(detach_score_partitions, before, tablespace))
+
     return app
@@ -0,0 +1,158 @@
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+from typing import Dict, List, Optional
+
+import brotli
+from quart import Response, request, send_from_directory
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+
+# files worth compressing, the others (e.g. images) are compressed already
+COMPRESSED_TYPES = {".css", ".js", ".json", ".svg", ".txt", ".html"}
+
+# (content encoding, suffix of the precompressed file) by preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def fingerprint(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+
+class Assets:
+    def __init__(self, static_folder: str, build_folder: str):
+        """
+        Static files copied under names holding a hash of their content, so they
+        can be cached by browsers forever, along with gzip and brotli variants
+        served to the browsers accepting them.  `url_for("static", ...)` is
+        rewritten to the hashed names once `build` has been run, e.g. with the
+        build-assets command; until then the files are served as they are.
+
+        Args:
+            static_folder (str): Folder of the static files.
+            build_folder (str): Folder the hashed files and manifest are built in.
+        """
+        self.static_folder = static_folder
+        self.build_folder = build_folder
+        # file name -> hashed file name
+        self.manifest: Dict[str, str] = {}
+        self.hashed: Dict[str, str] = {}
+
+    def load(self) -> None:
+        """
+        Reads the manifest of the last build, if any.
+        """
+        try:
+            with open(os.path.join(self.build_folder, MANIFEST), encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except FileNotFoundError:
+            self.manifest = {}
+        except ValueError:
+            logger.warning("Invalid asset manifest, serving unhashed files")
+            self.manifest = {}
+
+        self.hashed = {v: k for k, v in self.manifest.items()}
+
+    def build(self) -> List[str]:
+        """
+        Replaces the build folder with hashed and compressed copies of the static
+        files, and returns the hashed file names.
+        """
+        manifest = {}
+        shutil.rmtree(self.build_folder, ignore_errors=True)
+
+        for root, _, files in os.walk(self.static_folder):
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, self.static_folder).replace(
+                    os.sep, "/"
+                )
+                base, ext = os.path.splitext(filename)
+                hashed = f"{base}.{fingerprint(path)}{ext}"
+
+                dest = os.path.join(self.build_folder, hashed)
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                shutil.copyfile(path, dest)
+
+                if ext in COMPRESSED_TYPES:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                    # mtime=0 so a rebuild of the same file gives the same bytes
+                    with open(dest + ".gz", "wb") as f:
+                        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+                    with open(dest + ".br", "wb") as f:
+                        f.write(brotli.compress(data))
+
+                manifest[filename] = hashed
+
+        with open(
+            os.path.join(self.build_folder, MANIFEST), "w", encoding="utf-8"
+        ) as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+        self.manifest = manifest
+        self.hashed = {v: k for k, v in manifest.items()}
+
+        return sorted(manifest.values())
+
+    def url_defaults(self, endpoint: str, values: dict) -> None:
+        """
+        Rewrites `url_for("static", filename=...)` to the hashed file name.
+        """
+        if endpoint == "static" and values.get("filename") in self.manifest:
+            values["filename"] = self.manifest[values["filename"]]
+
+    async def send(self, filename: str) -> Optional[Response]:
+        """
+        Returns the response for a hashed file, precompressed when the browser
+        accepts it, or None for other files.
+
+        Args:
+            filename (str): Hashed file name.
+        """
+        if filename not in self.hashed:
+            return None
+
+        mimetype = mimetypes.guess_type(filename)[0]
+        encoding = None
+        name = filename
+        for x, suffix in ENCODINGS:
+            if x in request.accept_encodings and os.path.exists(
+                os.path.join(self.build_folder, filename + suffix)
+            ):
+                encoding = x
+                name = filename + suffix
+                break
+
+        response = await send_from_directory(
+            self.build_folder, name, mimetype=mimetype
+        )
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        response.headers["Cache-Control"] = IMMUTABLE
+
+        return response
+
+
+if __name__ == "__main__":
+    # the build-assets command without the app, whose settings need the runtime
+    # environment, e.g. to build the assets into a Docker image:
+    #   python score_keeper/lib/assets.py
+    package_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assets = Assets(
+        os.path.join(package_folder, "static"),
+        os.environ.get("STATIC_BUILD_FOLDER")
+        or os.path.join(package_folder, "static-build"),
+    )
+    built = assets.build()
+    print(f"{len(built)} assets built in {assets.build_folder}")
@@ -0,0 +1,268 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Optional, Tuple, get_type_hints
+
+import redis.asyncio as aioredis
+from pydantic_core import to_jsonable_python
+from quart import current_app
+
+from .websocket import WebsocketManager
+
+logger = logging.getLogger(__name__)
+
+INVALIDATE_CHANNEL = "cache:invalidate"
+GENERATION_KEY = "cache-generation:{}"
+KEY = "cache:{}:{}:{}"
+
+
+class Cache:
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        socket_manager: WebsocketManager,
+        max_entries: int = 1000,
+        ttl: float = 300,
+        local_ttl: float = 30,
+        generation_ttl: float = 86400,
+    ):
+        """
+        Two tier cache of serialized action results: a bounded LRU in each
+        process in front of Redis, shared by all of them.  Entries are grouped in
+        namespaces (e.g. one per model) that are invalidated as a whole.
+
+        Invalidating a namespace gives it a new generation in Redis, which is
+        part of every key, and broadcasts the new generation over the websocket
+        pubsub connection so each process drops its copies.  A process that
+        missed the broadcast still picks up the generation after `local_ttl`
+        seconds.  Generations are the time of the invalidation, so one is never
+        reused once its key expires, `generation_ttl` seconds after the last
+        invalidation of the namespace.
+
+        Args:
+            redis (aioredis.Redis): Redis connection holding the shared tier.
+            socket_manager (WebsocketManager): Manager of the pubsub connection
+                invalidations are broadcast on.
+            max_entries (int): Entries, and generations of namespaces, kept in the
+                LRU of each process.
+            ttl (float): Default seconds an entry is kept in Redis.
+            local_ttl (float): Seconds an entry or a generation is kept in the
+                LRU of a process.
+            generation_ttl (float): Seconds the generation of a namespace is kept
+                in Redis after its last invalidation.  Must be longer than any
+                entry is kept, including `ttl` and `local_ttl`, or entries from
+                before the invalidation are read again once it expires.
+        """
+        self.redis = redis
+        self.socket_manager = socket_manager
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.generation_ttl = generation_ttl
+        # (namespace, generation, key) -> (expires at, data)
+        self.entries: OrderedDict[Tuple[str, int, str], Tuple[float, str]] = (
+            OrderedDict()
+        )
+        # namespace -> (expires at, generation)
+        self.generations: OrderedDict[str, Tuple[float, int]] = OrderedDict()
+
+    async def generation(self, namespace: str) -> int:
+        expires_at, generation = self.generations.get(namespace, (0, 0))
+        if expires_at >= time.monotonic():
+            self.generations.move_to_end(namespace)
+        else:
+            generation = int(
+                await self.redis.get(GENERATION_KEY.format(namespace)) or 0
+            )
+            self.set_generation(namespace, generation)
+        return generation
+
+    def set_generation(self, namespace: str, generation: int) -> None:
+        self.generations[namespace] = (time.monotonic() + self.local_ttl, generation)
+        self.generations.move_to_end(namespace)
+        # e.g. the page namespaces, one per event
+        if len(self.generations) > self.max_entries:
+            self.generations.popitem(last=False)
+
+    async def get(
+        self, namespace: str, generation: int, key: str, ttl: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Returns the data cached for `key`, from this process when it can.
+
+        Args:
+            namespace (str): Namespace of the entry.
+            generation (int): Current generation of the namespace.
+            key (str): Key of the entry in the namespace.
+            ttl (Optional[float]): Seconds the entry is kept in Redis when not the
+                default, which also bounds how long this process keeps it.
+        """
+        local_key = (namespace, generation, key)
+        entry = self.entries.get(local_key)
+        if entry is not None:
+            if entry[0] >= time.monotonic():
+                self.entries.move_to_end(local_key)
+                return entry[1]
+            del self.entries[local_key]
+
+        data = await self.redis.get(KEY.format(namespace, generation, key))
+        if data is None:
+            return None
+
+        data = data.decode()
+        self.set_local(local_key, data, ttl)
+        return data
+
+    async def set(
+        self,
+        namespace: str,
+        generation: int,
+        key: str,
+        data: str,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Caches `data` in both tiers.  Data read before an invalidation is cached
+        under the old generation, where it's never read again.
+
+        Args:
+            namespace (str): Namespace of the entry.
+            generation (int): Generation of the namespace when the data was read.
+            key (str): Key of the entry in the namespace.
+            data (str): Serialized data.
+            ttl (Optional[float]): Seconds to keep the entry in Redis instead of
+                the default.
+        """
+        self.set_local((namespace, generation, key), data, ttl)
+        await self.redis.set(
+            KEY.format(namespace, generation, key),
+            data,
+            px=int((ttl or self.ttl) * 1000),
+        )
+
+    def set_local(
+        self, local_key: Tuple[str, int, str], data: str, ttl: Optional[float] = None
+    ) -> None:
+        ttl = min(ttl, self.local_ttl) if ttl else self.local_ttl
+        self.entries[local_key] = (time.monotonic() + ttl, data)
+        self.entries.move_to_end(local_key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self, namespace: str, generation: int) -> None:
+        self.set_generation(namespace, generation)
+        for local_key in [x for x in self.entries if x[0] == namespace]:
+            del self.entries[local_key]
+
+    async def invalidate(self, namespace: str) -> None:
+        """
+        Drops the entries of a namespace in every process.  Call after the
+        changes are committed, or a process could cache the old data again.
+
+        Args:
+            namespace (str): Namespace to invalidate.
+        """
+        generation = time.time_ns()
+        await self.redis.set(
+            GENERATION_KEY.format(namespace),
+            generation,
+            px=int(self.generation_ttl * 1000),
+        )
+        self.clear(namespace, generation)
+        await self.socket_manager.broadcast_to_channel(
+            INVALIDATE_CHANNEL, json.dumps([namespace, generation])
+        )
+
+    async def _on_invalidate(self, message: str) -> None:
+        try:
+            namespace, generation = json.loads(message)
+        except (TypeError, ValueError):
+            logger.warning("Invalid cache invalidation %r", message)
+            return
+
+        self.clear(namespace, generation)
+
+    async def start(self) -> None:
+        """
+        Starts listening for invalidations from other processes.
+        """
+        await self.socket_manager.add_listener(INVALIDATE_CHANNEL, self._on_invalidate)
+
+
+def make_key(args: tuple, kwargs: dict) -> str:
+    value = json.dumps(
+        [args, kwargs],
+        default=to_jsonable_python,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(value.encode()).hexdigest()
+
+
+def cached(namespace: str, ttl: Optional[float] = None) -> Callable:
+    """
+    Cache the results of an action in `current_app.cache` under `namespace`,
+    keyed by its arguments.  The action must return a pydantic model, as its
+    return annotation says, and not depend on the caller or on fields of the
+    model being limited; do permission checks and field selection on the
+    cached result.  Exceptions aren't cached.
+
+    Pair with `invalidates` on the actions changing the data.  Goes below
+    `handle_orm_errors`.
+
+    Args:
+        namespace (str): Namespace of the entries, usually the model name.
+        ttl (Optional[float]): Seconds to keep entries in Redis instead of the
+            default.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        schema = get_type_hints(func)["return"]
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache = current_app.cache
+            key = make_key(args, kwargs)
+            # read before the data, so data read before an invalidation is cached
+            # under the generation it belongs to
+            generation = await cache.generation(namespace)
+
+            data = await cache.get(namespace, generation, key, ttl)
+            if data is not None:
+                return schema.model_validate_json(data)
+
+            value = await func(*args, **kwargs)
+            await cache.set(
+                namespace, generation, key, schema.model_dump_json(value), ttl
+            )
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*namespaces: str) -> Callable:
+    """
+    Invalidate cache namespaces after an action changing their data returns.
+    The action must commit its own transaction, not run inside a caller's.
+    Goes below `handle_orm_errors`.
+
+    Args:
+        namespaces (str): Namespaces to invalidate.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            for namespace in namespaces:
+                await current_app.cache.invalidate(namespace)
+            return result
+
+        return wrapper
+
+    return decorator
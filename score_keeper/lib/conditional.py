@@ -0,0 +1,75 @@
+import datetime as dt
+import hashlib
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional, Sequence, Tuple
+
+from quart import request
+from werkzeug.http import http_date, quote_etag
+
+# what a version function returns: values that change whenever the response body
+# would, and when the resource last changed (if known), or None when the response
+# can't be versioned
+Version = Optional[Tuple[Sequence[Any], Optional[dt.datetime]]]
+
+
+def make_etag(parts: Sequence[Any]) -> str:
+    """
+    A strong ETag for the current request from the version `parts` of the
+    resource.  The path and query string are included since they select the
+    fields and relations in the body.
+    """
+    # timestamps, since the same instant can come with different tzinfo classes
+    parts = [x.timestamp() if isinstance(x, dt.datetime) else x for x in parts]
+    value = repr((request.path, request.query_string, *parts)).encode()
+    return hashlib.sha1(value).hexdigest()
+
+
+def is_not_modified(etag: str, last_modified: Optional[dt.datetime]) -> bool:
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+
+    if request.if_modified_since and last_modified:
+        # HTTP dates have no fractions of a second
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+
+    return False
+
+
+def conditional(version: Callable[..., Awaitable[Version]]) -> Callable:
+    """
+    Answer conditional GETs with 304 Not Modified, and add ETag and Last-Modified
+    headers to other responses.
+
+    `version` is awaited with the arguments of the route before the route itself,
+    and should be much cheaper than building the response, e.g. only reading
+    `modified_at`.  The route only runs when the client's copy is out of date.
+    Goes below `validate_response` and `validate_querystring`.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            current = await version(*args, **kwargs)
+            if current is None:
+                return await func(*args, **kwargs)
+
+            parts, last_modified = current
+            etag = make_etag(parts)
+
+            headers = {"ETag": quote_etag(etag)}
+            if last_modified:
+                headers["Last-Modified"] = http_date(last_modified)
+
+            if is_not_modified(etag, last_modified):
+                return "", 304, headers
+
+            result = await func(*args, **kwargs)
+            if not isinstance(result, tuple):
+                result = (result, 200)
+
+            value, status, *rest = result
+            return value, status, {**(rest[0] if rest else {}), **headers}
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,198 @@
+import asyncio
+import time
+from typing import Dict, Optional
+
+import asyncpg
+from tortoise import connections
+from tortoise.backends.asyncpg import AsyncpgDBClient
+from tortoise.exceptions import ConfigurationError
+
+from .metrics import Histogram, format_labels, metric_family, register_collector
+from .query_log import record_query
+
+
+class InstrumentedConnection(asyncpg.Connection):
+    """
+    Records the statements it runs in the active `query_log.QueryLog`s.
+    """
+
+    async def execute(self, query, *args, **kwargs):
+        with record_query(query):
+            return await super().execute(query, *args, **kwargs)
+
+    async def executemany(self, command, args, **kwargs):
+        with record_query(command):
+            return await super().executemany(command, args, **kwargs)
+
+    async def fetch(self, query, *args, **kwargs):
+        with record_query(query):
+            return await super().fetch(query, *args, **kwargs)
+
+    async def fetchval(self, query, *args, **kwargs):
+        with record_query(query):
+            return await super().fetchval(query, *args, **kwargs)
+
+    async def fetchrow(self, query, *args, **kwargs):
+        with record_query(query):
+            return await super().fetchrow(query, *args, **kwargs)
+
+
+class InstrumentedPool(asyncpg.Pool):
+    def __init__(
+        self,
+        *args,
+        acquire_timeout: Optional[float] = None,
+        max_queries: int = 50000,
+        max_inactive_connection_lifetime: float = 300.0,
+        setup=None,
+        init=None,
+        record_class=asyncpg.Record,
+        connection_class=InstrumentedConnection,
+        **kwargs,
+    ):
+        super().__init__(
+            *args,
+            max_queries=max_queries,
+            max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+            setup=setup,
+            init=init,
+            record_class=record_class,
+            connection_class=connection_class,
+            **kwargs,
+        )
+        self.acquire_timeout = acquire_timeout
+        self.acquire_wait = Histogram()
+        self.acquire_timeouts = 0
+        self.waiters = 0
+        self.hold = Histogram()
+        self.acquired_at = {}
+
+    async def _acquire(self, timeout):
+        self.waiters += 1
+        start = time.perf_counter()
+        try:
+            connection = await super()._acquire(
+                self.acquire_timeout if timeout is None else timeout
+            )
+        except asyncio.TimeoutError:
+            self.acquire_timeouts += 1
+            raise
+        finally:
+            self.waiters -= 1
+            self.acquire_wait.observe(time.perf_counter() - start)
+
+        self.acquired_at[connection] = time.perf_counter()
+        return connection
+
+    async def release(self, connection, *, timeout=None):
+        start = self.acquired_at.pop(connection, None)
+        if start is not None:
+            self.hold.observe(time.perf_counter() - start)
+        return await super().release(connection, timeout=timeout)
+
+
+class InstrumentedAsyncpgDBClient(AsyncpgDBClient):
+    """
+    The asyncpg backend with an acquire timeout and metrics for its connection
+    pool, used with `DB_ENGINE = "score_keeper.lib.db_client"`.  The pool metrics
+    are published through `lib.metrics`, the statements run are counted by
+    `lib.query_log`.
+    """
+
+    # passed to the pool by `create_connection`, overriding the pool's default
+    connection_class = InstrumentedConnection
+
+    async def create_pool(self, **kwargs) -> asyncpg.Pool:
+        return await InstrumentedPool(None, **kwargs)
+
+    @property
+    def pool(self) -> Optional[InstrumentedPool]:
+        """
+        The connection pool, None until the client connects.
+        """
+        return self._pool
+
+
+client_class = InstrumentedAsyncpgDBClient
+
+
+@register_collector
+def pool_metrics(extra_labels: Dict[str, str]):
+    try:
+        clients = connections.all()
+    except ConfigurationError:
+        # published before the database is set up, or after it's closed
+        clients = []
+
+    pools = [
+        (client.connection_name, client.pool)
+        for client in clients
+        if isinstance(client, InstrumentedAsyncpgDBClient) and client.pool is not None
+    ]
+
+    def labels(name, **extra):
+        return format_labels({**extra_labels, "connection": name, **extra})
+
+    yield metric_family(
+        "db_pool_connections",
+        "gauge",
+        "Open connections in the pool by state.",
+        [
+            line
+            for name, pool in pools
+            for line in (
+                f"db_pool_connections{labels(name, state='in_use')} "
+                f"{pool.get_size() - pool.get_idle_size()}",
+                f"db_pool_connections{labels(name, state='idle')} "
+                f"{pool.get_idle_size()}",
+            )
+        ],
+    )
+    yield metric_family(
+        "db_pool_max_size",
+        "gauge",
+        "Maximum number of connections in the pool.",
+        [
+            f"db_pool_max_size{labels(name)} {pool.get_max_size()}"
+            for name, pool in pools
+        ],
+    )
+    yield metric_family(
+        "db_pool_waiters",
+        "gauge",
+        "Tasks waiting to acquire a connection.",
+        [f"db_pool_waiters{labels(name)} {pool.waiters}" for name, pool in pools],
+    )
+    yield metric_family(
+        "db_pool_acquire_timeouts_total",
+        "counter",
+        "Connection acquisitions that timed out.",
+        [
+            f"db_pool_acquire_timeouts_total{labels(name)} {pool.acquire_timeouts}"
+            for name, pool in pools
+        ],
+    )
+    yield metric_family(
+        "db_pool_acquire_seconds",
+        "histogram",
+        "Time spent waiting to acquire a connection.",
+        [
+            line
+            for name, pool in pools
+            for line in pool.acquire_wait.samples(
+                "db_pool_acquire_seconds", {**extra_labels, "connection": name}
+            )
+        ],
+    )
+    yield metric_family(
+        "db_pool_hold_seconds",
+        "histogram",
+        "Time connections are held before being released to the pool.",
+        [
+            line
+            for name, pool in pools
+            for line in pool.hold.samples(
+                "db_pool_hold_seconds", {**extra_labels, "connection": name}
+            )
+        ],
+    )
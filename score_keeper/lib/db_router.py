@@ -0,0 +1,125 @@
+import logging
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable
+
+from tortoise import connections
+
+logger = logging.getLogger(__name__)
+
+READ_CONNECTION = "replica"
+
+use_read_connection: ContextVar[bool] = ContextVar("use_read_connection", default=False)
+
+LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery()
+        OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END AS lag
+"""
+
+
+class Router:
+    """
+    Tortoise router sending reads to the read connection while inside an action
+    decorated with `read_replica`.  Everything else, including writes and the reads
+    they do, uses the default connection.
+    """
+
+    # the signatures tortoise calls, the model doesn't matter here
+    # pylint: disable=unused-argument
+
+    def db_for_read(self, model):
+        if use_read_connection.get():
+            return READ_CONNECTION
+        return None
+
+    def db_for_write(self, model):
+        return None
+
+
+class ReplicaStatus:
+    def __init__(self):
+        self.max_lag = None
+        self.check_interval = None
+        self.checked_at = None
+        self.usable = False
+
+    def configure(self, max_lag: float, check_interval: float) -> None:
+        """
+        Args:
+            max_lag (float): Seconds the replica may lag behind the primary before
+                reads fall back to the primary.
+            check_interval (float): Seconds between replica lag checks.
+        """
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.checked_at = None
+
+    async def check(self) -> bool:
+        """
+        Returns whether the replica can serve reads, checking its lag at most once
+        per `check_interval`.  A replica that can't be reached counts as too stale.
+        """
+        now = time.monotonic()
+        if self.checked_at is not None and now - self.checked_at < self.check_interval:
+            return self.usable
+
+        self.checked_at = now
+        try:
+            rows = await connections.get(READ_CONNECTION).execute_query_dict(LAG_SQL)
+            lag = float(rows[0]["lag"] or 0)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed to check the read replica")
+            self.usable = False
+        else:
+            self.usable = lag <= self.max_lag
+            if not self.usable:
+                logger.warning("Read replica is %.1f seconds behind", lag)
+
+        return self.usable
+
+
+replica_status = ReplicaStatus()
+
+
+def read_replica(func: Callable) -> Callable:
+    """
+    Run the reads of an action on the read replica, when one is configured and it
+    isn't lagging too far behind.  Only for actions whose results may be slightly
+    stale, never for reads that a write depends on.
+    """
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        if replica_status.max_lag is None or not await replica_status.check():
+            return await func(*args, **kwargs)
+
+        token = use_read_connection.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            use_read_connection.reset(token)
+
+    return wrapper
+
+
+def read_primary(func: Callable) -> Callable:
+    """
+    Run the reads of an action on the primary, even when called from an action
+    decorated with `read_replica`.  For reads whose results are kept, e.g. in a
+    cache filled right after a write, which a lagging replica would fill with the
+    data from before the write.
+    """
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = use_read_connection.set(False)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            use_read_connection.reset(token)
+
+    return wrapper
@@ -9,3 +9,15 @@ class ActionError(ValueError):
 class ForbiddenActionError(ActionError):
     def __init__(self, loc=None, type="forbidden"):
         super().__init__("Action Denied", loc=loc, type=type)
+
+
+class BulkActionError(ActionError):
+    """
+    Errors for individual items of a bulk action, raised once all of the items
+    have been checked so they can be reported together.
+    """
+
+    def __init__(self, errors, type="bulk"):
+        super().__init__(f"{len(errors)} item(s) failed", type=type)
+
+        self.errors = errors
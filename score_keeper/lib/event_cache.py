@@ -0,0 +1,82 @@
+from typing import Optional, Tuple, Union
+
+import redis.asyncio as aioredis
+
+KEY = "event-cache:{}"
+
+# Replace the cached event unless the cache already holds the same or a newer
+# version.  An empty data marks an event that isn't cached (e.g. it ended), so a
+# late write of an older version can't bring it back.
+SET_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], 'version')
+if current and tonumber(current) >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'version', ARGV[1], 'data', ARGV[2])
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+
+class EventCache:
+    def __init__(self, redis: aioredis.Redis, ttl: float = 3600):
+        """
+        Serialized events kept in Redis, written through by the actions changing
+        them so reads of live events don't need the database.  Each copy carries
+        the `Event.version` it was serialized from, and is only ever replaced by a
+        newer one.
+
+        Args:
+            redis (aioredis.Redis): Redis connection holding the events.
+            ttl (float): Seconds a cached event is kept after its last write.
+        """
+        self.redis = redis
+        self.ttl = ttl
+        self.set_script = redis.register_script(SET_SCRIPT)
+
+    async def get(self, id: int) -> Optional[Tuple[int, str]]:
+        """
+        Returns the version and JSON of a cached event, or None.
+
+        Args:
+            id (int): Event ID.
+        """
+        version, data = await self.redis.hmget(KEY.format(id), "version", "data")
+        if not data:
+            return None
+        return int(version), data.decode()
+
+    def set(
+        self,
+        client: Union[aioredis.Redis, aioredis.client.Pipeline],
+        id: int,
+        version: int,
+        data: Optional[str],
+    ):
+        """
+        Caches an event unless a newer version is cached.  With a pipeline the
+        write is only queued.
+
+        Args:
+            client (Union[aioredis.Redis, aioredis.client.Pipeline]): Where to run
+                the write, e.g. the pipeline broadcasting the change.
+            id (int): Event ID.
+            version (int): `Event.version` the data was serialized from.
+            data (Optional[str]): JSON of the event, None to stop caching it.
+        """
+        return self.set_script(
+            keys=[KEY.format(id)],
+            args=[version, data or "", int(self.ttl * 1000)],
+            client=client,
+        )
+
+    async def delete(self, *ids: int) -> None:
+        """
+        Drops cached events, e.g. after a change to data they embed.  Until an
+        event is cached again it's read from the database.
+
+        Args:
+            ids (int): Event IDs.
+        """
+        if ids:
+            await self.redis.delete(*[KEY.format(id) for id in ids])
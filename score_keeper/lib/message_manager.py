@@ -1,5 +1,4 @@
 import asyncio
-import json
 from typing import Any, Optional
 from uuid import uuid4
 
@@ -7,6 +6,8 @@ from quart import current_app, websocket
 
 from score_keeper import schemas
 
+from .serialization import dumps
+
 
 class MessageManager:
     def __init__(
@@ -24,7 +25,7 @@ class MessageManager:
         await self.send_message(
             "connected",
             f"User {self.user.id} connected to channel - {self.channel_id}",
-            data=json.loads(schemas.UserPublic.model_dump_json(self.user)),
+            data=schemas.UserPublic.model_dump(self.user, mode="json"),
         )
 
         return self
@@ -38,13 +39,13 @@ class MessageManager:
             await self.send_message(
                 "disconnected",
                 f"User {self.user.id} disconnected from channel - {self.channel_id}",
-                data=json.loads(schemas.UserPublic.model_dump_json(self.user)),
+                data=schemas.UserPublic.model_dump(self.user, mode="json"),
             )
 
     def __await__(self):
         return self.__aenter__().__await__()
 
-    async def send_message(self, msg_type: str, message: str, data: Any = None):
+    def format_message(self, msg_type: str, message: str, data: Any = None) -> str:
         message = {
             "session_id": self.session_id,
             "user_id": self.user.id,
@@ -56,6 +57,9 @@ class MessageManager:
         if data is not None:
             message["data"] = data
 
+        return dumps(message)
+
+    async def send_message(self, msg_type: str, message: str, data: Any = None):
         await current_app.socket_manager.broadcast_to_channel(
-            self.channel_id, json.dumps(message)
+            self.channel_id, self.format_message(msg_type, message, data)
         )
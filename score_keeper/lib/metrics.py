@@ -0,0 +1,89 @@
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+collectors: List[Callable[[Dict[str, str]], Iterable[str]]] = []
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        A cumulative histogram in the Prometheus sense, kept in process.
+
+        Args:
+            buckets (Sequence[float]): Upper bounds of the buckets, ascending.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+    def samples(self, name: str, labels: Dict[str, str]) -> List[str]:
+        lines = [
+            f"{name}_bucket{format_labels({**labels, 'le': str(bound)})} {count}"
+            for bound, count in zip(self.buckets, self.counts)
+        ]
+        lines.append(
+            f"{name}_bucket{format_labels({**labels, 'le': '+Inf'})} {self.count}"
+        )
+        lines.append(f"{name}_sum{format_labels(labels)} {self.sum}")
+        lines.append(f"{name}_count{format_labels(labels)} {self.count}")
+        return lines
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def metric_family(name: str, type: str, help: str, samples: Iterable[str]) -> str:
+    return "\n".join([f"# HELP {name} {help}", f"# TYPE {name} {type}", *samples])
+
+
+def merge_families(families: Iterable[str]) -> List[str]:
+    """
+    Families of the same metric, e.g. from several processes, merged into one
+    family holding all their samples, as a metric may only be described once.
+    """
+    merged: Dict[Tuple[str, str], List[str]] = {}
+    for family in families:
+        help_line, type_line, *samples = family.split("\n")
+        merged.setdefault((help_line, type_line), []).extend(samples)
+
+    return ["\n".join([*header, *samples]) for header, samples in merged.items()]
+
+
+def register_collector(func: Callable[[Dict[str, str]], Iterable[str]]) -> Callable:
+    """
+    Register a function returning metric families (see `metric_family`) of this
+    process to be included in `collect`.  It's passed labels to add to every
+    sample, e.g. the process's worker id.
+    """
+    collectors.append(func)
+    return func
+
+
+def collect(labels: Dict[str, str]) -> List[str]:
+    """
+    The metric families of the registered collectors, with `labels` added.
+    """
+    return [family for func in collectors for family in func(labels)]
+
+
+def render(families: Iterable[str]) -> str:
+    """
+    `families` in the Prometheus text exposition format.
+    """
+    return "\n".join(families) + "\n"
@@ -1,3 +1,8 @@
+import time
+
+from .request_metrics import ENDPOINT_KEY, NO_ENDPOINT, RequestMetrics
+
+
 class ProxyMiddleware:
     def __init__(self, app):
         self.app = app
@@ -30,3 +35,64 @@ class ProxyMiddleware:
         scope["headers"] = headers
         scope["server"] = (host, port)
         return await self.app(scope, receive, send)
+
+
+class MetricsMiddleware:
+    def __init__(self, app, metrics: RequestMetrics):
+        """
+        Records the duration, status and response size of HTTP requests, and the
+        open websocket connections, in `metrics`.  Requests are labelled with the
+        endpoint of their route, which the app puts in the scope, rather than the
+        path, so there are as many labels as routes.
+        """
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            return await self.http(scope, receive, send)
+        if scope["type"] == "websocket":
+            return await self.websocket(scope, receive, send)
+        return await self.app(scope, receive, send)
+
+    async def http(self, scope, receive, send):
+        start = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        self.metrics.in_flight += 1
+        try:
+            return await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.in_flight -= 1
+            self.metrics.observe_request(
+                scope.get(ENDPOINT_KEY, NO_ENDPOINT),
+                scope["method"],
+                status,
+                time.perf_counter() - start,
+                size,
+            )
+
+    async def websocket(self, scope, receive, send):
+        endpoint = None
+
+        async def send_wrapper(message):
+            nonlocal endpoint
+            if message["type"] == "websocket.accept" and endpoint is None:
+                endpoint = scope.get(ENDPOINT_KEY, NO_ENDPOINT)
+                self.metrics.websocket_opened(endpoint)
+            await send(message)
+
+        try:
+            return await self.app(scope, receive, send_wrapper)
+        finally:
+            if endpoint is not None:
+                self.metrics.websocket_closed(endpoint)
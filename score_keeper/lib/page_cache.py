@@ -0,0 +1,61 @@
+import hashlib
+from functools import wraps
+from typing import Callable
+
+from quart import current_app, request
+from quart_auth import current_user
+
+# the namespaces of lib.cache holding pages, see `page_namespace`
+PAGE_NAMESPACE = "page:{}"
+
+
+def page_namespace(name: str, id: int = None) -> str:
+    """
+    The cache namespace of the pages of `name`, or of the pages of one `id` of
+    it.  The actions changing the data of a page invalidate its namespace.
+    """
+    return PAGE_NAMESPACE.format(name if id is None else f"{name}:{id}")
+
+
+def page_key() -> str:
+    # pages show dates in the visitor's timezone, see application.utc_to_local
+    value = repr((request.path, request.query_string, request.cookies.get("tz")))
+    return hashlib.sha1(value.encode()).hexdigest()
+
+
+def cache_page(name: str, id_arg: str = None) -> Callable:
+    """
+    Cache the HTML a route renders for anonymous visitors, who all see the same
+    page, in `current_app.cache` for PAGE_CACHE_TTL seconds.  Signed in users
+    always get a freshly rendered page, so anything specific to a visitor must
+    either not show for anonymous visitors or be fetched by the page itself.
+
+    Args:
+        name (str): Name of the namespace of the pages, see `page_namespace`.
+        id_arg (str): Route argument holding the id of the namespace, if any.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if await current_user.is_authenticated:
+                return await func(*args, **kwargs)
+
+            cache = current_app.cache
+            ttl = current_app.config["PAGE_CACHE_TTL"]
+            namespace = page_namespace(name, kwargs[id_arg] if id_arg else None)
+            key = page_key()
+            generation = await cache.generation(namespace)
+
+            page = await cache.get(namespace, generation, key, ttl)
+            if page is not None:
+                return page, 200, {"X-Page-Cache": "hit"}
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, str):
+                await cache.set(namespace, generation, key, result, ttl)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,168 @@
+import asyncio
+import datetime as dt
+import logging
+from typing import List, Optional, Type
+
+from tortoise import BaseDBAsyncClient, Model
+
+logger = logging.getLogger(__name__)
+
+CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}"
+FOR VALUES FROM ('{start}') TO ('{end}')
+"""
+
+LIST_SQL = """
+SELECT child.relname AS name
+FROM pg_inherits
+JOIN pg_class parent ON pg_inherits.inhparent = parent.oid
+JOIN pg_class child ON pg_inherits.inhrelid = child.oid
+WHERE parent.relname = $1
+ORDER BY child.relname
+"""
+
+# CONCURRENTLY only waits for queries already using the partition instead of
+# locking the whole table, so writes to the live partitions carry on
+DETACH_SQL = 'ALTER TABLE "{table}" DETACH PARTITION "{name}" CONCURRENTLY'
+
+SET_TABLESPACE_SQL = 'ALTER TABLE "{name}" SET TABLESPACE "{tablespace}"'
+
+
+def month_start(value: dt.date) -> dt.date:
+    return dt.date(value.year, value.month, 1)
+
+
+def next_month(value: dt.date) -> dt.date:
+    return dt.date(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+class MonthlyPartitions:
+    def __init__(
+        self,
+        model: Type[Model],
+        months_ahead: int = 3,
+        check_interval: float = 3600,
+    ):
+        """
+        Maintains the monthly partitions of a table partitioned by range of
+        `created_at`, named like "eventscore_p202401" and bounded by the months in
+        UTC.  A row can only be inserted once the partition for its month exists,
+        so partitions are created `months_ahead` months in advance.
+
+        Args:
+            model (Type[Model]): Model of the partitioned table.
+            months_ahead (int): Months after the current one to keep partitions
+                created for.
+            check_interval (float): Seconds between checks for missing partitions.
+        """
+        self.model = model
+        self.months_ahead = months_ahead
+        self.check_interval = check_interval
+        self.task: Optional[asyncio.Task] = None
+
+    # tortoise has no public accessors for a model's table or write connection
+
+    @property
+    def table(self) -> str:
+        return self.model._meta.db_table  # pylint: disable=protected-access
+
+    @property
+    def db(self) -> BaseDBAsyncClient:
+        return self.model._choose_db(for_write=True)  # pylint: disable=protected-access
+
+    def name(self, month: dt.date) -> str:
+        return f"{self.table}_p{month:%Y%m}"
+
+    async def create(self, today: Optional[dt.date] = None) -> List[str]:
+        """
+        Creates the partitions from the current month to `months_ahead` months
+        ahead that don't exist yet.
+
+        Returns:
+            List[str]: Names of the partitions created.
+        """
+        existing = set(await self.list())
+        month = month_start(today or dt.datetime.now(dt.timezone.utc).date())
+        db = self.db
+
+        created = []
+        for _ in range(self.months_ahead + 1):
+            name = self.name(month)
+            if name not in existing:
+                await db.execute_script(
+                    CREATE_SQL.format(
+                        name=name,
+                        table=self.table,
+                        start=f"{month.isoformat()} 00:00:00+00",
+                        end=f"{next_month(month).isoformat()} 00:00:00+00",
+                    )
+                )
+                created.append(name)
+            month = next_month(month)
+
+        return created
+
+    async def list(self) -> List[str]:
+        """
+        Returns the names of the attached partitions, oldest first.
+        """
+        db = self.db
+        return [
+            row["name"] for row in await db.execute_query_dict(LIST_SQL, [self.table])
+        ]
+
+    async def detach(
+        self, before: dt.date, tablespace: Optional[str] = None
+    ) -> List[str]:
+        """
+        Detaches the partitions of months before `before`.  Their rows stay in
+        the detached tables but no longer show up in the partitioned table.
+
+        Must not run in a transaction.
+
+        Args:
+            before (dt.date): First month to keep attached.
+            tablespace (Optional[str]): Tablespace to move the detached tables
+                to, e.g. one on cheaper storage.
+
+        Returns:
+            List[str]: Names of the partitions detached.
+        """
+        last = self.name(month_start(before))
+        db = self.db
+
+        detached = []
+        for name in await self.list():
+            if name >= last:
+                break
+            await db.execute_script(DETACH_SQL.format(table=self.table, name=name))
+            if tablespace:
+                await db.execute_script(
+                    SET_TABLESPACE_SQL.format(name=name, tablespace=tablespace)
+                )
+            detached.append(name)
+
+        return detached
+
+    async def _create_periodically(self) -> None:
+        while True:
+            try:
+                created = await self.create()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to create %s partitions", self.table)
+            else:
+                if created:
+                    logger.info("Created partitions %s", ", ".join(created))
+            await asyncio.sleep(self.check_interval)
+
+    def start(self) -> None:
+        """
+        Starts creating missing partitions every `check_interval` seconds.
+        """
+        if self.task is None:
+            self.task = asyncio.create_task(self._create_periodically())
+
+    def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
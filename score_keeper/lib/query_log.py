@@ -0,0 +1,115 @@
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Tuple
+
+# statements a transaction is made of, which aren't worth reporting as repeated
+TRANSACTION_RE = re.compile(
+    r"^\s*(BEGIN|COMMIT|ROLLBACK|SAVEPOINT|RELEASE)\b", re.IGNORECASE
+)
+# the parts of a statement that vary between the queries of an N+1 pattern
+LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\$\d+|\b\d+(?:\.\d+)?\b")
+LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+SPACE_RE = re.compile(r"\s+")
+
+
+def normalize(query: str) -> str:
+    """
+    A statement with its values and parameters replaced by ?, and lists of them
+    by (?), so queries differing only by the rows they read compare equal.
+    """
+    query = LITERAL_RE.sub("?", query)
+    query = LIST_RE.sub("(?)", query)
+    return SPACE_RE.sub(" ", query).strip()
+
+
+class QueryLog:
+    def __init__(self):
+        """
+        The SQL statements run while the log is active, see `count_queries`.
+        """
+        self.count = 0
+        self.duration = 0.0
+        # normalized statement -> times run
+        self.statements: Dict[str, int] = {}
+
+    def record(self, query: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+
+        if not TRANSACTION_RE.match(query):
+            statement = normalize(query)
+            self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        The statements run at least `threshold` times, most run first.  A
+        statement repeated with different values is usually a relation fetched
+        once per row instead of once for all of them.
+        """
+        return sorted(
+            [(k, v) for k, v in self.statements.items() if v >= threshold],
+            key=lambda x: -x[1],
+        )
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries"'
+
+
+# every log active in the current context, e.g. a request's and a test's around it
+active_logs: ContextVar[Tuple[QueryLog, ...]] = ContextVar("active_logs", default=())
+
+
+@contextmanager
+def record_query(query: str) -> Iterator[None]:
+    """
+    Time a statement run by `db_client` into the active logs.
+    """
+    logs = active_logs.get()
+    if not logs:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        for log in logs:
+            log.record(query, duration)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryLog]:
+    """
+    Log the statements run in the block, including by tasks it starts, e.g. the
+    requests of a test client.  Needs DB_ENGINE = "score_keeper.lib.db_client".
+    """
+    log = QueryLog()
+    token = active_logs.set((*active_logs.get(), log))
+    try:
+        yield log
+    finally:
+        active_logs.reset(token)
+
+
+@contextmanager
+def max_queries(limit: int) -> Iterator[QueryLog]:
+    """
+    Fail with an AssertionError when the block runs more than `limit`
+    statements, e.g. to pin the number of queries of an endpoint in a test:
+
+        with max_queries(3):
+            await client.get("/api/event")
+    """
+    with count_queries() as log:
+        yield log
+
+    if log.count > limit:
+        statements = "\n".join(
+            f"  {count}x {statement}" for statement, count in log.repeated(1)
+        )
+        raise AssertionError(
+            f"{log.count} queries run, expected at most {limit}:\n{statements}"
+        )
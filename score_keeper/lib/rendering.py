@@ -0,0 +1,19 @@
+import asyncio
+
+import markdown
+
+# markdown longer than this is converted in a worker thread, so converting a long
+# post doesn't hold up the other requests of the process
+THREAD_MIN_LENGTH = 4096
+
+
+async def render_markdown(text: str) -> str:
+    """
+    Converts markdown to HTML.
+
+    Args:
+        text (str): Markdown to convert.
+    """
+    if len(text) < THREAD_MIN_LENGTH:
+        return markdown.markdown(text)
+    return await asyncio.to_thread(markdown.markdown, text)
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import redis.asyncio as aioredis
+
+from .metrics import Histogram, collect, format_labels, merge_families, metric_family
+
+logger = logging.getLogger(__name__)
+
+# set in the ASGI scope by the app once a request is routed, see
+# application.record_endpoint
+ENDPOINT_KEY = "score_keeper.endpoint"
+# label of requests that matched no route
+NO_ENDPOINT = "none"
+
+WORKER_KEY = "request-metrics:{}"
+
+SIZE_BUCKETS = (100, 1000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class RequestMetrics:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, redis: aioredis.Redis, publish_interval: float = 5):
+        """
+        Request and websocket metrics of this process, recorded by
+        `middleware.MetricsMiddleware`.  Every process publishes its metrics to
+        Redis every `publish_interval` seconds, labelled with its `worker` id, so
+        whichever process serves /metrics can include them all.  Each process's
+        counters stay its own rather than being added up, so the series of a
+        process that stopped just end when its metrics expire, a few intervals
+        later, instead of looking like a reset of the totals.
+
+        Args:
+            redis (aioredis.Redis): Redis connection the metrics are published to.
+            publish_interval (float): Seconds between publications.
+        """
+        self.redis = redis
+        self.publish_interval = publish_interval
+        self.worker_id = uuid4().hex
+        # (endpoint, method, status) -> request durations
+        self.durations: Dict[Tuple[str, str, str], Histogram] = {}
+        # endpoint -> response sizes
+        self.sizes: Dict[str, Histogram] = {}
+        self.in_flight = 0
+        # endpoint -> open websocket connections
+        self.websockets: Dict[str, int] = {}
+        self.task: Optional[asyncio.Task] = None
+
+    def observe_request(
+        self, endpoint: str, method: str, status: int, duration: float, size: int
+    ) -> None:
+        key = (endpoint, method, str(status))
+        if key not in self.durations:
+            self.durations[key] = Histogram()
+        self.durations[key].observe(duration)
+
+        if endpoint not in self.sizes:
+            self.sizes[endpoint] = Histogram(SIZE_BUCKETS)
+        self.sizes[endpoint].observe(size)
+
+    def websocket_opened(self, endpoint: str) -> None:
+        self.websockets[endpoint] = self.websockets.get(endpoint, 0) + 1
+
+    def websocket_closed(self, endpoint: str) -> None:
+        self.websockets[endpoint] -= 1
+
+    def families(self) -> List[str]:
+        """
+        The metric families of this process (see `metrics.metric_family`), as
+        they are now: the request metrics, and those of the collectors registered
+        with `metrics.register_collector`, e.g. of the connection pools.
+        """
+        worker = {"worker": self.worker_id}
+        return [
+            metric_family(
+                "http_request_duration_seconds",
+                "histogram",
+                "Time to handle HTTP requests, by endpoint, method and status.",
+                [
+                    line
+                    for (endpoint, method, status), histogram in sorted(
+                        self.durations.items()
+                    )
+                    for line in histogram.samples(
+                        "http_request_duration_seconds",
+                        {
+                            **worker,
+                            "endpoint": endpoint,
+                            "method": method,
+                            "status": status,
+                        },
+                    )
+                ],
+            ),
+            metric_family(
+                "http_response_size_bytes",
+                "histogram",
+                "Size of HTTP response bodies, by endpoint.",
+                [
+                    line
+                    for endpoint, histogram in sorted(self.sizes.items())
+                    for line in histogram.samples(
+                        "http_response_size_bytes", {**worker, "endpoint": endpoint}
+                    )
+                ],
+            ),
+            metric_family(
+                "http_requests_in_flight",
+                "gauge",
+                "HTTP requests being handled.",
+                [f"http_requests_in_flight{format_labels(worker)} {self.in_flight}"],
+            ),
+            metric_family(
+                "websocket_connections",
+                "gauge",
+                "Open websocket connections, by endpoint.",
+                [
+                    f"websocket_connections{format_labels({**worker, 'endpoint': k})} "
+                    f"{v}"
+                    for k, v in sorted(self.websockets.items())
+                ],
+            ),
+            *collect(worker),
+        ]
+
+    async def publish(self) -> None:
+        await self.redis.set(
+            WORKER_KEY.format(self.worker_id),
+            json.dumps(self.families()),
+            px=int(self.publish_interval * 3 * 1000),
+        )
+
+    async def _publish_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.publish_interval)
+            try:
+                await self.publish()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to publish request metrics")
+
+    def start(self) -> None:
+        """
+        Starts publishing the metrics of this process.
+        """
+        if self.task is None:
+            self.task = asyncio.create_task(self._publish_periodically())
+
+    async def stop(self) -> None:
+        """
+        Stops publishing and withdraws the metrics of this process.
+        """
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+            await self.redis.delete(WORKER_KEY.format(self.worker_id))
+
+    async def collect(self) -> List[str]:
+        """
+        The metric families of every process, this one's as they are now.
+        """
+        own_key = WORKER_KEY.format(self.worker_id)
+        keys = [
+            key
+            async for key in self.redis.scan_iter(match=WORKER_KEY.format("*"))
+            if key.decode() != own_key
+        ]
+        workers = [self.families()]
+        for data in await self.redis.mget(keys) if keys else []:
+            if data is not None:
+                workers.append(json.loads(data))
+
+        return [
+            *merge_families(family for x in workers for family in x),
+            metric_family(
+                "request_metrics_workers",
+                "gauge",
+                "Processes whose request metrics are included.",
+                [f"request_metrics_workers {len(workers)}"],
+            ),
+        ]
@@ -0,0 +1,212 @@
+import json
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+from quart import Quart, current_app, request
+from quart.json.provider import DefaultJSONProvider
+from quart_schema import validate_request as schema_validate_request
+from quart_schema import validate_response as schema_validate_response
+from quart_schema.validation import (
+    RequestSchemaValidationError,
+    ResponseSchemaValidationError,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(value: Any) -> str:
+    """
+    Serializes `value` to JSON, with orjson when it's installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def loads(data: Any) -> Any:
+    """
+    Parses JSON from a string or bytes, with orjson when it's installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """
+    Quart's own provider: pydantic models are dumped to dicts by quart_schema and
+    then serialized with the `json` module.
+    """
+
+    # whether the provider serializes returned pydantic models with `dump_model`,
+    # see `install`
+    dumps_models = False
+
+
+class OrjsonProvider(StdlibJSONProvider):
+    """
+    Serializes with orjson, and pydantic models straight to bytes with pydantic's
+    own serializer instead of going through a dict.  Dates and other types orjson
+    doesn't handle the same way as Quart are left to `default`.
+    """
+
+    dumps_models = True
+
+    def option(self, **kwargs) -> int:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(
+            obj, default=self.default, option=self.option(**kwargs)
+        ).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Any:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        data = orjson.dumps(
+            obj,
+            default=self.default,
+            option=self.option(indent=indent) | orjson.OPT_APPEND_NEWLINE,
+        )
+        return self._app.response_class(data, mimetype=self.mimetype)
+
+    def dump_model(self, model: BaseModel) -> bytes:
+        return model.__pydantic_serializer__.to_json(model, by_alias=True)
+
+
+JSON_PROVIDERS: Dict[str, Type[StdlibJSONProvider]] = {"json": StdlibJSONProvider}
+if orjson is not None:
+    JSON_PROVIDERS["orjson"] = OrjsonProvider
+
+
+def install(app: Quart, name: Optional[str] = None) -> None:
+    """
+    Serialize the JSON of `app` with the provider `name` from JSON_PROVIDERS, the
+    fastest installed one by default.  Goes after QuartSchema, since it wraps the
+    conversion of returned models.
+
+    Args:
+        app (Quart): The app.
+        name (Optional[str]): Name of the provider.
+    """
+    name = name or ("orjson" if "orjson" in JSON_PROVIDERS else "json")
+    app.json = JSON_PROVIDERS[name](app)
+
+    make_response = app.make_response
+
+    @wraps(make_response)
+    async def make_model_response(result: Any) -> Any:
+        value, *rest = result if isinstance(result, tuple) else (result,)
+        if (
+            isinstance(value, BaseModel)
+            and app.json.dumps_models
+            and not app.config["QUART_SCHEMA_CONVERT_CASING"]
+        ):
+            value = app.response_class(
+                app.json.dump_model(value), mimetype=app.json.mimetype
+            )
+            result = (value, *rest) if rest else value
+        return await make_response(result)
+
+    app.make_response = make_model_response
+
+
+def validate_request(model_class: Type[BaseModel]) -> Callable:
+    """
+    Like quart_schema's `validate_request` for JSON bodies, but validates the raw
+    body with `model_validate_json` rather than parsing it to a dict first.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        # quart_schema's wrapper documents the body and handles camelCase bodies
+        documented = schema_validate_request(model_class)(func)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if current_app.config["QUART_SCHEMA_CONVERT_CASING"]:
+                return await documented(*args, **kwargs)
+
+            try:
+                data = model_class.model_validate_json(await request.get_data())
+            except ValidationError as error:
+                raise RequestSchemaValidationError(error) from error
+
+            return await current_app.ensure_async(func)(*args, data=data, **kwargs)
+
+        wrapper.__dict__.update(
+            {k: v for k, v in documented.__dict__.items() if k != "__wrapped__"}
+        )
+        return wrapper
+
+    return decorator
+
+
+def revalidate(value: Any) -> Any:
+    """
+    A copy of `value` with the models in it validated, for models built without
+    validation, e.g. by `ResponseModel.from_db`.  Only the fields a model was
+    built with are validated, so models limited to some fields stay valid.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value)(revalidate(x) for x in value)
+    if isinstance(value, dict):
+        return {k: revalidate(v) for k, v in value.items()}
+    if not isinstance(value, BaseModel):
+        return value
+
+    model_class = type(value)
+    instance = model_class.model_construct()
+    for name, field_value in value.__dict__.items():
+        model_class.__pydantic_validator__.validate_assignment(
+            instance, name, revalidate(field_value)
+        )
+    if value.__pydantic_private__:
+        instance.__pydantic_private__ = dict(value.__pydantic_private__)
+
+    return instance
+
+
+def validate_response(model_class: Type[BaseModel], status_code: int = 200) -> Callable:
+    """
+    Like quart_schema's `validate_response`, which validates returned dicts but
+    passes instances of `model_class` through as they are.  The actions build
+    those with `ResponseModel.from_db` without validating them, so they are
+    validated here with `revalidate`, unless TRUST_RESPONSE_MODELS is set.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await current_app.ensure_async(func)(*args, **kwargs)
+            if current_app.config["TRUST_RESPONSE_MODELS"]:
+                return result
+
+            value, *rest = result if isinstance(result, tuple) else (result,)
+            status = rest[0] if rest and isinstance(rest[0], int) else 200
+            # exactly the instances quart_schema doesn't validate, it rejects others
+            # pylint: disable-next=unidiomatic-typecheck
+            if status != status_code or type(value) is not model_class:
+                return result
+
+            try:
+                value = revalidate(value)
+            except ValidationError as error:
+                raise ResponseSchemaValidationError(error) from error
+
+            return (value, *rest) if rest else value
+
+        return schema_validate_response(model_class, status_code)(wrapper)
+
+    return decorator
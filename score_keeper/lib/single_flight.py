@@ -0,0 +1,98 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+
+from .metrics import format_labels, metric_family, register_collector
+
+groups: List["SingleFlight"] = []
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        """
+        Lets concurrent identical calls in this process share one in-flight call
+        instead of each running it, e.g. the same read arriving from hundreds of
+        clients when a game starts.  Only for calls whose result doesn't depend
+        on the caller; anything per caller, like permission checks, must run on
+        the shared result.
+
+        Args:
+            name (str): Name of the group in the metrics.
+        """
+        self.name = name
+        self.calls: Dict[str, asyncio.Future] = {}
+        self.total_calls = 0
+        self.total_coalesced = 0
+        groups.append(self)
+
+    async def do(
+        self, key: str, func: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """
+        Returns the result of `func(*args, **kwargs)`, or of the call already in
+        flight for `key`.  Exceptions are raised to every caller sharing the call.
+
+        The call runs in its own task, so a caller going away doesn't cancel it
+        for the others.
+
+        Args:
+            key (str): Identifies identical calls, must cover all the arguments.
+            func (Callable[..., Awaitable[Any]]): Coroutine function to call.
+        """
+        task = self.calls.get(key)
+        coalesced = task is not None
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self.calls[key] = task
+            task.add_done_callback(lambda _: self._done(key, task))
+
+        self.count(coalesced)
+
+        return await asyncio.shield(task)
+
+    def _done(self, key: str, task: asyncio.Future) -> None:
+        if self.calls.get(key) is task:
+            del self.calls[key]
+        # every caller may have gone away before the result
+        if not task.cancelled():
+            task.exception()
+
+    def count(self, coalesced: bool) -> None:
+        self.total_calls += 1
+        if coalesced:
+            self.total_coalesced += 1
+
+
+@register_collector
+def single_flight_metrics(extra_labels: Dict[str, str]):
+    # by group only, the keys are made of call arguments and would make a
+    # series per event or post
+    def labels(group):
+        return format_labels({**extra_labels, "group": group.name})
+
+    yield metric_family(
+        "single_flight_calls_total",
+        "counter",
+        "Calls made through single flight groups.",
+        [
+            f"single_flight_calls_total{labels(x)} {x.total_calls}"
+            for x in groups
+        ],
+    )
+    yield metric_family(
+        "single_flight_coalesced_total",
+        "counter",
+        "Calls that shared a call already in flight instead of making their own.",
+        [
+            f"single_flight_coalesced_total{labels(x)} {x.total_coalesced}"
+            for x in groups
+        ],
+    )
+    yield metric_family(
+        "single_flight_in_flight",
+        "gauge",
+        "Calls currently in flight.",
+        [
+            f"single_flight_in_flight{labels(x)} {len(x.calls)}"
+            for x in groups
+        ],
+    )
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+from typing import List, Optional, Tuple
+
+import redis.asyncio as aioredis
+
+from score_keeper import models
+
+logger = logging.getLogger(__name__)
+
+INVALIDATE_CHANNEL = "team-directory:invalidate"
+
+
+class TeamDirectory:
+    def __init__(self, redis: aioredis.Redis, max_age: float = 300):
+        """
+        Every team's id and name, kept in process for building team pickers
+        without querying the database.  Processes drop their copy when any of
+        them publishes an invalidation through Redis, and at least every
+        `max_age` seconds in case an invalidation was missed.
+
+        Args:
+            redis (aioredis.Redis): Redis connection used to publish invalidations.
+            max_age (float): Seconds before the directory is reloaded regardless.
+        """
+        self.redis = redis
+        self.max_age = max_age
+        self.teams: Optional[List[Tuple[int, str]]] = None
+        self.loaded_at = 0.0
+        self.generation = 0
+        self.lock = asyncio.Lock()
+        self.task: Optional[asyncio.Task] = None
+
+    async def all(self) -> List[Tuple[int, str]]:
+        """
+        Returns (id, name) of every team, ordered by name.
+        """
+        teams = self.teams
+        if teams is None or time.monotonic() - self.loaded_at > self.max_age:
+            # one load at a time, the others wait for its result
+            async with self.lock:
+                teams = self.teams
+                if teams is None or time.monotonic() - self.loaded_at > self.max_age:
+                    teams = await self.load()
+
+        return teams
+
+    async def load(self) -> List[Tuple[int, str]]:
+        """
+        Reads the teams, and keeps them unless the directory was invalidated
+        meanwhile.  They are returned either way, as fresh as a read can be.
+        """
+        generation = self.generation
+        loaded_at = time.monotonic()
+
+        teams = await models.Team.all().order_by("name", "id").values_list("id", "name")
+
+        # an invalidation that arrived meanwhile may not be reflected in the rows
+        if generation == self.generation:
+            self.teams = teams
+            self.loaded_at = loaded_at
+
+        return teams
+
+    async def search(self, q: str, limit: int = 10) -> List[Tuple[int, str]]:
+        """
+        Returns the teams whose name contains `q`, ignoring case, those starting
+        with it first.
+
+        Args:
+            q (str): Text to look for.
+            limit (int): Maximum number of teams to return.
+        """
+        q = q.strip().lower()
+        teams = await self.all()
+
+        prefixed = []
+        contained = []
+        for team in teams:
+            name = team[1].lower()
+            if name.startswith(q):
+                prefixed.append(team)
+                if len(prefixed) == limit:
+                    break
+            elif q in name and len(contained) < limit:
+                contained.append(team)
+
+        return (prefixed + contained)[:limit]
+
+    def clear(self) -> None:
+        self.teams = None
+        self.generation += 1
+
+    async def invalidate(self) -> None:
+        """
+        Drops the directory in every process.  Call after the team changes are
+        committed, or a process could reload the old names.
+        """
+        self.clear()
+        await self.redis.publish(INVALIDATE_CHANNEL, "1")
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATE_CHANNEL)
+                    # invalidations published while not subscribed were missed
+                    self.clear()
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.clear()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Team directory invalidations were interrupted")
+                await asyncio.sleep(1)
+
+    def start(self) -> None:
+        """
+        Starts listening for invalidations from other processes.
+        """
+        if self.task is None:
+            self.task = asyncio.create_task(self._listen())
+
+    def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import redis.asyncio as aioredis
+
+from score_keeper import models
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "post-views"
+FLUSHING_KEY = "post-views:flushing"
+FLUSH_LOCK_KEY = "post-views:flush-lock"
+BROADCAST_KEY = "post-views:broadcast:{}"
+
+FLUSH_SQL = """
+UPDATE "post" p
+SET viewed = p.viewed + v.views
+FROM unnest($1::int[], $2::int[]) AS v(id, views)
+WHERE p.id = v.id
+"""
+
+
+class ViewCounter:
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        flush_interval: float = 10,
+        broadcast_interval: float = 2,
+    ):
+        """
+        Buffers post views in Redis and writes them to `Post.viewed` in batches, so
+        a popular post doesn't turn every page view into an UPDATE of its row.
+
+        Args:
+            redis (aioredis.Redis): Redis connection holding the pending views.
+            flush_interval (float): Seconds between writes of pending views.
+            broadcast_interval (float): Minimum seconds between view broadcasts for
+                the same post.
+        """
+        self.redis = redis
+        self.flush_interval = flush_interval
+        self.broadcast_interval = broadcast_interval
+        self.task: Optional[asyncio.Task] = None
+
+    async def add(self, post_id: int) -> int:
+        """
+        Records a view of a post.
+
+        Args:
+            post_id (int): Post ID.
+
+        Returns:
+            int: Views of the post not yet written to the database, including this
+                one and those of a flush in progress or failed, see `pending`.
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hincrby(PENDING_KEY, str(post_id), 1)
+            pipe.hget(FLUSHING_KEY, str(post_id))
+            added, flushing = await pipe.execute()
+        return added + int(flushing or 0)
+
+    async def pending(self, post_id: int) -> int:
+        """
+        Returns the views of a post not yet written to the database.
+
+        Args:
+            post_id (int): Post ID.
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hget(PENDING_KEY, str(post_id))
+            pipe.hget(FLUSHING_KEY, str(post_id))
+            values = await pipe.execute()
+        return sum(int(x) for x in values if x is not None)
+
+    async def should_broadcast(self, post_id: int) -> bool:
+        """
+        Returns True at most once per `broadcast_interval` for a post, across all
+        processes sharing the Redis server.
+
+        Args:
+            post_id (int): Post ID.
+        """
+        return bool(
+            await self.redis.set(
+                BROADCAST_KEY.format(post_id),
+                1,
+                nx=True,
+                px=int(self.broadcast_interval * 1000),
+            )
+        )
+
+    async def flush(self) -> Dict[int, int]:
+        """
+        Writes pending views to the database with one UPDATE.
+
+        Pending views are moved aside with RENAME so views arriving meanwhile are
+        kept for the next flush, and are only deleted once the UPDATE is done; a
+        flush that failed is retried first on the next call.
+
+        Returns:
+            Dict[int, int]: Views written per post ID.
+        """
+        lock_timeout = int(max(self.flush_interval, 1) * 3000)
+        if not await self.redis.set(FLUSH_LOCK_KEY, 1, nx=True, px=lock_timeout):
+            return {}
+
+        try:
+            if not await self.redis.exists(FLUSHING_KEY):
+                try:
+                    await self.redis.rename(PENDING_KEY, FLUSHING_KEY)
+                except aioredis.ResponseError:
+                    # no pending views
+                    return {}
+
+            views = {
+                int(k): int(v)
+                for k, v in (await self.redis.hgetall(FLUSHING_KEY)).items()
+            }
+            if views:
+                # update rows in a fixed order so concurrent writers can't deadlock
+                ids = sorted(views)
+                # tortoise has no public way to the connection models write to
+                # pylint: disable-next=protected-access
+                db = models.Post._choose_db(for_write=True)
+                await db.execute_query(FLUSH_SQL, [ids, [views[x] for x in ids]])
+
+            await self.redis.delete(FLUSHING_KEY)
+            return views
+        finally:
+            await self.redis.delete(FLUSH_LOCK_KEY)
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to flush post views")
+
+    def start(self) -> None:
+        """
+        Starts flushing pending views every `flush_interval` seconds.
+        """
+        if self.task is None:
+            self.task = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        """
+        Stops the periodic flush and writes whatever is still pending.
+        """
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        await self.flush()
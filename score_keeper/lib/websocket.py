@@ -1,4 +1,5 @@
 import asyncio
+from typing import Awaitable, Callable
 
 from quart import Websocket
 
@@ -12,10 +13,12 @@ class WebsocketManager:
 
         Attributes:
             channels (dict): A dictionary to store Websocket connections in different channels.
+            listeners (dict): A dictionary to store callbacks in different channels.
             pubsub_client (RedisPubSubManager): An instance of the PubSubManager class
                 for pub-sub functionality.
         """
         self.channels: dict = {}
+        self.listeners: dict = {}
         self.pubsub_client = pubsub_client
         self.task_initialized = False
 
@@ -34,11 +37,33 @@ class WebsocketManager:
         else:
             self.channels[channel_id] = [socket]
 
-            await self.pubsub_client.connect()
-            pubsub_subscriber = await self.pubsub_client.subscribe(channel_id)
-            if not self.task_initialized:
-                self.task_initialized = True
-                asyncio.create_task(self._pubsub_data_reader(pubsub_subscriber))
+            await self._subscribe(channel_id)
+
+    async def add_listener(
+        self, channel_id: str, callback: Callable[[str], Awaitable[None]]
+    ) -> None:
+        """
+        Adds a callback called with every message published to a channel, for
+        messages meant for the server processes rather than for Websockets.
+
+        Args:
+            channel_id (str): Channel ID.
+            callback (Callable[[str], Awaitable[None]]): Coroutine function called
+                with each message.
+        """
+        if channel_id in self.listeners:
+            self.listeners[channel_id].append(callback)
+        else:
+            self.listeners[channel_id] = [callback]
+
+            await self._subscribe(channel_id)
+
+    async def _subscribe(self, channel_id: str) -> None:
+        await self.pubsub_client.connect()
+        pubsub_subscriber = await self.pubsub_client.subscribe(channel_id)
+        if not self.task_initialized:
+            self.task_initialized = True
+            asyncio.create_task(self._pubsub_data_reader(pubsub_subscriber))
 
     async def broadcast_to_channel(self, channel_id: str, message: str) -> None:
         """
@@ -85,3 +110,5 @@ class WebsocketManager:
                     for socket in all_sockets:
                         data = message["data"].decode("utf-8")
                         await socket.send(data)
+                for callback in self.listeners.get(channel_id, []):
+                    await callback(message["data"].decode("utf-8"))
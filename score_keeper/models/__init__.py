@@ -1,6 +1,7 @@
 # pylint: disable=unused-wildcard-import
 from .event import *
 from .post import *
+from .standing import *
 from .team import *
 from .token import *
 from .user import *
@@ -1,6 +1,8 @@
 import datetime as dt
 
+from pypika.terms import Field
 from tortoise import Model, fields
+from tortoise.indexes import Index
 
 from score_keeper import enums
 
@@ -37,6 +39,10 @@ class Event(TimestampMixin, Model):
 
     datetime = fields.DatetimeField(null=True)
 
+    # bumped by every write to the event while its row is locked, so copies of the
+    # event (see lib.event_cache) can tell which of them is newer
+    version = fields.IntField(default=0)
+
     @property
     def status(self):
         return self._status
@@ -46,8 +52,34 @@ class Event(TimestampMixin, Model):
             self._status = status
             self.status_as_of = dt.datetime.now(dt.timezone.utc)
 
+    class Meta:
+        # match EventQueryStringSort, optionally filtered by status; modified_at is
+        # left out on purpose since every score write bumps it.  The status index is
+        # declared with expressions because Index.fields must name model fields
+        # while its SQL uses them as column names (_status is stored as "status")
+        indexes = (
+            Index(
+                fields=("datetime", "period", "created_at"),
+                name="idx_event_datetime_period",
+            ),
+            Index(
+                Field("status"),
+                Field("datetime"),
+                Field("period"),
+                Field("created_at"),
+                name="idx_event_status_datetime",
+            ),
+            Index(fields=("created_at", "id"), name="idx_event_created_at_id"),
+        )
+
 
 class EventScore(TimestampMixin, Model):
+    """
+    Partitioned by month of created_at (see lib.partitions), so the primary key of
+    the table is (id, created_at).  Filter on created_at where possible to only
+    read the partitions that can hold the rows.
+    """
+
     id = fields.IntField(pk=True)
 
     away_delta = fields.IntField(default=0)
@@ -61,3 +93,10 @@ class EventScore(TimestampMixin, Model):
     event: fields.ForeignKeyRelation[Event] = fields.ForeignKeyField(
         "models.Event", related_name="scores"
     )
+
+    class Meta:
+        indexes = (
+            Index(
+                fields=("event_id", "created_at"), name="idx_eventscore_event_created"
+            ),
+        )
@@ -1,6 +1,7 @@
 import datetime as dt
 
 from tortoise import Model, fields
+from tortoise.indexes import Index, PartialIndex
 
 from score_keeper import enums
 
@@ -18,6 +19,9 @@ class Post(TimestampMixin, Model):
         source_field="status",
     )
     content = fields.TextField()
+    # content rendered when it's written, null for posts not rendered yet (see the
+    # render-posts command)
+    content_html = fields.TextField(null=True)
     published_at = fields.DatetimeField(null=True)
     viewed = fields.IntField(default=0)
 
@@ -37,6 +41,21 @@ class Post(TimestampMixin, Model):
             else:
                 self.published_at = None
 
+    class Meta:
+        # match PostQueryStringSort for the "published OR mine" listing
+        indexes = (
+            PartialIndex(
+                fields=("published_at", "created_at", "id"),
+                name="idx_post_published",
+                condition={"status": enums.PostStatus.PUBLISHED.value},
+            ),
+            Index(
+                fields=("author_id", "published_at", "created_at", "id"),
+                name="idx_post_author_published",
+            ),
+            Index(fields=("created_at", "id"), name="idx_post_created_at_id"),
+        )
+
 
 class PostLike(TimestampMixin, Model):
     id = fields.IntField(pk=True)
@@ -0,0 +1,27 @@
+from tortoise import Model, fields
+
+from .helpers import TimestampMixin
+from .team import Team
+
+
+class Standing(TimestampMixin, Model):
+    """
+    A team's record in a season, kept up to date by `actions.standing` as events
+    end or their results change.
+    """
+
+    id = fields.IntField(pk=True)
+    season = fields.IntField()
+
+    team: fields.ForeignKeyRelation[Team] = fields.ForeignKeyField(
+        "models.Team", related_name="standings"
+    )
+
+    wins = fields.IntField(default=0)
+    losses = fields.IntField(default=0)
+    ties = fields.IntField(default=0)
+    points_for = fields.IntField(default=0)
+    points_against = fields.IntField(default=0)
+
+    class Meta:
+        unique_together = (("season", "team_id"),)
@@ -2,7 +2,9 @@
 from .auth import *
 from .error import *
 from .event import *
+from .pagination import *
 from .post import *
+from .standing import *
 from .team import *
 from .token import *
 from .user import *
@@ -1,18 +1,28 @@
 import datetime as dt
 from typing import List, Optional, Union
 
-from pydantic import NaiveDatetime, computed_field, field_validator
+from pydantic import Field, NaiveDatetime, computed_field, field_validator
+from typing_extensions import Annotated
 
 from score_keeper import enums
 
 from .helpers import (
     NOTSET,
     BaseModel,
+    FieldsModel,
+    ResponseModel,
     parse_list,
     remove_queryset,
     remove_reverse_relation,
+    validate_bulk,
+)
+from .pagination import (
+    CursorPagination,
+    PageInfo,
+    Pagination,
+    decode_cursor,
+    validate_cursor,
 )
-from .pagination import PageInfo, Pagination
 from .query import Query
 from .team import Team
 from .user import UserPublic
@@ -22,19 +32,31 @@ SCORE_VALIDATOR = int
 SEASON_VALIDATOR = int
 STATUS_VALIDATOR = enums.EventStatus
 DATETIME_VALIDATOR = dt.datetime
+SCORES_PER_PAGE_VALIDATOR = Annotated[int, Field(ge=1, le=1000)]
+SCORES_INTERVAL_VALIDATOR = Annotated[int, Field(ge=1)]
 
 
 class EventScoreCreate(BaseModel):
     away_delta: int = NOTSET
     home_delta: int = NOTSET
 
-    away_score: int
-    home_score: int
+    away_score: int = NOTSET
+    home_score: int = NOTSET
 
     comment: str = NOTSET
 
 
-class EventScore(BaseModel):
+class EventScoresCreate(BaseModel):
+    """
+    Scores to apply in order, e.g. presses a device queued while it was offline.
+    """
+
+    scores: List[EventScoreCreate]
+
+    _validate_bulk = field_validator("scores")(validate_bulk)
+
+
+class EventScore(ResponseModel):
     id: int
     created_at: dt.datetime
     modified_at: dt.datetime
@@ -50,6 +72,29 @@ class EventScore(BaseModel):
     event_id: int
 
 
+class EventScoreQueryString(BaseModel):
+    """
+    A page of an event's score history, oldest first.  With `interval`, only the
+    last score of every `interval` seconds is returned, with its deltas summed
+    over the interval.
+    """
+
+    after: Optional[str] = None
+    pp: Optional[SCORES_PER_PAGE_VALIDATOR] = 100
+    interval: Optional[SCORES_INTERVAL_VALIDATOR] = None
+
+    _validate_cursor = field_validator("after")(validate_cursor)
+
+    @property
+    def cursor(self):
+        return decode_cursor(self.after)
+
+
+class EventScoreResultSet(ResponseModel):
+    pagination: CursorPagination
+    scores: List[EventScore]
+
+
 class EventCreate(BaseModel):
     season: SEASON_VALIDATOR
     datetime: Optional[DATETIME_VALIDATOR] = None
@@ -68,7 +113,37 @@ class EventPatch(BaseModel):
     home_score: SCORE_VALIDATOR = NOTSET
 
 
-class Event(BaseModel):
+class EventBulkCreate(BaseModel):
+    events: List[EventCreate]
+
+    _validate_bulk = field_validator("events")(validate_bulk)
+
+
+class EventBulkPatchItem(EventPatch):
+    id: int
+
+
+class EventBulkPatch(BaseModel):
+    events: List[EventBulkPatchItem]
+
+    _validate_bulk = field_validator("events")(validate_bulk)
+
+
+class Event(FieldsModel):
+    field_dependencies = {
+        "away_team_name": ("away_team",),
+        "home_team_name": ("home_team",),
+        "verbose_status": ("status",),
+    }
+    field_sources = {
+        "status": ("_status",),
+        "created_by": ("created_by_id",),
+        "away_team": ("away_team_id",),
+        "home_team": ("home_team_id",),
+        "scores": ("id", "created_at"),
+    }
+    always_loaded = ("id", "created_by_id")
+
     id: int
     period: int
     season: int
@@ -144,16 +219,41 @@ class EventResolve(enums.EnumStr):
     SCORES = "scores"
 
 
+class EventField(enums.EnumStr):
+    ID = "id"
+    PERIOD = "period"
+    SEASON = "season"
+    DATETIME = "datetime"
+    STATUS = "status"
+    STATUS_AS_OF = "status_as_of"
+    CREATED_AT = "created_at"
+    MODIFIED_AT = "modified_at"
+    CREATED_BY_ID = "created_by_id"
+    CREATED_BY = "created_by"
+    AWAY_TEAM_ID = "away_team_id"
+    AWAY_TEAM = "away_team"
+    AWAY_SCORE = "away_score"
+    HOME_TEAM_ID = "home_team_id"
+    HOME_TEAM = "home_team"
+    HOME_SCORE = "home_score"
+    SCORES = "scores"
+    AWAY_TEAM_NAME = "away_team_name"
+    HOME_TEAM_NAME = "home_team_name"
+    VERBOSE_STATUS = "verbose_status"
+
+
 class EventGetOptions(BaseModel):
     resolves: Optional[List[EventResolve]] = []
+    fields: Optional[List[EventField]] = []
 
-    _parse_list = field_validator("resolves", mode="before")(parse_list)
+    _parse_list = field_validator("resolves", "fields", mode="before")(parse_list)
 
 
 class EventQuery(BaseModel, Query):
     filters: List[EventFilter] = []
     sorts: List[EventSort] = [EventSort.ID_ASC]
     resolves: Optional[List[EventResolve]] = []
+    fields: Optional[List[EventField]] = []
 
 
 class EventQueryStringSort(enums.EnumStr):
@@ -174,10 +274,13 @@ class EventQueryString(BaseModel):
     pp: Optional[int] = 10
     p: Optional[int] = 1
     resolves: Optional[List[EventResolve]] = []
+    fields: Optional[List[EventField]] = []
 
-    _parse_list = field_validator("id__in", "resolves", mode="before")(parse_list)
+    _parse_list = field_validator("id__in", "resolves", "fields", mode="before")(
+        parse_list
+    )
 
-    def to_query(self, resolves=None):
+    def to_query(self, resolves=None, fields=None):
         filters = []
         if self.id__in:
             filters.append(EventFilter(field=EventFilterField.ID_IN, value=self.id__in))
@@ -188,13 +291,22 @@ class EventQueryString(BaseModel):
             )
 
         resolves = resolves or self.resolves
+        fields = self.fields if fields is None else fields
         sorts = self.sort.split("__")
         page_info = PageInfo(num_per_page=self.pp, current_page=self.p)
         return EventQuery(
-            filters=filters, sorts=sorts, resolves=resolves, page_info=page_info
+            filters=filters,
+            sorts=sorts,
+            resolves=resolves,
+            fields=fields,
+            page_info=page_info,
         )
 
 
-class EventResultSet(BaseModel):
+class EventResultSet(ResponseModel):
     pagination: Pagination
     events: List[Event]
+
+
+class EventBulkResult(ResponseModel):
+    events: List[Event]
@@ -1,15 +1,36 @@
-from typing import Union, get_args, get_origin
+import datetime as dt
+from typing import (
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pydantic import AfterValidator
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import EmailStr as PydanticEmailStr
-from pydantic import ValidationInfo, field_validator
-from pydantic_core import PydanticCustomError
+from pydantic import (
+    PrivateAttr,
+    SerializationInfo,
+    ValidationInfo,
+    field_validator,
+    model_serializer,
+)
+from pydantic_core import PydanticCustomError, to_jsonable_python
 from tortoise.fields.relational import ReverseRelation, _NoneAwaitable
 from tortoise.queryset import QuerySet
 from typing_extensions import Annotated
 
 
+MAX_BULK_ITEMS = 100
+
+
 def PydanticValueError(msg, type=None):
     return PydanticCustomError(f"value_error.{type}" if type else "value_error", msg)
 
@@ -25,6 +46,9 @@ def remove_queryset(value: str):
 def remove_reverse_relation(value: str):
     if isinstance(value, ReverseRelation):
         return value.related_objects
+    # already fetched, e.g. when lib.serialization.revalidate validates a model
+    if isinstance(value, list):
+        return value
     return None
 
 
@@ -32,6 +56,18 @@ def parse_list(value: str):
     return value.split(",") if isinstance(value, str) else value
 
 
+def validate_bulk(value: list):
+    if not value:
+        raise PydanticValueError("At least one item is required", type="bulk")
+
+    if len(value) > MAX_BULK_ITEMS:
+        raise PydanticValueError(
+            f"No more than {MAX_BULK_ITEMS} items can be sent at once", type="bulk"
+        )
+
+    return value
+
+
 def validate_password(value: str):
     if len(value) < 8:
         raise PydanticValueError(
@@ -88,6 +124,169 @@ class BaseModel(PydanticBaseModel):
         return value
 
 
+TRUSTED_TYPES = (bool, int, float, str, dt.date, dt.datetime)
+FROM_DB_PLANS = {}
+
+
+def unwrap_optional(annotation):
+    if is_optional(annotation):
+        args = [x for x in get_args(annotation) if x is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+class ResponseModel(PydanticBaseModel):
+    """
+    Base for output-only models.  These are built from database rows with `from_db`,
+    which trusts the row instead of validating it, and skip the empty string
+    handling of `BaseModel` since they never see user input.
+    """
+
+    class Config:
+        from_attributes = True
+
+    @classmethod
+    def _from_db_plan(cls):
+        """
+        How to read each field off an ORM instance: "value" copies the attribute,
+        "validate" runs the field validator (e.g. for HttpUrl), "one"/"many" build
+        nested models from relations that were fetched.
+        """
+        plan = FROM_DB_PLANS.get(cls)
+        if plan is None:
+            plan = {}
+            for name, field in cls.model_fields.items():
+                annotation = unwrap_optional(field.annotation)
+                args = get_args(annotation)
+
+                if isinstance(annotation, type) and issubclass(
+                    annotation, ResponseModel
+                ):
+                    plan[name] = ("one", annotation)
+                elif (
+                    get_origin(annotation) in (list, List)
+                    and isinstance(args[0], type)
+                    and issubclass(args[0], ResponseModel)
+                ):
+                    plan[name] = ("many", args[0])
+                elif isinstance(annotation, type) and issubclass(
+                    annotation, TRUSTED_TYPES
+                ):
+                    plan[name] = ("value", None)
+                else:
+                    plan[name] = ("validate", None)
+
+            FROM_DB_PLANS[cls] = plan
+
+        return plan
+
+    @classmethod
+    def from_db(cls, obj):
+        """
+        Build the model from an ORM instance without revalidating it.
+
+        Relations are read from the ORM cache, so an unfetched relation becomes
+        None (or [] for reverse relations) without building a queryset.
+        """
+        return cls._from_db(obj)
+
+    @classmethod
+    def _from_db(cls, obj, names: Optional[Iterable[str]] = None):
+        plan = cls._from_db_plan()
+
+        values = {}
+        validate = []
+        for name in plan if names is None else names:
+            kind, model = plan[name]
+            if kind == "value":
+                values[name] = getattr(obj, name)
+            elif kind == "one":
+                related = obj.__dict__.get(f"_{name}")
+                values[name] = None if related is None else model.from_db(related)
+            elif kind == "many":
+                related = obj.__dict__.get(f"_{name}")
+                values[name] = (
+                    [model.from_db(x) for x in related.related_objects]
+                    if related is not None
+                    else []
+                )
+            else:
+                validate.append(name)
+
+        instance = cls.model_construct(**values)
+        for name in validate:
+            cls.__pydantic_validator__.validate_assignment(
+                instance, name, getattr(obj, name)
+            )
+
+        return instance
+
+
+class FieldsModel(ResponseModel):
+    """
+    A response model that can be limited to a subset of its fields, see the `fields`
+    query string argument.
+
+    `field_dependencies` lists the fields a computed field is derived from,
+    `field_sources` the ORM attributes that must be selected to load a field (when
+    they differ from the field name), and `always_loaded` the fields needed for
+    permission checks whether they are requested or not.
+    """
+
+    field_dependencies: ClassVar[Dict[str, Tuple[str, ...]]] = {}
+    field_sources: ClassVar[Dict[str, Tuple[str, ...]]] = {}
+    always_loaded: ClassVar[Tuple[str, ...]] = ("id",)
+
+    _fields: Optional[Set[str]] = PrivateAttr(default=None)
+
+    @classmethod
+    def loaded_fields(cls, fields: Iterable[str]) -> List[str]:
+        names = set(cls.always_loaded)
+        for name in fields:
+            names.update(cls.field_dependencies.get(name, (name,)))
+
+        return [x for x in cls.model_fields if x in names]
+
+    @classmethod
+    def select_fields(cls, fields: Iterable[str]) -> List[str]:
+        """
+        The ORM attributes to pass to `QuerySet.only()` in order to load `fields`
+        """
+        names = []
+        for name in cls.loaded_fields(fields):
+            for source in cls.field_sources.get(name, (name,)):
+                if source not in names:
+                    names.append(source)
+        return names
+
+    @classmethod
+    def from_db(cls, obj, fields: Optional[Iterable[str]] = None):
+        """
+        Like `ResponseModel.from_db` but, when `fields` is given, only reads the
+        attributes needed for them, so `obj` may be a partial ORM instance.
+        """
+        if not fields:
+            return cls._from_db(obj)
+
+        instance = cls._from_db(obj, cls.loaded_fields(fields))
+        instance._fields = set(fields)
+
+        return instance
+
+    @model_serializer(mode="wrap")
+    def serialize_fields(self, handler, info: SerializationInfo):
+        if self._fields is None:
+            return handler(self)
+
+        data = {
+            name: getattr(self, name)
+            for name in [*self.model_fields, *self.model_computed_fields]
+            if name in self._fields
+        }
+        return to_jsonable_python(data) if info.mode_is_json() else data
+
+
 NOTSET = object()
 
 
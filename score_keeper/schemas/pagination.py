@@ -1,6 +1,10 @@
+import base64
+import datetime as dt
+import json
 import math
+from typing import Optional, Tuple
 
-from .helpers import BaseModel
+from .helpers import BaseModel, PydanticValueError, ResponseModel
 
 
 class PageInfo(BaseModel):
@@ -22,9 +26,41 @@ class PageInfo(BaseModel):
         )
 
 
-class Pagination(BaseModel):
+class Pagination(ResponseModel):
     num_per_page: int
     current_page: int
     num_pages: int
 
     count: int
+
+
+def encode_cursor(created_at: dt.datetime, id: int) -> str:
+    """
+    An opaque cursor pointing after the row with `created_at` and `id`.  The id
+    breaks ties between rows created at the same time, e.g. by `bulk_create`.
+    """
+    value = json.dumps([created_at.isoformat(), id]).encode()
+    return base64.urlsafe_b64encode(value).decode().rstrip("=")
+
+
+def decode_cursor(value: Optional[str]) -> Optional[Tuple[dt.datetime, int]]:
+    if not value:
+        return None
+
+    try:
+        created_at, id = json.loads(
+            base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        )
+        return dt.datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError) as error:
+        raise PydanticValueError("Invalid cursor", type="cursor") from error
+
+
+def validate_cursor(value: Optional[str]):
+    decode_cursor(value)
+    return value
+
+
+class CursorPagination(ResponseModel):
+    num_per_page: int
+    next: Optional[str]
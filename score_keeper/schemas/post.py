@@ -6,7 +6,14 @@ from typing_extensions import Annotated
 
 from score_keeper import enums
 
-from .helpers import NOTSET, BaseModel, parse_list, remove_queryset
+from .helpers import (
+    NOTSET,
+    BaseModel,
+    FieldsModel,
+    ResponseModel,
+    parse_list,
+    remove_queryset,
+)
 from .pagination import PageInfo, Pagination
 from .query import Query
 from .user import UserPublic
@@ -28,10 +35,14 @@ class PostPatch(BaseModel):
     status: STATUS_VALIDATOR = NOTSET
 
 
-class Post(BaseModel):
+class Post(FieldsModel):
+    field_sources = {"status": ("_status",), "author": ("author_id",)}
+    always_loaded = ("id", "author_id", "status")
+
     id: int
     title: str
     content: str
+    content_html: Optional[str]
     status: str
     created_at: datetime
     modified_at: datetime
@@ -70,16 +81,31 @@ class PostResolve(enums.EnumStr):
     AUTHOR = "author"
 
 
+class PostField(enums.EnumStr):
+    ID = "id"
+    TITLE = "title"
+    CONTENT = "content"
+    STATUS = "status"
+    CREATED_AT = "created_at"
+    MODIFIED_AT = "modified_at"
+    PUBLISHED_AT = "published_at"
+    VIEWED = "viewed"
+    AUTHOR_ID = "author_id"
+    AUTHOR = "author"
+
+
 class PostGetOptions(BaseModel):
     resolves: Optional[List[PostResolve]] = []
+    fields: Optional[List[PostField]] = []
 
-    _parse_list = field_validator("resolves", mode="before")(parse_list)
+    _parse_list = field_validator("resolves", "fields", mode="before")(parse_list)
 
 
 class PostQuery(BaseModel, Query):
     filters: List[PostFilter] = []
     sorts: List[PostSort] = [PostSort.ID_ASC]
     resolves: Optional[List[PostResolve]] = []
+    fields: Optional[List[PostField]] = []
 
 
 class PostQueryStringSort(enums.EnumStr):
@@ -101,10 +127,13 @@ class PostQueryString(BaseModel):
     pp: Optional[int] = 10
     p: Optional[int] = 1
     resolves: Optional[List[PostResolve]] = []
+    fields: Optional[List[PostField]] = []
 
-    _parse_list = field_validator("id__in", "resolves", mode="before")(parse_list)
+    _parse_list = field_validator("id__in", "resolves", "fields", mode="before")(
+        parse_list
+    )
 
-    def to_query(self, resolves=None):
+    def to_query(self, resolves=None, fields=None):
         filters = []
         if self.id__in:
             filters.append(PostFilter(field=PostFilterField.ID_IN, value=self.id__in))
@@ -118,19 +147,24 @@ class PostQueryString(BaseModel):
             )
 
         resolves = resolves or self.resolves
+        fields = self.fields if fields is None else fields
         sorts = self.sort.split("__")
         page_info = PageInfo(num_per_page=self.pp, current_page=self.p)
         return PostQuery(
-            filters=filters, sorts=sorts, resolves=resolves, page_info=page_info
+            filters=filters,
+            sorts=sorts,
+            resolves=resolves,
+            fields=fields,
+            page_info=page_info,
         )
 
 
-class PostResultSet(BaseModel):
+class PostResultSet(ResponseModel):
     pagination: Pagination
     posts: List[Post]
 
 
-class PostLike(BaseModel):
+class PostLike(ResponseModel):
     id: int
 
     post_id: int
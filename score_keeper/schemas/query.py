@@ -9,10 +9,15 @@ class Query:
     resolves: Any
     page_info: PageInfo
 
-    async def apply(self, queryset):
+    def filter(self, queryset):
         if self.filters:
             queryset = queryset.filter(**{x.field: x.value for x in self.filters})
 
+        return queryset
+
+    async def apply(self, queryset):
+        queryset = self.filter(queryset)
+
         if self.sorts:
             queryset = queryset.order_by(*self.sorts)
 
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import field_validator
+
+from score_keeper import enums
+
+from .helpers import BaseModel, ResponseModel, parse_list, remove_queryset
+from .team import Team
+
+
+class Standing(ResponseModel):
+    season: int
+    team_id: int
+    team: Optional[Team]
+
+    wins: int
+    losses: int
+    ties: int
+    points_for: int
+    points_against: int
+
+    modified_at: datetime
+
+    _remove_queryset = field_validator("team", mode="before")(remove_queryset)
+
+
+class StandingResolve(enums.EnumStr):
+    TEAM = "team"
+
+
+class StandingQueryString(BaseModel):
+    season: int
+    resolves: Optional[List[StandingResolve]] = []
+
+    _parse_list = field_validator("resolves", mode="before")(parse_list)
+
+
+class StandingResultSet(ResponseModel):
+    season: int
+    standings: List[Standing]
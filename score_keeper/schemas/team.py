@@ -1,15 +1,26 @@
 from datetime import datetime
 from typing import List, Optional, Union
 
-from pydantic import field_validator
+from pydantic import Field, field_validator
+from typing_extensions import Annotated
 
 from score_keeper import enums
 
-from .helpers import NOTSET, BaseModel, parse_list, remove_queryset
+from .helpers import (
+    NOTSET,
+    BaseModel,
+    FieldsModel,
+    ResponseModel,
+    parse_list,
+    remove_queryset,
+    validate_bulk,
+)
 from .pagination import PageInfo, Pagination
 from .query import Query
 from .user import UserPublic
 
+AUTOCOMPLETE_LIMIT_VALIDATOR = Annotated[int, Field(ge=1, le=50)]
+
 
 class TeamCreate(BaseModel):
     name: str
@@ -19,7 +30,26 @@ class TeamPatch(BaseModel):
     name: str = NOTSET
 
 
-class Team(BaseModel):
+class TeamBulkCreate(BaseModel):
+    teams: List[TeamCreate]
+
+    _validate_bulk = field_validator("teams")(validate_bulk)
+
+
+class TeamBulkPatchItem(TeamPatch):
+    id: int
+
+
+class TeamBulkPatch(BaseModel):
+    teams: List[TeamBulkPatchItem]
+
+    _validate_bulk = field_validator("teams")(validate_bulk)
+
+
+class Team(FieldsModel):
+    field_sources = {"created_by": ("created_by_id",)}
+    always_loaded = ("id", "created_by_id")
+
     id: int
     name: str
     created_at: datetime
@@ -31,6 +61,11 @@ class Team(BaseModel):
     _remove_queryset = field_validator("created_by", mode="before")(remove_queryset)
 
 
+class TeamOption(ResponseModel):
+    id: int
+    name: str
+
+
 class TeamFilterField(enums.EnumStr):
     ID_IN = "id__in"
 
@@ -53,16 +88,27 @@ class TeamResolve(enums.EnumStr):
     CREATED_BY = "created_by"
 
 
+class TeamField(enums.EnumStr):
+    ID = "id"
+    NAME = "name"
+    CREATED_AT = "created_at"
+    MODIFIED_AT = "modified_at"
+    CREATED_BY_ID = "created_by_id"
+    CREATED_BY = "created_by"
+
+
 class TeamGetOptions(BaseModel):
     resolves: Optional[List[TeamResolve]] = []
+    fields: Optional[List[TeamField]] = []
 
-    _parse_list = field_validator("resolves", mode="before")(parse_list)
+    _parse_list = field_validator("resolves", "fields", mode="before")(parse_list)
 
 
 class TeamQuery(BaseModel, Query):
     filters: List[TeamFilter] = []
     sorts: List[TeamSort] = [TeamSort.ID_ASC]
     resolves: Optional[List[TeamResolve]] = []
+    fields: Optional[List[TeamField]] = []
 
 
 class TeamQueryStringSort(enums.EnumStr):
@@ -80,22 +126,43 @@ class TeamQueryString(BaseModel):
     pp: Optional[int] = 10
     p: Optional[int] = 1
     resolves: Optional[List[TeamResolve]] = []
+    fields: Optional[List[TeamField]] = []
 
-    _parse_list = field_validator("id__in", "resolves", mode="before")(parse_list)
+    _parse_list = field_validator("id__in", "resolves", "fields", mode="before")(
+        parse_list
+    )
 
-    def to_query(self, resolves=None):
+    def to_query(self, resolves=None, fields=None):
         filters = []
         if self.id__in:
             filters.append(TeamFilter(field=TeamFilterField.ID_IN, value=self.id__in))
 
         resolves = resolves or self.resolves
+        fields = self.fields if fields is None else fields
         sorts = self.sort.split("__")
         page_info = PageInfo(num_per_page=self.pp, current_page=self.p)
         return TeamQuery(
-            filters=filters, sorts=sorts, resolves=resolves, page_info=page_info
+            filters=filters,
+            sorts=sorts,
+            resolves=resolves,
+            fields=fields,
+            page_info=page_info,
         )
 
 
-class TeamResultSet(BaseModel):
+class TeamResultSet(ResponseModel):
     pagination: Pagination
     teams: List[Team]
+
+
+class TeamBulkResult(ResponseModel):
+    teams: List[Team]
+
+
+class TeamAutocompleteQueryString(BaseModel):
+    q: str
+    limit: Optional[AUTOCOMPLETE_LIMIT_VALIDATOR] = 10
+
+
+class TeamOptionResultSet(ResponseModel):
+    teams: List[TeamOption]
@@ -5,7 +5,7 @@ from typing_extensions import Annotated
 
 from score_keeper import enums
 
-from .helpers import BaseModel, parse_list, remove_queryset
+from .helpers import BaseModel, ResponseModel, parse_list, remove_queryset
 from .pagination import PageInfo, Pagination
 from .query import Query
 from .user import UserPublic
@@ -18,7 +18,7 @@ class TokenCreate(BaseModel):
     name: NAME_VALIDATOR
 
 
-class TokenCreateSuccess(BaseModel):
+class TokenCreateSuccess(ResponseModel):
     id: int
     type: str
     name: str
@@ -30,7 +30,7 @@ class TokenPatch(BaseModel):
     name: NAME_VALIDATOR
 
 
-class Token(BaseModel):
+class Token(ResponseModel):
     id: int
     type: str
     name: str
@@ -97,6 +97,6 @@ class TokenQueryString(BaseModel):
         )
 
 
-class TokenResultSet(BaseModel):
+class TokenResultSet(ResponseModel):
     pagination: Pagination
     tokens: List[Token]
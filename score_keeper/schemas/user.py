@@ -7,7 +7,7 @@ from unique_names_generator.data import ADJECTIVES, ANIMALS
 
 from score_keeper import enums
 
-from .helpers import NOTSET, BaseModel, EmailStr, PasswordStr, parse_list
+from .helpers import NOTSET, BaseModel, EmailStr, PasswordStr, ResponseModel, parse_list
 from .pagination import PageInfo, Pagination
 from .query import Query
 
@@ -34,13 +34,13 @@ class UserPatch(BaseModel):
     picture: Optional[PICTURE_VALIDATOR] = NOTSET
 
 
-class UserPublic(BaseModel):
+class UserPublic(ResponseModel):
     id: int
     name: str
     picture: Optional[PICTURE_VALIDATOR]
 
 
-class User(BaseModel):
+class User(ResponseModel):
     id: int
     role: str
     name: str
@@ -148,6 +148,6 @@ class UserQueryString(BaseModel):
         )
 
 
-class UserResultSet(BaseModel):
+class UserResultSet(ResponseModel):
     pagination: Pagination
     users: List[User]
@@ -20,14 +20,89 @@ load_dotenv()
 SECRET_KEY = os.environ["SECRET_KEY"]
 UPLOADS_DEST = os.environ.get("UPLOADS_DEST", "tmp/uploads")
 
-DB_ENGINE = os.environ.get("DB_ENGINE", "tortoise.backends.asyncpg")
+DB_ENGINE = os.environ.get("DB_ENGINE", "score_keeper.lib.db_client")
 DB_NAME = os.environ["DB_NAME"]
 DB_HOST = os.environ["DB_HOST"]
 DB_PASSWORD = os.environ["DB_PASSWORD"]
 DB_USER = os.environ["DB_USER"]
 DB_PORT = os.environ.get("DB_PORT", -1)
 
+# connection pool of each database connection, see lib.db_client
+DB_POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN_SIZE", 1))
+DB_POOL_MAX_SIZE = int(os.environ.get("DB_POOL_MAX_SIZE", 5))
+# seconds to wait for a free connection, unset waits indefinitely
+DB_POOL_ACQUIRE_TIMEOUT = (
+    float(os.environ["DB_POOL_ACQUIRE_TIMEOUT"])
+    if os.environ.get("DB_POOL_ACQUIRE_TIMEOUT")
+    else None
+)
+DB_POOL_MAX_INACTIVE_LIFETIME = float(
+    os.environ.get("DB_POOL_MAX_INACTIVE_LIFETIME", 300)
+)
+DB_STATEMENT_CACHE_SIZE = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", 100))
+
+# optional read replica for actions decorated with lib.db_router.read_replica,
+# the other DB_READ_* settings default to the primary's
+DB_READ_HOST = os.environ.get("DB_READ_HOST")
+DB_READ_NAME = os.environ.get("DB_READ_NAME", DB_NAME)
+DB_READ_PASSWORD = os.environ.get("DB_READ_PASSWORD", DB_PASSWORD)
+DB_READ_USER = os.environ.get("DB_READ_USER", DB_USER)
+DB_READ_PORT = os.environ.get("DB_READ_PORT", DB_PORT)
+# seconds the replica may lag behind before reads go back to the primary
+DB_READ_MAX_LAG = float(os.environ.get("DB_READ_MAX_LAG", 5))
+DB_READ_CHECK_INTERVAL = float(os.environ.get("DB_READ_CHECK_INTERVAL", 1))
+
+REDIS_HOST = os.environ.get("REDIS_HOST", "redis")
+REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
+
+# post views are buffered in redis and written to the database in batches
+VIEW_FLUSH_INTERVAL = float(os.environ.get("VIEW_FLUSH_INTERVAL", 10))
+VIEW_BROADCAST_INTERVAL = float(os.environ.get("VIEW_BROADCAST_INTERVAL", 2))
+
+# eventscore is partitioned by month of created_at, partitions are created this
+# many months ahead and checked for every SCORE_PARTITION_CHECK_INTERVAL seconds
+SCORE_PARTITION_MONTHS_AHEAD = int(os.environ.get("SCORE_PARTITION_MONTHS_AHEAD", 3))
+SCORE_PARTITION_CHECK_INTERVAL = float(
+    os.environ.get("SCORE_PARTITION_CHECK_INTERVAL", 3600)
+)
+
+# seconds before the in-process team directory is reloaded even if no team change
+# was published
+TEAM_DIRECTORY_MAX_AGE = float(os.environ.get("TEAM_DIRECTORY_MAX_AGE", 300))
+
+# seconds a live event stays in the write-through event cache after its last write
+EVENT_CACHE_TTL = float(os.environ.get("EVENT_CACHE_TTL", 3600))
+
+# actions decorated with lib.cache.cached keep up to CACHE_MAX_ENTRIES results in
+# each process for CACHE_LOCAL_TTL seconds, in front of redis where they are kept
+# for CACHE_TTL seconds.  Redis keeps the generation of a namespace, replaced when it
+# is invalidated, for CACHE_GENERATION_TTL seconds after its last invalidation,
+# which must be longer than any entry is kept
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", 1000))
+CACHE_TTL = float(os.environ.get("CACHE_TTL", 300))
+CACHE_LOCAL_TTL = float(os.environ.get("CACHE_LOCAL_TTL", 30))
+CACHE_GENERATION_TTL = float(os.environ.get("CACHE_GENERATION_TTL", 86400))
+
+# seconds the pages of lib.page_cache.cache_page are cached for anonymous visitors
+PAGE_CACHE_TTL = float(os.environ.get("PAGE_CACHE_TTL", 10))
+
 STATIC_VERSION = os.environ.get("STATIC_VERSION")
+# where build-assets writes the hashed and compressed static files, default
+# score_keeper/static-build
+STATIC_BUILD_FOLDER = os.environ.get("STATIC_BUILD_FOLDER")
+
+# trust the models the API routes return, built from database rows without
+# validation, instead of validating them, see lib.serialization.validate_response;
+# on by default in production only
+TRUST_RESPONSE_MODELS = strtobool(
+    os.environ.get(
+        "TRUST_RESPONSE_MODELS", str(os.environ.get("QUART_ENV") == "production")
+    )
+)
+
+# name of a provider in lib.serialization.JSON_PROVIDERS, default orjson when it's
+# installed
+JSON_PROVIDER = os.environ.get("JSON_PROVIDER")
 
 QUART_AUTH_COOKIE_SECURE = strtobool(os.environ.get("QUART_AUTH_COOKIE_SECURE", "True"))
 QUART_SCHEMA_CONVERT_CASING = strtobool(
@@ -42,6 +117,28 @@ AUTH_LOGOUT_SUCCESS_ENDPOINT = os.environ.get(
 
 TORTOISE_ORM_DEBUG_QUERY = False
 
+# warn about requests running the same statement, with different values, at least
+# QUERY_REPEAT_THRESHOLD times, usually relations fetched once per row; 0 disables
+QUERY_REPEAT_THRESHOLD = int(os.environ.get("QUERY_REPEAT_THRESHOLD", 5))
+
+DB_POOL = {
+    "minsize": DB_POOL_MIN_SIZE,
+    "maxsize": DB_POOL_MAX_SIZE,
+    "max_inactive_connection_lifetime": DB_POOL_MAX_INACTIVE_LIFETIME,
+    "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+}
+# only the instrumented pool takes an acquire timeout, asyncpg's own would fail
+if DB_ENGINE == "score_keeper.lib.db_client":
+    DB_POOL["acquire_timeout"] = DB_POOL_ACQUIRE_TIMEOUT
+
+# token scrapers must send as "Authorization: Bearer <token>" to read /metrics,
+# unset leaves /metrics open
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
+# seconds between publications of each process's request metrics to redis, where
+# /metrics adds them up
+METRICS_PUBLISH_INTERVAL = float(os.environ.get("METRICS_PUBLISH_INTERVAL", 5))
+
 TORTOISE_ORM = {
     "connections": {
         "default": {
@@ -52,6 +149,7 @@ TORTOISE_ORM = {
                 "password": DB_PASSWORD,
                 "user": DB_USER,
                 "port": DB_PORT,
+                **DB_POOL,
             },
         }
     },
@@ -62,3 +160,17 @@ TORTOISE_ORM = {
         }
     },
 }
+
+if DB_READ_HOST:
+    TORTOISE_ORM["connections"]["replica"] = {
+        "engine": DB_ENGINE,
+        "credentials": {
+            "database": DB_READ_NAME,
+            "host": DB_READ_HOST,
+            "password": DB_READ_PASSWORD,
+            "user": DB_READ_USER,
+            "port": DB_READ_PORT,
+            **DB_POOL,
+        },
+    }
+    TORTOISE_ORM["routers"] = ["score_keeper.lib.db_router.Router"]
@@ -1,3 +1,12 @@
+/* An id for the websocket connections of this page, made here rather than in the
+   template since pages can be cached for everyone */
+function sessionId() {
+    if (window.crypto && crypto.randomUUID) {
+        return crypto.randomUUID();
+    }
+    return Date.now().toString(16) + Math.random().toString(16).slice(2);
+}
+
 function initWS(url, onmessageCallback) {
     var ws;
 
@@ -0,0 +1,51 @@
+import asyncio
+import os
+import socket
+
+import pytest
+
+# the defaults of docker-compose.yml, for running the tests against its services
+os.environ.setdefault("SECRET_KEY", "test secret key")
+os.environ.setdefault("DB_NAME", "postgres")
+os.environ.setdefault("DB_HOST", "localhost")
+os.environ.setdefault("DB_PASSWORD", "postgres")
+os.environ.setdefault("DB_USER", "postgres")
+os.environ.setdefault("DB_PORT", "5432")
+os.environ.setdefault("REDIS_HOST", "localhost")
+os.environ.setdefault("QUART_AUTH_COOKIE_SECURE", "False")
+
+
+def reachable(host, port):
+    try:
+        with socket.create_connection((host, int(port)), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+@pytest.fixture
+def app():
+    """
+    The app, for tests needing the migrated database and redis of
+    docker-compose.yml; skipped when they aren't running.
+    """
+    # pylint: disable=import-outside-toplevel
+    from score_keeper import settings
+    from score_keeper.application import create_app
+
+    # pylint: enable=import-outside-toplevel
+
+    if not reachable(settings.DB_HOST, settings.DB_PORT):
+        pytest.skip(f"no database at {settings.DB_HOST}:{settings.DB_PORT}")
+    if not reachable(settings.REDIS_HOST, settings.REDIS_PORT):
+        pytest.skip(f"no redis at {settings.REDIS_HOST}:{settings.REDIS_PORT}")
+
+    return create_app()
+
+
+@pytest.fixture
+def run():
+    """
+    Runs a coroutine to completion, the tests being plain functions.
+    """
+    return asyncio.run
@@ -0,0 +1,21 @@
+from score_keeper.lib.cache import Cache
+
+
+def test_generations_bounded():
+    cache = Cache(None, None, max_entries=2)
+    cache.set_generation("page:event:1", 1)
+    cache.set_generation("page:event:2", 1)
+    cache.set_generation("page:event:3", 1)
+
+    assert list(cache.generations) == ["page:event:2", "page:event:3"]
+
+
+def test_generation_reads_refresh_lru(run):
+    cache = Cache(None, None, max_entries=2)
+    cache.set_generation("team", 1)
+    cache.set_generation("page:event:1", 1)
+
+    assert run(cache.generation("team")) == 1
+    cache.set_generation("page:event:2", 1)
+
+    assert list(cache.generations) == ["team", "page:event:2"]
@@ -0,0 +1,23 @@
+from score_keeper import schemas
+from score_keeper.actions.event import score_args
+
+
+def args(data):
+    return (
+        score_args(data.away_delta, data.away_score, data.home_delta),
+        score_args(data.home_delta, data.home_score, data.away_delta),
+    )
+
+
+def test_delta_ignores_absolute_scores():
+    # what the event page and the ESP32 send from their possibly stale copy
+    data = schemas.EventScoreCreate(away_delta=1, away_score=4, home_score=2)
+
+    assert args(data) == ((1, None), (0, None))
+
+
+def test_absolute_scores_without_delta():
+    data = schemas.EventScoreCreate(away_score=4, home_score=2)
+
+    assert args(data) == ((0, 4), (0, 2))
+    assert args(schemas.EventScoreCreate()) == ((0, None), (0, None))
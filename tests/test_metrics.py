@@ -0,0 +1,43 @@
+from score_keeper.lib.metrics import merge_families, metric_family
+from score_keeper.lib.request_metrics import RequestMetrics
+from score_keeper.lib.single_flight import SingleFlight, groups
+
+
+def test_merge_families():
+    families = [
+        metric_family("requests", "counter", "Requests.", ['requests{worker="a"} 1']),
+        metric_family("in_flight", "gauge", "In flight.", []),
+        metric_family("requests", "counter", "Requests.", ['requests{worker="b"} 2']),
+    ]
+
+    assert merge_families(families) == [
+        "# HELP requests Requests.\n"
+        "# TYPE requests counter\n"
+        'requests{worker="a"} 1\n'
+        'requests{worker="b"} 2',
+        "# HELP in_flight In flight.\n# TYPE in_flight gauge",
+    ]
+
+
+def test_request_metrics_worker_label():
+    metrics = RequestMetrics(None)
+    metrics.observe_request("event.read", "GET", 200, 0.01, 100)
+
+    samples = "\n".join(metrics.families())
+    assert (
+        "http_request_duration_seconds_count{"
+        f'worker="{metrics.worker_id}",endpoint="event.read",method="GET",'
+        'status="200"} 1'
+    ) in samples
+
+
+def test_collectors_worker_label():
+    metrics = RequestMetrics(None)
+    group = SingleFlight("test")
+    group.count(False)
+
+    samples = "\n".join(metrics.families())
+    assert (
+        f'single_flight_calls_total{{worker="{metrics.worker_id}",group="test"}} 1'
+    ) in samples
+    groups.remove(group)
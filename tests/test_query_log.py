@@ -0,0 +1,104 @@
+import uuid
+
+import pytest
+
+from score_keeper import actions, enums, models, schemas
+from score_keeper.lib.db_client import (
+    InstrumentedAsyncpgDBClient,
+    InstrumentedConnection,
+)
+from score_keeper.lib.query_log import (
+    count_queries,
+    max_queries,
+    normalize,
+    record_query,
+)
+
+
+def test_normalize():
+    assert (
+        normalize("SELECT \"id\" FROM \"team\" WHERE \"id\" IN ($1, $2,$3) AND x='a'")
+        == "SELECT \"id\" FROM \"team\" WHERE \"id\" IN (?) AND x=?"
+    )
+
+
+def test_repeated():
+    with count_queries() as log:
+        for i in range(5):
+            with record_query(f"SELECT * FROM team WHERE id={i}"):
+                pass
+        with record_query("BEGIN"):
+            pass
+
+    assert log.count == 6
+    assert log.repeated(5) == [("SELECT * FROM team WHERE id=?", 5)]
+
+
+def test_max_queries():
+    with max_queries(1):
+        with record_query("SELECT 1"):
+            pass
+
+    with pytest.raises(AssertionError, match="2 queries run, expected at most 1"):
+        with max_queries(1):
+            with record_query("SELECT 1"):
+                pass
+            with record_query("SELECT 2"):
+                pass
+
+
+def test_client_connection_class():
+    # tortoise passes the client's connection class to the pool
+    assert InstrumentedAsyncpgDBClient.connection_class is InstrumentedConnection
+
+
+def test_event_list_queries(app, run):
+    async def test():
+        async with app.test_app() as test_app:
+            client = test_app.test_client()
+            user = await models.User.create(
+                email=f"test-{uuid.uuid4().hex[:8]}@example.com", name="test"
+            )
+            token = await actions.token.create(
+                schemas.User.from_db(user),
+                enums.TokenType.API,
+                schemas.TokenCreate(name="test"),
+            )
+            headers = {
+                "Authorization": "Bearer "
+                + app.extensions["QUART_AUTH"][0].dump_token(token.auth_id)
+            }
+            teams = [
+                await models.Team.create(name=f"test {i}", created_by=user)
+                for i in range(2)
+            ]
+            path = "/api/event?resolves=away_team,home_team"
+
+            async def create_event():
+                return await models.Event.create(
+                    season=0,
+                    created_by=user,
+                    home_team=teams[0],
+                    away_team=teams[1],
+                )
+
+            events = [await create_event()]
+            try:
+                with count_queries() as log:
+                    response = await client.get(path, headers=headers)
+                assert response.status_code == 200
+                assert log.count > 0
+
+                # the teams of more events are fetched with the same queries
+                events += [await create_event() for _ in range(9)]
+                with max_queries(log.count):
+                    response = await client.get(path, headers=headers)
+                assert response.status_code == 200
+            finally:
+                for event in events:
+                    await event.delete()
+                for team in teams:
+                    await team.delete()
+                await user.delete()
+
+    run(test())
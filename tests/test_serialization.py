@@ -0,0 +1,41 @@
+import datetime as dt
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from score_keeper import schemas
+from score_keeper.lib.serialization import revalidate
+
+NOW = dt.datetime(2026, 1, 1)
+
+
+def team_row(**values):
+    row = SimpleNamespace(
+        id=1, name="team", created_at=NOW, modified_at=NOW, created_by_id=1
+    )
+    row.__dict__.update(values)
+    return row
+
+
+def test_revalidate():
+    team = schemas.Team.from_db(team_row())
+
+    assert revalidate(team) == team
+    assert revalidate(schemas.TeamResultSet.model_construct(teams=[team])).teams == [
+        team
+    ]
+
+
+def test_revalidate_invalid():
+    # from_db trusts the row
+    team = schemas.Team.from_db(team_row(name=None))
+
+    with pytest.raises(ValidationError):
+        revalidate(team)
+
+
+def test_revalidate_fields():
+    team = schemas.Team.from_db(team_row(), fields=["name"])
+
+    assert revalidate(team).model_dump() == {"name": "team"}